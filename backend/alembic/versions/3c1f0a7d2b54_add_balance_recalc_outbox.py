@@ -0,0 +1,28 @@
+"""add_balance_recalc_outbox
+
+Revision ID: 3c1f0a7d2b54
+Revises: 9bfc4b6d88d6
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3c1f0a7d2b54'
+down_revision = '9bfc4b6d88d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'balance_recalc_outbox',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('requested_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('account_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('balance_recalc_outbox')
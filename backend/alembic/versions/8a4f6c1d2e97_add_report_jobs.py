@@ -0,0 +1,37 @@
+"""add_report_jobs
+
+Revision ID: 8a4f6c1d2e97
+Revises: 5e8c2b7a9f31
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '8a4f6c1d2e97'
+down_revision = '5e8c2b7a9f31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('params', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('result_path', sa.String(length=500), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_report_jobs_status', 'report_jobs', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_jobs_status', table_name='report_jobs')
+    op.drop_table('report_jobs')
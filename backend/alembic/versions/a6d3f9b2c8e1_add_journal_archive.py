@@ -0,0 +1,50 @@
+"""add_journal_archive
+
+Revision ID: a6d3f9b2c8e1
+Revises: f2a8d4c6b1e3
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a6d3f9b2c8e1'
+down_revision = 'f2a8d4c6b1e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'archived_journal_entries',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('description', sa.String(length=500), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'archived_journal_lines',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('entry_id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('debit', sa.BigInteger(), nullable=False),
+        sa.Column('credit', sa.BigInteger(), nullable=False),
+        sa.Column('entry_date', sa.Date(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['entry_id'], ['archived_journal_entries.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='RESTRICT'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_archived_journal_lines_entry_id'), 'archived_journal_lines', ['entry_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_archived_journal_lines_entry_id'), table_name='archived_journal_lines')
+    op.drop_table('archived_journal_lines')
+    op.drop_table('archived_journal_entries')
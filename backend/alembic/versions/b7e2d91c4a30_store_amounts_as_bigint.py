@@ -0,0 +1,43 @@
+"""store_amounts_as_bigint
+
+Revision ID: b7e2d91c4a30
+Revises: 3c1f0a7d2b54
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d91c4a30'
+down_revision = '3c1f0a7d2b54'
+branch_labels = None
+depends_on = None
+
+AMOUNT_COLUMNS = {
+    'journal_lines': ('debit', 'credit'),
+    'account_balances': ('total_debit', 'total_credit', 'balance'),
+}
+
+
+def upgrade() -> None:
+    # 원화 금액은 정수이므로 NUMERIC(15, 0) 대신 BIGINT로 저장
+    # SQLite does not support ALTER COLUMN, use batch mode to recreate table
+    for table_name, columns in AMOUNT_COLUMNS.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column,
+                           existing_type=sa.Numeric(precision=15, scale=0),
+                           type_=sa.BigInteger(),
+                           existing_nullable=False)
+
+
+def downgrade() -> None:
+    # SQLite does not support ALTER COLUMN, use batch mode to recreate table
+    for table_name, columns in AMOUNT_COLUMNS.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column,
+                           existing_type=sa.BigInteger(),
+                           type_=sa.Numeric(precision=15, scale=0),
+                           existing_nullable=False)
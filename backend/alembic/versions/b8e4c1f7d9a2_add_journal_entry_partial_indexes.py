@@ -0,0 +1,44 @@
+"""add_journal_entry_partial_indexes
+
+Revision ID: b8e4c1f7d9a2
+Revises: a6d3f9b2c8e1
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b8e4c1f7d9a2'
+down_revision = 'a6d3f9b2c8e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 삭제되지 않은 분개의 거래일/ID 순서 (목록·요약 최신순 페이지, 기간 집계)
+    op.create_index(
+        'ix_journal_entries_live_date_id',
+        'journal_entries',
+        ['date', 'id'],
+        unique=False,
+        sqlite_where=sa.text('is_deleted = 0'),
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+    # 삭제된 분개의 삭제 시각 순서 (보관 작업)
+    op.create_index(
+        'ix_journal_entries_deleted_updated_at',
+        'journal_entries',
+        ['updated_at'],
+        unique=False,
+        sqlite_where=sa.text('is_deleted = 1'),
+        postgresql_where=sa.text('is_deleted = true'),
+    )
+    # 선택도가 낮은 단독 인덱스는 두 부분 인덱스로 대체
+    op.drop_index(op.f('ix_journal_entries_is_deleted'), table_name='journal_entries')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_journal_entries_is_deleted'), 'journal_entries', ['is_deleted'], unique=False)
+    op.drop_index('ix_journal_entries_deleted_updated_at', table_name='journal_entries')
+    op.drop_index('ix_journal_entries_live_date_id', table_name='journal_entries')
@@ -0,0 +1,65 @@
+"""add_journal_line_running_balance
+
+Revision ID: c3e9a5b1f7d2
+Revises: 8a4f6c1d2e97
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c3e9a5b1f7d2'
+down_revision = '8a4f6c1d2e97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('journal_lines', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('entry_date', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('running_balance', sa.BigInteger(), nullable=True))
+        batch_op.create_index(
+            'ix_journal_lines_account_ledger',
+            ['account_id', 'entry_date', 'entry_id', 'id'],
+            unique=False,
+        )
+
+    # 거래일 복사본과 러닝 잔액 채우기 (삭제된 분개의 라인은 NULL)
+    op.execute(
+        sa.text(
+            """
+            UPDATE journal_lines
+            SET entry_date = (
+                SELECT je.date FROM journal_entries je WHERE je.id = journal_lines.entry_id
+            )
+            """
+        )
+    )
+    op.execute(
+        sa.text(
+            """
+            UPDATE journal_lines
+            SET running_balance = rb.running_balance
+            FROM (
+                SELECT
+                    jl.id,
+                    SUM(jl.debit - jl.credit) OVER (
+                        PARTITION BY jl.account_id
+                        ORDER BY jl.entry_date, jl.entry_id, jl.id
+                    ) AS running_balance
+                FROM journal_lines jl
+                JOIN journal_entries je ON je.id = jl.entry_id
+                WHERE je.is_deleted = FALSE
+            ) AS rb
+            WHERE rb.id = journal_lines.id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('journal_lines', schema=None) as batch_op:
+        batch_op.drop_index('ix_journal_lines_account_ledger')
+        batch_op.drop_column('running_balance')
+        batch_op.drop_column('entry_date')
@@ -0,0 +1,47 @@
+"""journal_ids_autoincrement
+
+Revision ID: c3f7a9e2b5d1
+Revises: b8e4c1f7d9a2
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c3f7a9e2b5d1'
+down_revision = 'b8e4c1f7d9a2'
+branch_labels = None
+depends_on = None
+
+# (운영 테이블, 같은 ID를 쓰는 보관 테이블)
+_TABLES = (
+    ('journal_entries', 'archived_journal_entries'),
+    ('journal_lines', 'archived_journal_lines'),
+)
+
+
+def upgrade() -> None:
+    # PostgreSQL 시퀀스는 ID를 재사용하지 않으므로 SQLite만 AUTOINCREMENT 테이블로 다시 만듦
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, archive in _TABLES:
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+            pass
+        # 이미 재사용되어 보관 테이블과 겹칠 수 있는 구간을 건너뛰도록 두 테이블의 최대 ID부터 발급
+        op.execute(sa.text('DELETE FROM sqlite_sequence WHERE name = :table').bindparams(table=table))
+        op.execute(
+            sa.text(
+                f'INSERT INTO sqlite_sequence (name, seq) '
+                f'SELECT :table, MAX(COALESCE((SELECT MAX(id) FROM {table}), 0), '
+                f'COALESCE((SELECT MAX(id) FROM {archive}), 0))'
+            ).bindparams(table=table)
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, _ in reversed(_TABLES):
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': False}):
+            pass
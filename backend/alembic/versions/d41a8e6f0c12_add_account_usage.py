@@ -0,0 +1,52 @@
+"""add_account_usage
+
+Revision ID: d41a8e6f0c12
+Revises: b7e2d91c4a30
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd41a8e6f0c12'
+down_revision = 'b7e2d91c4a30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'account_usage',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('line_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('first_posted_on', sa.Date(), nullable=True),
+        sa.Column('last_posted_on', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('account_id')
+    )
+
+    # 초기 사용 현황 채우기 (삭제되지 않은 분개만 집계)
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO account_usage (account_id, line_count, first_posted_on, last_posted_on, updated_at)
+            SELECT
+                a.id,
+                COUNT(je.id),
+                MIN(je.date),
+                MAX(je.date),
+                CURRENT_TIMESTAMP
+            FROM accounts a
+            LEFT JOIN journal_lines jl ON jl.account_id = a.id
+            LEFT JOIN journal_entries je
+                ON je.id = jl.entry_id AND (je.is_deleted = 0 OR je.is_deleted IS NULL)
+            GROUP BY a.id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('account_usage')
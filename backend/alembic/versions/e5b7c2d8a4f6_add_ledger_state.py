@@ -0,0 +1,29 @@
+"""add_ledger_state
+
+Revision ID: e5b7c2d8a4f6
+Revises: c3e9a5b1f7d2
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e5b7c2d8a4f6'
+down_revision = 'c3e9a5b1f7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ledger_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(sa.text("INSERT INTO ledger_state (id, version) VALUES (1, 0)"))
+
+
+def downgrade() -> None:
+    op.drop_table('ledger_state')
@@ -0,0 +1,37 @@
+"""add_ledger_changes
+
+Revision ID: f2a8d4c6b1e3
+Revises: e5b7c2d8a4f6
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f2a8d4c6b1e3'
+down_revision = 'e5b7c2d8a4f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('ledger_state', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+
+    op.create_table(
+        'ledger_changes',
+        sa.Column('seq', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('event_type', sa.String(length=40), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('ledger_version', sa.BigInteger(), nullable=True),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('seq'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ledger_changes')
+    with op.batch_alter_table('ledger_state', schema=None) as batch_op:
+        batch_op.drop_column('change_seq')
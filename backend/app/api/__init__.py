@@ -1,8 +1,19 @@
-from . import account_router, general_ledger_router, journal_router, trial_balance_router
+from . import (
+    account_router,
+    change_router,
+    event_router,
+    general_ledger_router,
+    journal_router,
+    report_job_router,
+    trial_balance_router,
+)
 
 __all__ = [
     "account_router",
+    "change_router",
+    "event_router",
     "general_ledger_router",
     "journal_router",
+    "report_job_router",
     "trial_balance_router",
 ]
@@ -0,0 +1,29 @@
+"""
+변경 로그(Ledger Change) API Router
+
+캐시·스냅샷·외부 미러가 마지막으로 처리한 순번 이후의 변경만 받아 따라올 수 있습니다.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.schemas.change_schema import LedgerChangeListResponse
+from app.services.change_log_service import ChangeLogService
+
+router = APIRouter(prefix="/api/v1/changes", tags=["changes"])
+
+
+@router.get("", response_model=LedgerChangeListResponse)
+def list_changes(
+    since: int = Query(0, ge=0, description="이 순번 이후의 변경 (처음이면 0)"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 건수"),
+    db: Session = Depends(get_db),
+):
+    """
+    변경 로그 조회
+
+    - 순번(seq)은 커밋 순서와 같으므로 next_since를 다음 요청의 since로 넘기면 빠짐없이 이어 받음
+    - has_more=true이면 바로 다음 페이지를 요청
+    """
+    service = ChangeLogService(db)
+    return service.list_changes(since, limit)
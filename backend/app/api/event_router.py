@@ -0,0 +1,93 @@
+"""
+원장 변경 이벤트(Server-Sent Events) API Router
+
+분개/계정 변경을 커밋 직후 text/event-stream으로 전달합니다.
+클라이언트는 이벤트의 계정 ID·거래일·원장 버전으로 필요한 화면만 다시 조회합니다.
+"""
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Header, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.core.config import get_settings
+from app.core.database import session_scope
+from app.repositories.ledger_change_repo import LedgerChangeRepository
+from app.services.ledger_events import RESYNC, LedgerEvent, Subscription, ledger_events
+
+router = APIRouter(prefix="/api/v1/events", tags=["events"])
+
+# 연결이 끊겼을 때 브라우저 EventSource의 재연결 대기 시간(ms)
+_RETRY_MS = 3000
+# 재연결 시 변경 로그에서 다시 보내는 최대 건수 (넘으면 resync)
+_REPLAY_LIMIT = 1000
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    last_event_id: int | None = Header(None, description="재연결 시 마지막으로 받은 이벤트 id"),
+):
+    """
+    원장 변경 이벤트 스트림 (SSE)
+
+    - journal_entry.created | updated | deleted:
+      entry_id, account_ids, dates, ledger_version
+    - account.created | updated: account_id, code, is_active
+    - resync: 전달이 밀려 이벤트가 버려졌음 (전체 다시 조회)
+
+    이벤트 id는 변경 로그 순번입니다. 재연결 시 Last-Event-ID 이후의 변경을 로그에서 먼저 보내고
+    실시간 이벤트를 이어서 보내며, 일정 간격으로 keep-alive 주석을 보냅니다.
+    스트림은 오래 열려 있으므로 DB 세션은 로그를 읽는 동안에만 사용하고 스트리밍 전에 닫습니다.
+    """
+    # 구독을 먼저 등록한 뒤 로그를 읽어 그 사이에 커밋된 변경을 놓치지 않음 (겹치는 것은 건너뜀)
+    subscription = ledger_events.subscribe()
+    replay: list[LedgerEvent] = []
+    if last_event_id is not None:
+        try:
+            replay = await run_in_threadpool(_replay_since, last_event_id)
+        except Exception:
+            ledger_events.unsubscribe(subscription)
+            raise
+    return StreamingResponse(
+        _event_stream(request, subscription, get_settings().event_stream_heartbeat, replay),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _replay_since(last_event_id: int) -> list[LedgerEvent]:
+    """Last-Event-ID 이후의 변경 로그를 짧은 세션으로 읽어 이벤트로 변환"""
+    with session_scope() as db:
+        changes = LedgerChangeRepository(db).list_since(last_event_id, _REPLAY_LIMIT + 1)
+        replay = [LedgerEvent.from_change(change) for change in changes[:_REPLAY_LIMIT]]
+    if len(changes) > _REPLAY_LIMIT:
+        replay.append(LedgerEvent(id=replay[-1].id, type=RESYNC, data={}))
+    return replay
+
+
+async def _event_stream(
+    request: Request,
+    subscription: Subscription,
+    heartbeat: float,
+    replay: list[LedgerEvent] | None = None,
+) -> AsyncIterator[str]:
+    try:
+        yield f"retry: {_RETRY_MS}\n\n"
+        last_id = 0
+        for item in replay or ():
+            yield item.encode()
+            last_id = item.id
+        while not await request.is_disconnected():
+            try:
+                item = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if item.type != RESYNC and item.id <= last_id:
+                # 로그에서 이미 보낸 변경
+                continue
+            yield item.encode()
+    finally:
+        ledger_events.unsubscribe(subscription)
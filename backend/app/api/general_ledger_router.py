@@ -16,7 +16,15 @@ def get_general_ledger(
     from_date: date = Query(..., alias="from", description="시작일 (YYYY-MM-DD)"),
     to_date: date = Query(..., alias="to", description="종료일 (YYYY-MM-DD)"),
     search: str | None = Query(None, description="전표 ID 또는 적요 검색"),
+    limit: int | None = Query(None, ge=1, le=500, description="페이지당 행 수 (미지정 시 전체)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db),
 ):
+    """
+    계정별 원장 조회
+
+    - limit 지정 시 원장 순서로 limit건씩 응답하고 next_cursor로 다음 페이지 조회
+    - page_opening_balance: 페이지 첫 행 직전 누적 잔액
+    """
     service = GeneralLedgerService(db)
-    return service.get_general_ledger(account_id, from_date, to_date, search)
+    return service.get_general_ledger(account_id, from_date, to_date, search, limit, cursor)
@@ -5,17 +5,21 @@
 """
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.database import get_db
 from app.schemas.journal_schema import (
+    ArchivedJournalEntryRead,
     JournalEntryCreate,
     JournalEntryRead,
     JournalEntryUpdate,
     JournalEntrySummary,
     JournalEntryDeleteResponse
 )
+from app.services.journal_archive_service import JournalArchiveService
+from app.services.journal_group_commit import journal_committer
 from app.services.journal_service import JournalService
 
 
@@ -58,6 +62,18 @@ def list_entries_summary(
     return service.get_summary_list(from_date=from_date, to_date=to_date, limit=limit)
 
 
+@router.get("/archived/{entry_id}", response_model=ArchivedJournalEntryRead)
+def get_archived_entry(entry_id: int, db: Session = Depends(get_db)):
+    """
+    보관 분개 조회
+
+    - 삭제 후 보관 기간이 지나 보관 테이블로 옮겨진 분개를 원래 ID로 조회
+    - 분개 라인 포함
+    """
+    service = JournalArchiveService(db)
+    return service.get_archived_entry(entry_id)
+
+
 @router.get("/{entry_id}", response_model=JournalEntryRead)
 def get_entry(entry_id: int, db: Session = Depends(get_db)):
     """
@@ -71,7 +87,20 @@ def get_entry(entry_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("", response_model=JournalEntryRead, status_code=status.HTTP_201_CREATED)
-def create_entry(payload: JournalEntryCreate, db: Session = Depends(get_db)):
+def create_entry(
+    payload: JournalEntryCreate,
+    read_your_writes: bool = Query(
+        False,
+        description="백그라운드 잔액 재계산 모드에서도 응답 전에 잔액을 재계산",
+    ),
+    idempotency_key: str | None = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="재시도 시 중복 생성을 막기 위한 클라이언트 키",
+    ),
+    db: Session = Depends(get_db),
+):
     """
     분개 생성
 
@@ -88,29 +117,61 @@ def create_entry(payload: JournalEntryCreate, db: Session = Depends(get_db)):
         - 각 라인은 debit 또는 credit 중 하나만 입력
         - 전체 라인의 차변 합계 = 대변 합계
         - 계정이 존재해야 하며 활성 상태여야 함
+
+    Query Parameters:
+        - read_your_writes: true면 잔액 요약을 요청 트랜잭션 안에서 즉시 갱신
+
+    Headers:
+        - Idempotency-Key: 같은 키로 재시도하면 분개를 다시 만들지 않고 최초 응답을 반환
+          (보관 기간 IDEMPOTENCY_KEY_TTL, 같은 키에 다른 본문이면 422)
+
+    JOURNAL_WRITE_MODE=group이면 동시 요청을 모아 한 트랜잭션으로 커밋합니다.
+    (작성기가 실행 중이 아니면 요청 트랜잭션에서 바로 커밋, GROUP_COMMIT_TIMEOUT 초과 시 503)
     """
+    settings = get_settings()
+    if settings.journal_write_mode == "group" and journal_committer.is_running:
+        # 그룹 커밋 작성기가 다른 요청과 함께 한 트랜잭션으로 커밋
+        return journal_committer.create_entry(
+            payload, read_your_writes, idempotency_key, timeout=settings.group_commit_timeout
+        )
+
     service = JournalService(db)
-    return service.create_entry(payload)
+    return service.create_entry(
+        payload,
+        read_your_writes=read_your_writes,
+        idempotency_key=idempotency_key,
+    )
 
 
 @router.put("/{entry_id}", response_model=JournalEntryRead)
 def update_entry(
     entry_id: int,
     payload: JournalEntryUpdate,
+    read_your_writes: bool = Query(
+        False,
+        description="백그라운드 잔액 재계산 모드에서도 응답 전에 잔액을 재계산",
+    ),
     db: Session = Depends(get_db)
 ):
     """
     분개 수정
 
     - 생성과 동일한 검증 규칙 적용
-    - 기존 라인들은 삭제되고 새 라인으로 대체됨
+    - 변경된 라인만 수정되며, 빠진 라인은 삭제되고 추가된 라인만 생성됨
     """
     service = JournalService(db)
-    return service.update_entry(entry_id, payload)
+    return service.update_entry(entry_id, payload, read_your_writes=read_your_writes)
 
 
 @router.delete("/{entry_id}", response_model=JournalEntryDeleteResponse)
-def delete_entry(entry_id: int, db: Session = Depends(get_db)):
+def delete_entry(
+    entry_id: int,
+    read_your_writes: bool = Query(
+        False,
+        description="백그라운드 잔액 재계산 모드에서도 응답 전에 잔액을 재계산",
+    ),
+    db: Session = Depends(get_db),
+):
     """
     분개 삭제 (soft-delete)
 
@@ -118,7 +179,7 @@ def delete_entry(entry_id: int, db: Session = Depends(get_db)):
     - 삭제된 분개는 목록 조회 및 시산표에서 제외됨
     """
     service = JournalService(db)
-    entry = service.delete_entry(entry_id)
+    entry = service.delete_entry(entry_id, read_your_writes=read_your_writes)
 
     return JournalEntryDeleteResponse(
         message="Journal entry deleted successfully",
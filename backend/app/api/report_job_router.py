@@ -0,0 +1,59 @@
+"""
+리포트 작업(Report Job) API Router
+
+오래 걸리는 리포트를 비동기 작업으로 제출하고, 상태를 조회한 뒤 결과를 내려받습니다.
+"""
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.schemas.report_job_schema import ReportJobCreate, ReportJobRead
+from app.services.report_job_service import ReportJobService
+
+
+router = APIRouter(prefix="/api/v1/report-jobs", tags=["report-jobs"])
+
+
+@router.post("", response_model=ReportJobRead, status_code=status.HTTP_202_ACCEPTED)
+def submit_report_job(payload: ReportJobCreate, db: Session = Depends(get_db)):
+    """
+    리포트 작업 제출
+
+    Request Body:
+        - kind: TRIAL_BALANCE | GENERAL_LEDGER | JOURNAL_EXPORT
+        - from, to: 조회 기간 (YYYY-MM-DD)
+        - account_id: 계정 ID (GENERAL_LEDGER 필수)
+        - search: 적요/전표 ID 검색 (GENERAL_LEDGER 선택)
+
+    작업 ID를 즉시 반환하며, 실제 계산은 워커 풀에서 수행됩니다.
+    """
+    service = ReportJobService(db)
+    return service.submit(payload)
+
+
+@router.get("/{job_id}", response_model=ReportJobRead)
+def get_report_job(job_id: str, db: Session = Depends(get_db)):
+    """
+    리포트 작업 상태 조회
+
+    - status: PENDING → RUNNING → SUCCEEDED | FAILED
+    - SUCCEEDED이면 download_url로 결과를 받을 수 있음
+    """
+    service = ReportJobService(db)
+    return service.get_job(job_id)
+
+
+@router.get("/{job_id}/download")
+def download_report(job_id: str, db: Session = Depends(get_db)):
+    """
+    리포트 결과 다운로드
+
+    - TRIAL_BALANCE / GENERAL_LEDGER: 조회 API와 같은 형식의 JSON
+    - JOURNAL_EXPORT: CSV
+    - 완료되지 않은 작업은 409 REPORT_NOT_READY
+    """
+    service = ReportJobService(db)
+    job, path, content_type = service.get_result(job_id)
+    filename = f"{job.kind.lower()}_{job.params['from']}_{job.params['to']}{path.suffix}"
+    return FileResponse(path, media_type=content_type, filename=filename)
@@ -9,8 +9,10 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.schemas.trial_balance_schema import TrialBalanceResponse
+from app.models.account import AccountType
+from app.schemas.trial_balance_schema import TrialBalanceRecentResponse, TrialBalanceResponse
 from app.services.trial_balance_service import TrialBalanceService
+from app.services.trial_balance_types import TrialBalanceFilter
 
 
 router = APIRouter(prefix="/api/v1/trial-balance", tags=["trial-balance"])
@@ -20,6 +22,12 @@ router = APIRouter(prefix="/api/v1/trial-balance", tags=["trial-balance"])
 def get_trial_balance(
     from_date: date = Query(..., alias="from", description="시작일 (YYYY-MM-DD)"),
     to_date: date = Query(..., alias="to", description="종료일 (YYYY-MM-DD)"),
+    include_recent: bool = Query(False, description="계정별 최근 거래(recent_entries) 포함 여부"),
+    account_type: AccountType | None = Query(None, alias="type", description="계정 타입"),
+    code_from: str | None = Query(None, description="시작 계정 코드 (포함)"),
+    code_to: str | None = Query(None, description="종료 계정 코드 (포함)"),
+    account_ids: list[int] | None = Query(None, description="계정 ID (반복 지정)"),
+    hide_zero: bool = Query(False, description="기말 잔액이 0인 행 제외"),
     db: Session = Depends(get_db),
 ):
     """
@@ -28,6 +36,12 @@ def get_trial_balance(
     Query Parameters:
         - from: 시작일 (YYYY-MM-DD, 필수)
         - to: 종료일 (YYYY-MM-DD, 필수)
+        - include_recent: 계정별 최근 거래 포함 여부 (기본 false,
+          상세 펼침은 /trial-balance/{account_id}/recent 사용)
+        - type: 계정 타입 (ASSET, LIABILITY, EQUITY, REVENUE, EXPENSE)
+        - code_from, code_to: 계정 코드 범위 (양끝 포함)
+        - account_ids: 계정 ID 목록 (account_ids=1&account_ids=2)
+        - hide_zero: 기말 잔액이 0인 행 제외 (기본 false)
 
     Response:
         - period: 조회 기간
@@ -53,5 +67,33 @@ def get_trial_balance(
     Example:
         GET /api/v1/trial-balance?from=2025-01-01&to=2025-01-31
     """
+    filters = TrialBalanceFilter(
+        type=account_type,
+        code_from=code_from,
+        code_to=code_to,
+        account_ids=tuple(sorted(set(account_ids))) if account_ids else None,
+        hide_zero=hide_zero,
+    )
     service = TrialBalanceService(db)
-    return service.get_trial_balance(from_date, to_date)
+    return service.get_trial_balance(from_date, to_date, include_recent, filters)
+
+
+@router.get("/{account_id}/recent", response_model=TrialBalanceRecentResponse)
+def get_recent_entries(
+    account_id: int,
+    limit: int = Query(5, ge=1, le=100, description="최대 거래 수"),
+    from_date: date | None = Query(None, alias="from", description="시작일 (YYYY-MM-DD)"),
+    to_date: date | None = Query(None, alias="to", description="종료일 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+):
+    """
+    계정별 최근 거래 조회
+
+    시산표 행을 펼칠 때 해당 계정의 최근 거래만 따로 조회합니다.
+    계정 원장 인덱스를 역순으로 읽어 limit건에서 멈춥니다.
+
+    Example:
+        GET /api/v1/trial-balance/1/recent?limit=5&from=2025-01-01&to=2025-01-31
+    """
+    service = TrialBalanceService(db)
+    return service.get_recent_entries(account_id, limit, from_date, to_date)
@@ -0,0 +1,50 @@
+"""
+삭제 분개 보관 CLI
+
+실행:
+    python -m app.archive_journal_entries                     # 보관 기간: JOURNAL_ARCHIVE_RETENTION_DAYS (기본 90일)
+    python -m app.archive_journal_entries --retention-days 30 --batch-size 500
+    python -m app.archive_journal_entries --max-batches 10    # 10배치만 옮기고 종료
+
+soft-delete 후 보관 기간이 지난 분개를 archived_journal_entries / archived_journal_lines로 옮깁니다.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.core.database import SessionLocal
+from app.services.journal_archive_service import JournalArchiveService
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="삭제된 분개를 보관 테이블로 이동")
+    parser.add_argument("--retention-days", type=int, default=None, help="삭제 후 운영 테이블에 남겨 둘 기간(일)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 트랜잭션에서 옮길 분개 수")
+    parser.add_argument("--max-batches", type=int, default=None, help="이번 실행의 최대 배치 수")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        report = JournalArchiveService(session).archive_deleted(
+            retention_days=args.retention_days,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+        )
+
+    print(
+        f"{report.deleted_before:%Y-%m-%d %H:%M} 이전 삭제 분개 {report.entries}건 "
+        f"(라인 {report.lines}건)을 {report.batches}배치로 옮겼습니다. "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,32 @@ class Settings(BaseModel):
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///ledger.db")
     database_echo: bool = os.getenv("DB_ECHO", "0") == "1"
     auto_create_tables: bool = os.getenv("AUTO_CREATE_TABLES", "0") == "1"
+    # 잔액 재계산 방식: "sync"(요청 트랜잭션 내) 또는 "background"(아웃박스 + 워커)
+    balance_recalc_mode: str = os.getenv("BALANCE_RECALC_MODE", "sync")
+    balance_worker_interval: float = float(os.getenv("BALANCE_WORKER_INTERVAL", "1.0"))
+    # 분개 생성 방식: "direct"(요청마다 커밋) 또는 "group"(작성기 스레드가 모아서 한 번에 커밋)
+    journal_write_mode: str = os.getenv("JOURNAL_WRITE_MODE", "direct")
+    group_commit_max_batch: int = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "100"))
+    group_commit_max_wait_ms: float = float(os.getenv("GROUP_COMMIT_MAX_WAIT_MS", "5"))
+    # 그룹 커밋 결과를 기다리는 최대 시간(초) - 넘으면 503
+    group_commit_timeout: float = float(os.getenv("GROUP_COMMIT_TIMEOUT", "10"))
+    # 시산표 집계 엔진: "sql" 또는 "numpy"(인메모리 열 엔진, numpy 필요)
+    # numpy 엔진이 켜지면 BALANCE_INDEX 설정과 무관하게 잔액 인덱스를 쓰지 않고 열 엔진으로 집계
+    trial_balance_engine: str = os.getenv("TRIAL_BALANCE_ENGINE", "sql")
+    # 계정별 시점 잔액 인덱스(Fenwick tree) 사용 여부 - 끄면 기초/기간 합계를 SQL로 집계
+    # (TRIAL_BALANCE_ENGINE=numpy이면 무시됨)
+    balance_index_enabled: bool = os.getenv("BALANCE_INDEX", "1") == "1"
+    # 잔액 인덱스가 뒤처졌을 때 백그라운드 재구성 사이의 최소 간격(초) - 그동안은 SQL로 집계
+    balance_index_rebuild_interval: float = float(os.getenv("BALANCE_INDEX_REBUILD_INTERVAL", "5"))
+    # 리포트 작업 워커 수와 결과 파일 저장 위치
+    report_worker_concurrency: int = int(os.getenv("REPORT_WORKER_CONCURRENCY", "2"))
+    report_storage_dir: str = os.getenv("REPORT_STORAGE_DIR", "reports")
+    # Idempotency-Key 응답 보관 기간(초)
+    idempotency_key_ttl: int = int(os.getenv("IDEMPOTENCY_KEY_TTL", "86400"))
+    # 변경 이벤트 스트림(SSE) 연결 유지용 주석 전송 간격(초)
+    event_stream_heartbeat: float = float(os.getenv("EVENT_STREAM_HEARTBEAT", "15"))
+    # soft-delete된 분개를 보관 테이블로 옮기기 전 운영 테이블에 남겨 두는 기간(일)
+    journal_archive_retention_days: int = int(os.getenv("JOURNAL_ARCHIVE_RETENTION_DAYS", "90"))
     cors_origins: list[str] = [
         origin.strip()
         for origin in os.getenv(
@@ -1,8 +1,9 @@
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
 
 from app.core.config import get_settings
 
@@ -13,7 +14,30 @@ class Base(DeclarativeBase):
 
 settings = get_settings()
 engine = create_engine(settings.database_url, echo=settings.database_echo, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    """
+    파일 SQLite 연결을 WAL 모드로 엽니다.
+
+    기본 롤백 저널에서는 read_snapshot()의 읽기 트랜잭션이 리포트가 끝날 때까지 SHARED 잠금을
+    잡아, 그동안 다른 연결의 쓰기 커밋이 busy timeout 후 "database is locked"로 실패합니다.
+    WAL에서는 읽기 스냅샷과 쓰기 커밋이 서로 막지 않습니다.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    finally:
+        cursor.close()
+
+
+if engine.dialect.name == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+    # 인메모리 DB는 WAL을 지원하지 않음 (연결 하나뿐이라 잠금 경합도 없음)
+    event.listen(engine, "connect", _enable_sqlite_wal)
+# 커밋 후에도 객체 상태를 유지해 응답 직렬화 시 재조회(SELECT)가 발생하지 않도록 합니다.
+SessionLocal = sessionmaker(
+    bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+)
 
 
 def get_db() -> Generator:
@@ -35,3 +59,64 @@ def session_scope():
         raise
     finally:
         session.close()
+
+
+# read_snapshot()이 연 스냅샷 안인지 (중첩 호출은 바깥 스냅샷 사용)
+_SNAPSHOT_KEY = "read_snapshot"
+
+
+@contextmanager
+def read_snapshot(db: Session):
+    """
+    여러 쿼리로 이루어진 리포트를 하나의 읽기 스냅샷에서 실행합니다.
+
+    - SQLite: BEGIN DEFERRED로 읽기 트랜잭션을 열어 첫 SELECT 시점의 데이터를 끝까지 봅니다.
+      파일 DB는 WAL 모드로 열리므로(_enable_sqlite_wal) 스냅샷이 열려 있는 동안에도 쓰기는 커밋됩니다.
+      이미 쓰기 트랜잭션 중이면 DB 쓰기 잠금을 가진 그 트랜잭션이 곧 스냅샷이므로 그대로 사용합니다.
+    - PostgreSQL: REPEATABLE READ 트랜잭션으로 첫 쿼리 시점의 스냅샷을 고정합니다.
+      격리 수준은 트랜잭션 시작 전에만 바꿀 수 있으므로, 세션이 이미(READ COMMITTED로)
+      트랜잭션을 시작했으면 RuntimeError를 냅니다. 호출자는 스냅샷을 첫 쿼리보다 먼저 열거나
+      그 전에 commit/rollback해야 합니다.
+
+    블록이 끝나면 읽기 트랜잭션을 롤백해 스냅샷(잠금)을 반납합니다.
+    read_snapshot 안에서 다시 호출하면 바깥 스냅샷을 그대로 사용합니다.
+    """
+    if db.info.get(_SNAPSHOT_KEY):
+        yield
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        if db.in_transaction():
+            raise RuntimeError(
+                "read_snapshot()은 트랜잭션 시작 전에 열어야 합니다. "
+                "(이미 시작된 트랜잭션의 격리 수준은 REPEATABLE READ로 바꿀 수 없음)"
+            )
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    elif dialect == "sqlite":
+        # pysqlite는 SELECT 전에 BEGIN을 보내지 않으므로 드라이버 수준 트랜잭션 여부로 판단
+        if db.connection().connection.dbapi_connection.in_transaction:
+            yield
+            return
+        db.execute(text("BEGIN DEFERRED"))
+    else:
+        yield
+        return
+
+    db.info[_SNAPSHOT_KEY] = True
+    try:
+        yield
+    finally:
+        db.info.pop(_SNAPSHOT_KEY, None)
+        db.rollback()
+
+
+def dialect_insert(db: Session, model):
+    """
+    ON CONFLICT 절을 지원하는 방언별 INSERT 구문 생성
+
+    SQLite/PostgreSQL 모두 `on_conflict_do_update` / `on_conflict_do_nothing`을 제공합니다.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
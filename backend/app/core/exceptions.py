@@ -92,6 +92,15 @@ def internal_error(
     )
 
 
+def service_unavailable(
+    code: str,
+    message: str,
+    details: dict[str, Any] | None = None
+) -> HTTPException:
+    """503 Service Unavailable 에러 생성"""
+    return build_error(code, message, status.HTTP_503_SERVICE_UNAVAILABLE, details)
+
+
 def with_transaction(func: Callable[..., T]) -> Callable[..., T]:
     """
     트랜잭션 관리 데코레이터
@@ -0,0 +1,65 @@
+"""
+Single-flight 요청 병합
+
+같은 키로 동시에 들어온 호출은 먼저 시작된 계산 하나를 함께 기다리고 그 결과(또는 예외)를
+공유합니다. 결과를 캐시하지는 않으므로 계산이 끝난 뒤 들어온 호출은 새로 계산합니다.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    키별 진행 중 계산 병합기 (스레드 안전)
+
+    사용 예:
+        _flight = SingleFlight()
+        result = _flight.do(("trial-balance", from_date, to_date), compute)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        key에 대한 계산이 진행 중이면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+
+        Args:
+            key: 병합 기준 키 (요청 파라미터 조합)
+            fn: 실제 계산 함수
+
+        Returns:
+            계산 결과 (동시 호출자 모두 같은 객체를 받음)
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def in_flight(self) -> int:
+        """진행 중인 계산 수"""
+        with self._lock:
+            return len(self._in_flight)
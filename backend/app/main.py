@@ -3,13 +3,29 @@
 
 FastAPI 기반 회계 시스템 백엔드 애플리케이션
 """
+from datetime import datetime
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app import models  # noqa: F401  # 모델 메타데이터 로드용
-from app.api import account_router, general_ledger_router, journal_router, trial_balance_router
+from app.api import (
+    account_router,
+    change_router,
+    event_router,
+    general_ledger_router,
+    journal_router,
+    report_job_router,
+    trial_balance_router,
+)
 from app.core.config import get_settings
-from app.core.database import Base, engine
+from app.core.database import Base, engine, session_scope
+from app.repositories.balance_index import balance_index
+from app.repositories.idempotency_repo import IdempotencyRepository
+from app.repositories.trial_balance_repo import balance_index_enabled
+from app.services.balance_recalc_worker import balance_worker
+from app.services.journal_group_commit import journal_committer
+from app.services.report_worker import report_worker
 
 settings = get_settings()
 
@@ -23,6 +39,7 @@ app = FastAPI(
     * **계정과목 관리**: 자산, 부채, 자본, 수익, 비용 계정 CRUD
     * **분개 입력**: 복식부기 원칙(차변=대변)을 준수하는 분개 관리
     * **시산표 조회**: 기초 잔액 + 기중 변동 + 기말 잔액 방식(B 방식)
+    * **리포트 작업**: 대용량 시산표/원장/분개 내보내기를 비동기로 생성 후 다운로드
 
     ### 설계 원칙
     * 차변 합계 = 대변 합계 검증
@@ -51,12 +68,40 @@ def startup_event():
     애플리케이션 시작 시 실행
 
     - auto_create_tables=True인 경우 자동으로 테이블 생성
+    - balance_recalc_mode=background인 경우 잔액 재계산 워커 시작
+    - journal_write_mode=group인 경우 분개 그룹 커밋 작성기 시작
+    - 만료된 Idempotency-Key 정리
+    - 잔액 인덱스를 쓰는 경우(BALANCE_INDEX=1, numpy 엔진 아님) 계정별 시점 잔액 인덱스 구성
+    - 리포트 작업 워커 풀 시작 (끝나지 않은 작업 재제출)
     """
     if settings.auto_create_tables:
         print("📊 데이터베이스 테이블 자동 생성 중...")
         Base.metadata.create_all(bind=engine)
         print("✅ 테이블 생성 완료")
 
+    with session_scope() as session:
+        IdempotencyRepository(session).purge_expired(datetime.utcnow())
+        # 인덱스 구성은 새 읽기 스냅샷에서 실행하므로 정리 작업을 먼저 커밋
+        session.commit()
+        if balance_index_enabled():
+            balance_index.rebuild(session)
+
+    if settings.balance_recalc_mode == "background":
+        balance_worker.start()
+
+    if settings.journal_write_mode == "group":
+        journal_committer.start()
+
+    report_worker.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """애플리케이션 종료 시 백그라운드 워커 정리"""
+    journal_committer.stop()
+    balance_worker.stop()
+    report_worker.stop()
+
 
 @app.get("/", tags=["health"])
 def root():
@@ -79,6 +124,9 @@ app.include_router(account_router.router)
 app.include_router(journal_router.router)
 app.include_router(general_ledger_router.router)
 app.include_router(trial_balance_router.router)
+app.include_router(report_job_router.router)
+app.include_router(event_router.router)
+app.include_router(change_router.router)
 
 print("=" * 60)
 print("🚀 미니 장부 API 서버가 시작되었습니다!")
@@ -1,6 +1,30 @@
 from .account import Account, AccountType
 from .account_balance import AccountBalance
+from .account_usage import AccountUsage
+from .archived_journal_entry import ArchivedJournalEntry
+from .archived_journal_line import ArchivedJournalLine
+from .balance_recalc_outbox import BalanceRecalcOutbox
+from .idempotency_key import IdempotencyKey
 from .journal_entry import JournalEntry
 from .journal_line import JournalLine
+from .ledger_change import LedgerChange
+from .ledger_state import LedgerState
+from .report_job import ReportJob, ReportJobKind, ReportJobStatus
 
-__all__ = ["Account", "AccountType", "AccountBalance", "JournalEntry", "JournalLine"]
+__all__ = [
+    "Account",
+    "AccountType",
+    "AccountBalance",
+    "AccountUsage",
+    "ArchivedJournalEntry",
+    "ArchivedJournalLine",
+    "BalanceRecalcOutbox",
+    "IdempotencyKey",
+    "JournalEntry",
+    "JournalLine",
+    "LedgerChange",
+    "LedgerState",
+    "ReportJob",
+    "ReportJobKind",
+    "ReportJobStatus",
+]
@@ -17,6 +17,7 @@ from app.core.database import Base
 
 if TYPE_CHECKING:
     from .account_balance import AccountBalance
+    from .account_usage import AccountUsage
 
 
 class AccountType(str, Enum):
@@ -53,6 +54,8 @@ class Account(Base):
 
     Relationships:
         journal_lines: 이 계정을 사용하는 분개 라인들 (1:N)
+        balance_summary: 계정 잔액 요약 (1:1)
+        usage: 계정 사용 현황 요약 (1:1)
         children: 하위 계정들 (계정 트리 구조용)
     """
 
@@ -95,6 +98,13 @@ class Account(Base):
         single_parent=True,
         uselist=False,
     )
+    usage: Mapped[Optional["AccountUsage"]] = relationship(
+        "AccountUsage",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        single_parent=True,
+        uselist=False,
+    )
 
     # 계정 계층 구조 (self-referential)
     children: Mapped[list["Account"]] = relationship(
@@ -6,13 +6,13 @@
 from __future__ import annotations
 
 from datetime import datetime
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy import DateTime, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.models.types import Amount
 
 if TYPE_CHECKING:
     from .account import Account
@@ -28,19 +28,19 @@ class AccountBalance(Base):
         ForeignKey("accounts.id", ondelete="CASCADE"),
         primary_key=True,
     )
-    total_debit: Mapped[Decimal] = mapped_column(
-        Numeric(15, 0),
-        default=Decimal("0"),
+    total_debit: Mapped[int] = mapped_column(
+        Amount(),
+        default=0,
         nullable=False,
     )
-    total_credit: Mapped[Decimal] = mapped_column(
-        Numeric(15, 0),
-        default=Decimal("0"),
+    total_credit: Mapped[int] = mapped_column(
+        Amount(),
+        default=0,
         nullable=False,
     )
-    balance: Mapped[Decimal] = mapped_column(
-        Numeric(15, 0),
-        default=Decimal("0"),
+    balance: Mapped[int] = mapped_column(
+        Amount(),
+        default=0,
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,49 @@
+"""
+계정 사용 현황(Account Usage) 모델
+
+계정별 분개 라인 수와 최초/최종 거래일 요약 정보를 저장합니다.
+account_balances와 같은 시점에 재계산됩니다.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+if TYPE_CHECKING:
+    from .account import Account
+
+
+class AccountUsage(Base):
+    """계정 사용 현황 요약 테이블 (삭제되지 않은 분개 기준)"""
+
+    __tablename__ = "account_usage"
+
+    account_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    line_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    first_posted_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    last_posted_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+    )
+
+    account: Mapped["Account"] = relationship(
+        "Account",
+        back_populates="usage",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AccountUsage(account_id={self.account_id}, lines={self.line_count}, "
+            f"first={self.first_posted_on}, last={self.last_posted_on})>"
+        )
@@ -0,0 +1,50 @@
+"""
+보관 분개(Archived Journal Entry) 모델
+
+soft-delete 후 보관 기간이 지난 분개를 journal_entries에서 옮겨 두는 테이블입니다.
+집계 쿼리는 이 테이블을 읽지 않으므로 운영 테이블과 인덱스가 삭제된 행만큼 작아지고,
+보관된 분개는 ID로 계속 조회할 수 있습니다. (GET /api/v1/journal-entries/archived/{id})
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+
+class ArchivedJournalEntry(Base):
+    """
+    보관 분개 헤더 모델
+
+    Attributes:
+        id: 원래 분개 ID (PK, journal_entries.id를 그대로 사용)
+        date: 거래 발생일
+        description: 적요/메모
+        created_at: 원래 생성 시간
+        deleted_at: 삭제 시간 (삭제 당시 journal_entries.updated_at)
+        archived_at: 보관 테이블로 옮긴 시간
+
+    Relationships:
+        lines: 보관된 분개 라인들 (1:N)
+    """
+    __tablename__ = "archived_journal_entries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    description: Mapped[str] = mapped_column(String(500), nullable=False, default="")
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    lines: Mapped[list["ArchivedJournalLine"]] = relationship(
+        "ArchivedJournalLine",
+        back_populates="entry",
+        cascade="all, delete-orphan",
+        order_by="ArchivedJournalLine.id",
+    )
+
+    def __repr__(self) -> str:
+        return f"<ArchivedJournalEntry(id={self.id}, date={self.date}, archived_at={self.archived_at})>"
@@ -0,0 +1,52 @@
+"""
+보관 분개 라인(Archived Journal Line) 모델
+
+보관 분개(archived_journal_entries)에 속한 라인입니다. 원래 라인 ID를 그대로 사용합니다.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+from app.models.types import Amount
+
+
+class ArchivedJournalLine(Base):
+    """
+    보관 분개 라인 모델
+
+    Attributes:
+        id: 원래 라인 ID (PK)
+        entry_id: 보관 분개 ID (FK, ON DELETE CASCADE)
+        account_id: 계정 ID (FK, ON DELETE RESTRICT - 운영 테이블과 같은 규칙)
+        debit: 차변 금액
+        credit: 대변 금액
+        entry_date: 분개 거래일
+        created_at: 원래 생성 시간
+    """
+    __tablename__ = "archived_journal_lines"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    entry_id: Mapped[int] = mapped_column(
+        ForeignKey("archived_journal_entries.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    account_id: Mapped[int] = mapped_column(
+        ForeignKey("accounts.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+    debit: Mapped[int] = mapped_column(Amount(), nullable=False)
+    credit: Mapped[int] = mapped_column(Amount(), nullable=False)
+    entry_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    entry: Mapped["ArchivedJournalEntry"] = relationship("ArchivedJournalEntry", back_populates="lines")
+
+    def __repr__(self) -> str:
+        amount = self.debit if self.debit > 0 else self.credit
+        side = "Dr" if self.debit > 0 else "Cr"
+        return f"<ArchivedJournalLine(account_id={self.account_id}, {side}: {amount})>"
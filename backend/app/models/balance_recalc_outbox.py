@@ -0,0 +1,34 @@
+"""
+잔액 재계산 아웃박스(Balance Recalc Outbox) 모델
+
+백그라운드 모드에서 재계산이 필요한 계정을 분개와 같은 트랜잭션에 기록합니다.
+계정 ID가 PK이므로 같은 계정에 대한 여러 요청은 한 행으로 합쳐집니다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class BalanceRecalcOutbox(Base):
+    """
+    잔액 재계산 대기열
+
+    Attributes:
+        account_id: 재계산할 계정 ID (PK - 계정별 요청 병합)
+        requested_at: 마지막 요청 시각 (처리 중 들어온 재요청 판별용)
+    """
+
+    __tablename__ = "balance_recalc_outbox"
+
+    account_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    requested_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<BalanceRecalcOutbox(account_id={self.account_id}, requested_at={self.requested_at})>"
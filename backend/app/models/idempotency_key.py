@@ -0,0 +1,42 @@
+"""
+멱등성 키(Idempotency Key) 모델
+
+`Idempotency-Key` 헤더로 들어온 분개 생성 요청의 최초 응답을 보관합니다.
+같은 키로 재시도하면 검증/저장/잔액 재계산 없이 저장된 응답을 그대로 반환합니다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    멱등성 키 저장 테이블
+
+    Attributes:
+        key: 클라이언트가 보낸 Idempotency-Key (PK - 한 번의 인덱스 조회로 재시도 판별)
+        request_hash: 요청 본문의 SHA-256 (같은 키로 다른 요청을 보냈는지 확인)
+        status_code: 최초 응답 상태 코드
+        response_body: 최초 응답 본문 (JSON)
+        expires_at: 만료 시각 (이후에는 새 요청으로 처리되고 정리 대상이 됨)
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int] = mapped_column(Integer, nullable=False)
+    response_body: Mapped[Any] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyKey(key={self.key!r}, expires_at={self.expires_at})>"
@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from datetime import datetime, date
-from sqlalchemy import Boolean, Date, DateTime, Integer, String
+from sqlalchemy import Boolean, Date, DateTime, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -36,14 +36,33 @@ class JournalEntry(Base):
         - 삭제는 soft-delete 방식으로 처리 (is_deleted=True)
     """
     __tablename__ = "journal_entries"
+    __table_args__ = (
+        # 삭제되지 않은 분개의 거래일/ID 순서 (부분 인덱스)
+        # 목록·요약의 최신순 페이지와 기간 집계의 거래일 범위 조회가 삭제된 행을 건너뛰지 않고 읽음
+        Index(
+            "ix_journal_entries_live_date_id",
+            "date", "id",
+            sqlite_where=text("is_deleted = 0"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 삭제된 분개의 삭제 시각 순서 (부분 인덱스, 보관 작업의 대상 조회)
+        Index(
+            "ix_journal_entries_deleted_updated_at",
+            "updated_at",
+            sqlite_where=text("is_deleted = 1"),
+            postgresql_where=text("is_deleted = true"),
+        ),
+        # SQLite도 삭제된 최대 ID를 다시 쓰지 않도록 (보관 테이블로 옮긴 분개 ID와 겹치지 않게)
+        {"sqlite_autoincrement": True},
+    )
 
     # 기본 필드
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     description: Mapped[str] = mapped_column(String(500), nullable=False, default="")
 
-    # soft-delete 플래그
-    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    # soft-delete 플래그 (선택도가 낮아 단독 인덱스 대신 위의 부분 인덱스로 조회)
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
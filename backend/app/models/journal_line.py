@@ -6,12 +6,12 @@
 """
 from __future__ import annotations
 
-from datetime import datetime
-from decimal import Decimal
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, Numeric
+from datetime import date, datetime
+from sqlalchemy import CheckConstraint, Date, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.models.types import Amount
 
 
 class JournalLine(Base):
@@ -22,8 +22,11 @@ class JournalLine(Base):
         id: 라인 고유 ID (PK)
         entry_id: 분개 ID (FK, ON DELETE CASCADE)
         account_id: 계정 ID (FK, ON DELETE RESTRICT - 사용 중인 계정 삭제 방지)
-        debit: 차변 금액 (NUMERIC(15,0), >= 0, 정수만)
-        credit: 대변 금액 (NUMERIC(15,0), >= 0, 정수만)
+        debit: 차변 금액 (BIGINT, >= 0, 정수만)
+        credit: 대변 금액 (BIGINT, >= 0, 정수만)
+        entry_date: 분개 거래일 (원장 정렬/키셋 페이지용 비정규화 복사본)
+        running_balance: 계정별 러닝 잔액 (거래일, 분개 ID, 라인 ID 순 누적 차변 - 대변,
+                         삭제된 분개의 라인은 NULL)
         created_at: 생성 시간
 
     Constraints:
@@ -49,6 +52,13 @@ class JournalLine(Base):
             "(debit > 0 AND credit = 0) OR (credit > 0 AND debit = 0)",
             name="ck_journal_line_single_side"
         ),
+        # 계정별 원장 순서 (기초 잔액 조회와 키셋 페이지 범위 조회)
+        Index(
+            "ix_journal_lines_account_ledger",
+            "account_id", "entry_date", "entry_id", "id",
+        ),
+        # SQLite도 삭제된 최대 ID를 다시 쓰지 않도록 (보관 테이블로 옮긴 라인 ID와 겹치지 않게)
+        {"sqlite_autoincrement": True},
     )
 
     # 기본 필드
@@ -64,18 +74,22 @@ class JournalLine(Base):
         index=True
     )
 
-    # 금액 필드 - NUMERIC(15, 0): 최대 999,999,999,999,999 (원화는 정수 단위)
-    debit: Mapped[Decimal] = mapped_column(
-        Numeric(15, 0),
-        default=Decimal("0"),
+    # 금액 필드 - BIGINT (원화는 정수 단위, 파이썬에서는 int)
+    debit: Mapped[int] = mapped_column(
+        Amount(),
+        default=0,
         nullable=False
     )
-    credit: Mapped[Decimal] = mapped_column(
-        Numeric(15, 0),
-        default=Decimal("0"),
+    credit: Mapped[int] = mapped_column(
+        Amount(),
+        default=0,
         nullable=False
     )
 
+    # 원장 순서와 러닝 잔액 (RunningBalanceRepository가 유지)
+    entry_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    running_balance: Mapped[int | None] = mapped_column(Amount(), nullable=True)
+
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -0,0 +1,44 @@
+"""
+변경 로그(Ledger Change) 모델
+
+분개/계정 변경을 쓰기 트랜잭션 안에서 한 행씩 추가하는 append-only 로그입니다.
+캐시·스냅샷·외부 미러는 마지막으로 처리한 순번 이후만 읽어 따라올 수 있습니다.
+(GET /api/v1/changes?since=순번, SSE 재연결 시 Last-Event-ID 재전송)
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, BigInteger, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class LedgerChange(Base):
+    """
+    변경 로그 테이블 (추가만 하고 수정/삭제하지 않음)
+
+    Attributes:
+        seq: 변경 순번 (PK, ledger_state.change_seq에서 발급 - 커밋 순서와 같음)
+        event_type: 변경 종류 (journal_entry.created, account.updated 등 SSE 이벤트와 동일)
+        entity_id: 분개 ID 또는 계정 ID
+        ledger_version: 분개 변경이면 그 변경으로 올라간 원장 버전 (계정 변경은 NULL)
+        payload: 변경 내용 (SSE 이벤트 data와 동일한 JSON)
+        created_at: 기록 시각
+    """
+
+    __tablename__ = "ledger_changes"
+
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    event_type: Mapped[str] = mapped_column(String(40), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    ledger_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<LedgerChange(seq={self.seq}, event_type={self.event_type!r}, entity_id={self.entity_id})>"
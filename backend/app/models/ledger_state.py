@@ -0,0 +1,40 @@
+"""
+원장 상태(Ledger State) 모델
+
+분개 생성/수정/삭제가 커밋될 때마다 1씩 증가하는 원장 버전을 보관하는 단일 행 테이블입니다.
+리포트는 읽기 스냅샷 안에서 이 값을 함께 읽어 "어느 시점의 원장으로 계산했는지"를 응답하고,
+인메모리 집계(시점 잔액 인덱스, 시산표 열 엔진)는 같은 버전일 때만 사용됩니다.
+
+변경 로그(ledger_changes)의 순번(change_seq)도 이 행에서 발급합니다. 행 잠금이 커밋까지
+유지되므로 순번은 커밋 순서와 같고, since=순번으로 따라오는 소비자가 늦게 커밋된 앞 순번을
+놓치지 않습니다.
+"""
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+# 단일 행의 고정 PK
+LEDGER_STATE_ID = 1
+
+
+class LedgerState(Base):
+    """
+    원장 상태 테이블 (단일 행)
+
+    Attributes:
+        id: 항상 1
+        version: 원장 버전 (분개 변경마다 증가, 쓰기 트랜잭션과 함께 커밋)
+        change_seq: 마지막으로 발급한 변경 로그 순번 (분개/계정 변경마다 증가)
+    """
+
+    __tablename__ = "ledger_state"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<LedgerState(version={self.version}, change_seq={self.change_seq})>"
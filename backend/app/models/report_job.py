@@ -0,0 +1,73 @@
+"""
+리포트 작업(Report Job) 모델
+
+오래 걸리는 리포트(연간 원장, 시산표, 분개 내보내기)를 요청 경로 밖에서 실행하기 위한
+작업 상태를 저장합니다. 완료된 결과는 로컬 디스크 파일로 보관합니다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ReportJobKind(str, Enum):
+    """
+    리포트 종류
+
+    - TRIAL_BALANCE: 시산표 (JSON)
+    - GENERAL_LEDGER: 계정별 원장 (JSON)
+    - JOURNAL_EXPORT: 기간 내 분개 라인 내보내기 (CSV)
+    """
+
+    TRIAL_BALANCE = "TRIAL_BALANCE"
+    GENERAL_LEDGER = "GENERAL_LEDGER"
+    JOURNAL_EXPORT = "JOURNAL_EXPORT"
+
+
+class ReportJobStatus(str, Enum):
+    """리포트 작업 상태 (PENDING → RUNNING → SUCCEEDED | FAILED)"""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class ReportJob(Base):
+    """
+    리포트 작업 모델
+
+    Attributes:
+        id: 작업 ID (UUID hex)
+        kind: 리포트 종류
+        params: 요청 파라미터 (기간, 계정 등)
+        status: 작업 상태
+        result_path: 완료된 결과 파일 경로
+        error: 실패 사유
+        created_at / started_at / finished_at: 작업 시각
+    """
+
+    __tablename__ = "report_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    kind: Mapped[ReportJobKind] = mapped_column(String(20), nullable=False)
+    params: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[ReportJobStatus] = mapped_column(
+        String(20), default=ReportJobStatus.PENDING, nullable=False, index=True
+    )
+    result_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ReportJob(id={self.id!r}, kind={self.kind}, status={self.status})>"
@@ -0,0 +1,33 @@
+"""
+공통 컬럼 타입
+
+금액(원화)은 정수 단위이므로 BIGINT로 저장하고 파이썬에서는 int로 다룹니다.
+"""
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class Amount(TypeDecorator):
+    """
+    원화 금액 컬럼 타입 (BIGINT)
+
+    - 저장: int / 정수 Decimal 모두 허용하여 int로 변환
+    - 조회: 항상 int 반환 (SUM 등 집계 결과 포함)
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: int | Decimal | None, dialect) -> int | None:
+        if value is None:
+            return None
+        return int(value)
+
+    def process_result_value(self, value, dialect) -> int | None:
+        if value is None:
+            return None
+        return int(value)
@@ -0,0 +1,49 @@
+"""
+계정 잔액 병렬 전체 재구성 CLI
+
+실행:
+    python -m app.rebuild_balances                     # CPU 수만큼 워커 프로세스 사용
+    python -m app.rebuild_balances --workers 4 --partitions 32
+    python -m app.rebuild_balances --workers 1         # 현재 프로세스에서 집계
+
+account_balances / account_usage와 라인별 러닝 잔액을 분개 라인으로부터 처음부터 다시 만들고
+처리량을 출력합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.core.database import SessionLocal
+from app.services.balance_rebuilder import BalanceRebuilder
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="account_balances / account_usage 병렬 전체 재구성")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--partitions", type=int, default=None, help="라인 ID 구간 수 (기본: 워커 수 x 4)")
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as session:
+        report = BalanceRebuilder(session, workers=args.workers, partitions=args.partitions).run()
+
+    print(
+        f"accounts={report.accounts} lines={report.lines} "
+        f"partitions={report.partitions} workers={report.workers}"
+    )
+    print(
+        f"scan={report.scan_seconds:.2f}s write={report.write_seconds:.2f}s "
+        f"total={report.elapsed:.2f}s ({report.lines_per_second:,.0f} lines/s)"
+    )
+    if report.reconciled_accounts:
+        print(f"재구성 중 변경된 계정 {report.reconciled_accounts}개를 다시 계산했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+계정과목 카탈로그 (프로세스 내 캐시)
+
+계정과목은 거의 바뀌지 않으므로 id → 기본 정보를 한 번만 읽어 메모리에 보관합니다.
+분개 검증, 일반원장, 시산표 행 구성에서 매번 accounts 테이블을 조회하지 않도록 합니다.
+
+AccountService의 쓰기 작업이 커밋되면 invalidate_on_commit()으로 바로 무효화되며,
+무효화될 때마다 version이 1씩 증가합니다.
+
+다른 워커 프로세스, seed_accounts/CLI, 직접 실행한 SQL의 변경도 반영되도록 accounts()는
+매번 DB 쪽 지문(계정 수, 최종 수정 시각 max(updated_at))을 한 번 조회해 캐시를 만들 때의
+지문과 다르면 다시 읽습니다. updated_at을 바꾸지 않는 직접 UPDATE는 감지하지 못하므로
+그런 변경 뒤에는 invalidate()를 호출하거나 updated_at도 함께 갱신해야 합니다.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+from datetime import datetime
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.models.account import Account, AccountType
+
+_INVALIDATE_KEY = "account_catalog_invalidate"
+
+# DB 쪽 계정 테이블 지문 (계정 수, 최종 수정 시각)
+Fingerprint = tuple[int, datetime | None]
+
+
+@dataclass(frozen=True)
+class CatalogAccount:
+    """카탈로그에 보관하는 계정 정보"""
+
+    id: int
+    code: str
+    name: str
+    type: AccountType
+    is_active: bool
+    parent_id: int | None
+
+
+class AccountCatalog:
+    """버전 관리되는 계정과목 캐시"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._accounts: dict[int, CatalogAccount] | None = None
+        self._fingerprint: Fingerprint | None = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def accounts(self, db: Session) -> dict[int, CatalogAccount]:
+        """
+        전체 계정 카탈로그 (code 순 정렬된 딕셔너리)
+
+        DB 지문을 먼저 조회해 캐시와 같으면 캐시를 반환하고, 캐시가 비었거나 다른 곳에서
+        계정이 바뀌었으면 전달받은 세션으로 다시 읽습니다.
+        """
+        fingerprint = self._read_fingerprint(db)
+        with self._lock:
+            if self._accounts is not None:
+                if self._fingerprint == fingerprint:
+                    return self._accounts
+                # 다른 프로세스/직접 SQL로 변경됨
+                self._accounts = None
+                self._version += 1
+            version = self._version
+
+        rows = (
+            db.query(
+                Account.id,
+                Account.code,
+                Account.name,
+                Account.type,
+                Account.is_active,
+                Account.parent_id,
+            )
+            .order_by(Account.code)
+            .all()
+        )
+        accounts = {
+            row.id: CatalogAccount(
+                id=row.id,
+                code=row.code,
+                name=row.name,
+                type=AccountType(row.type),
+                is_active=row.is_active,
+                parent_id=row.parent_id,
+            )
+            for row in rows
+        }
+
+        with self._lock:
+            # 조회 도중 무효화되었다면 오래된 결과를 캐시에 넣지 않음
+            if self._version == version:
+                self._accounts = accounts
+                # 조회 전에 읽은 지문이므로 그 사이 변경이 있으면 다음 호출에서 다시 읽음
+                self._fingerprint = fingerprint
+        return accounts
+
+    @staticmethod
+    def _read_fingerprint(db: Session) -> Fingerprint:
+        count, updated_at = db.execute(select(func.count(Account.id), func.max(Account.updated_at))).one()
+        return count, updated_at
+
+    def get(self, db: Session, account_id: int) -> CatalogAccount | None:
+        """계정 단건 조회"""
+        return self.accounts(db).get(account_id)
+
+    def active_accounts(self, db: Session) -> list[CatalogAccount]:
+        """활성 계정 목록 (code 순)"""
+        return [account for account in self.accounts(db).values() if account.is_active]
+
+    def invalidate(self) -> None:
+        """캐시를 비우고 버전을 올립니다."""
+        with self._lock:
+            self._accounts = None
+            self._fingerprint = None
+            self._version += 1
+
+    def invalidate_on_commit(self, db: Session) -> None:
+        """현재 트랜잭션이 커밋되면 캐시를 무효화하도록 예약합니다."""
+        db.info[_INVALIDATE_KEY] = True
+        # once=True 리스너는 같은 세션에서 한 번만 실행되므로 세션당 한 번 상시 등록
+        if not event.contains(db, "after_commit", self._after_commit):
+            event.listen(db, "after_commit", self._after_commit)
+
+    def _after_commit(self, session: Session) -> None:
+        if session.info.pop(_INVALIDATE_KEY, False):
+            self.invalidate()
+
+
+account_catalog = AccountCatalog()
@@ -3,10 +3,12 @@
 
 데이터베이스 접근 로직을 담당합니다.
 """
-from sqlalchemy import func
+from sqlalchemy import exists, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.models.account import Account
+from app.models.balance_recalc_outbox import BalanceRecalcOutbox
+from app.models.journal_entry import JournalEntry
 from app.models.journal_line import JournalLine
 from app.schemas.account_schema import AccountCreate, AccountUpdate
 
@@ -28,7 +30,8 @@ class AccountRepository:
             계정과목 목록 (code 순 정렬)
         """
         query = self.db.query(Account).options(
-            selectinload(Account.balance_summary)
+            selectinload(Account.balance_summary),
+            selectinload(Account.usage),
         )
 
         # 기본적으로 활성 계정만 조회
@@ -41,7 +44,10 @@ class AccountRepository:
         """ID로 계정 조회"""
         return (
             self.db.query(Account)
-            .options(selectinload(Account.balance_summary))
+            .options(
+                selectinload(Account.balance_summary),
+                selectinload(Account.usage),
+            )
             .filter(Account.id == account_id)
             .first()
         )
@@ -63,7 +69,6 @@ class AccountRepository:
         account = Account(**payload.model_dump())
         self.db.add(account)
         self.db.flush()
-        self.db.refresh(account)
         return account
 
     def update_account(self, account: Account, payload: AccountUpdate) -> Account:
@@ -82,7 +87,6 @@ class AccountRepository:
             setattr(account, key, value)
 
         self.db.flush()
-        self.db.refresh(account)
         return account
 
     def set_account_status(self, account: Account, is_active: bool) -> Account:
@@ -95,38 +99,25 @@ class AccountRepository:
         """
         account.is_active = is_active
         self.db.flush()
-        self.db.refresh(account)
         return account
 
-    def is_account_in_use(self, account_id: int) -> bool:
-        """
-        계정이 분개에서 사용 중인지 확인
-
-        Args:
-            account_id: 계정 ID
-
-        Returns:
-            사용 중이면 True
-        """
-        usage_count = (
-            self.db.query(func.count(JournalLine.id))
-            .filter(JournalLine.account_id == account_id)
-            .scalar()
+    def has_pending_recalculation(self, account_id: int) -> bool:
+        """백그라운드 재계산 대기열(아웃박스)에 남아 있는지 여부 - 요약 테이블이 아직 갱신 전"""
+        return bool(
+            self.db.scalar(
+                select(exists().where(BalanceRecalcOutbox.account_id == account_id))
+            )
         )
-        return usage_count > 0
 
-    def get_usage_count(self, account_id: int) -> int:
-        """
-        계정이 사용된 횟수 조회
-
-        Args:
-            account_id: 계정 ID
-
-        Returns:
-            사용 횟수
-        """
-        return (
-            self.db.query(func.count(JournalLine.id))
-            .filter(JournalLine.account_id == account_id)
-            .scalar()
+    def has_live_lines(self, account_id: int) -> bool:
+        """삭제되지 않은 분개에서 사용 중인지 여부 (EXISTS - 첫 라인에서 멈춤)"""
+        return bool(
+            self.db.scalar(
+                select(
+                    exists()
+                    .where(JournalLine.account_id == account_id)
+                    .where(JournalLine.entry_id == JournalEntry.id)
+                    .where(JournalEntry.is_deleted == False)
+                )
+            )
         )
@@ -0,0 +1,375 @@
+"""
+계정별 시점 잔액 인덱스 (Fenwick tree / Binary Indexed Tree)
+
+계정마다 거래일(ordinal) 구간 위에 (차변, 대변) 누적 트리를 메모리에 두고,
+"D일 기준 잔액"이나 기간 합계를 O(log 일수)로 계산합니다.
+
+    totals_before(D)   = prefix(D - 1)
+    range_totals(F, T) = prefix(T) - prefix(F - 1)
+
+시작 시 journal_lines를 (계정, 거래일)별로 집계해 한 번에 만들고,
+이후에는 JournalService가 알려 준 라인 증감분(생성 +, 삭제 -, 수정은 이전 -/이후 +)을
+커밋 직후에 트리에 더합니다. 트리 구간을 벗어난 거래일이 들어오면 해당 계정 트리만
+넓혀 다시 만듭니다.
+
+인덱스는 자신이 반영한 원장 버전(ledger_state.version)을 함께 기억합니다.
+- 구성은 읽기 스냅샷 하나에서 버전과 집계를 함께 읽으므로 정확히 그 버전의 상태가 됩니다.
+- 커밋 증감분은 그 트랜잭션이 올린 버전 구간과 함께 전달됩니다. 구성에 이미 포함된 버전은
+  건너뛰고, 앞 버전이 아직 반영되지 않았으면 순서가 맞을 때까지 보류했다가 차례로 더합니다.
+- 리포트가 스냅샷의 원장 버전을 넘기면 인덱스가 정확히 그 버전일 때만 결과를 돌려주고,
+  아니면 None을 돌려 호출자가 SQL 집계를 사용하게 합니다.
+- 구성 전이거나 뒤처져 있으면(다른 프로세스의 쓰기 등) 요청 안에서 다시 만들지 않고
+  백그라운드 스레드에서 다시 만듭니다. 재구성은 한 번에 하나만, 최소 간격
+  (BALANCE_INDEX_REBUILD_INTERVAL)을 두고 실행하며, 집계 SQL은 잠금 밖에서 수행한 뒤
+  완성된 트리만 잠금 안에서 교체하므로 조회를 막지 않습니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal, read_snapshot
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+from app.repositories.ledger_state_repo import LedgerStateRepository
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "balance_index_pending"
+
+# 트리를 넓힐 때 미래 방향으로 미리 확보할 일수
+_HEADROOM_DAYS = 366
+
+# (계정 ID, 거래일, 차변, 대변)
+Posting = tuple[int, date, int, int]
+
+
+class _FenwickTree:
+    """거래일 구간 [origin, origin + size) 위의 (차변, 대변) 누적 트리"""
+
+    __slots__ = ("origin", "size", "debit", "credit")
+
+    def __init__(self, origin: int, size: int, points: dict[int, tuple[int, int]] | None = None):
+        self.origin = origin
+        self.size = size
+        debit = [0] * (size + 1)
+        credit = [0] * (size + 1)
+        for day, (day_debit, day_credit) in (points or {}).items():
+            debit[day - origin + 1] += day_debit
+            credit[day - origin + 1] += day_credit
+        # O(n) 구성: 각 노드 값을 부모 노드에 한 번씩 더함
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                debit[parent] += debit[i]
+                credit[parent] += credit[i]
+        self.debit = debit
+        self.credit = credit
+
+    def covers(self, day: int) -> bool:
+        return self.origin <= day < self.origin + self.size
+
+    def add(self, day: int, debit: int, credit: int) -> None:
+        i = day - self.origin + 1
+        while i <= self.size:
+            self.debit[i] += debit
+            self.credit[i] += credit
+            i += i & -i
+
+    def prefix(self, day: int) -> tuple[int, int]:
+        """day(포함)까지의 (차변, 대변) 합계"""
+        i = min(day - self.origin + 1, self.size)
+        debit = credit = 0
+        while i > 0:
+            debit += self.debit[i]
+            credit += self.credit[i]
+            i -= i & -i
+        return debit, credit
+
+    def points(self) -> dict[int, tuple[int, int]]:
+        """거래일별 (차변, 대변) 값 복원 (트리를 넓힐 때만 사용)"""
+        points: dict[int, tuple[int, int]] = {}
+        previous = (0, 0)
+        for day in range(self.origin, self.origin + self.size):
+            current = self.prefix(day)
+            if current != previous:
+                points[day] = (current[0] - previous[0], current[1] - previous[1])
+            previous = current
+        return points
+
+    def widened(self, day: int) -> "_FenwickTree":
+        """day를 포함하도록 넓힌 새 트리"""
+        origin = min(self.origin, day)
+        end = max(self.origin + self.size, day + _HEADROOM_DAYS)
+        return _FenwickTree(origin, end - origin, self.points())
+
+
+class BalanceIndex:
+    """
+    계정별 시점 잔액 인덱스
+
+    - totals_before(): 기준일 이전(미포함) 계정별 (차변, 대변) 합계
+    - range_totals(): 기간 내 계정별 (차변, 대변) 합계
+    - track_commit(): 커밋 후 반영할 라인 증감분 예약
+    - rebuild(): 즉시 다시 구성 (시작 시), wait(): 진행 중인 백그라운드 재구성 대기
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._trees: dict[int, _FenwickTree] = {}
+        self._loaded = False
+        # 구성 중에는 구성 전이라도 커밋 증감분을 보류해 두었다가 교체 시 반영
+        self._building = 0
+        # 백그라운드 재구성 스레드와 마지막 시작 시각 (monotonic)
+        self._refresher: threading.Thread | None = None
+        self._last_refresh = 0.0
+        # 트리에 반영된 원장 버전과, 앞 버전을 기다리는 커밋 증감분 {시작 버전: (끝 버전, 증감분)}
+        self._version = 0
+        self._held: dict[int, tuple[int, dict]] = {}
+
+    @property
+    def version(self) -> int:
+        """트리에 반영된 원장 버전"""
+        return self._version
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def track_commit(self, db: Session, postings: Iterable[Posting], version: int) -> None:
+        """
+        현재 트랜잭션이 커밋되면 라인 증감분을 인덱스에 더하도록 예약합니다.
+
+        Args:
+            db: 쓰기 세션
+            postings: (계정 ID, 거래일, 차변, 대변) 증감분 (삭제/수정 전 라인은 음수)
+            version: 이 변경으로 올린 원장 버전
+        """
+        pending = db.info.get(_PENDING_KEY)
+        if pending is None:
+            pending = db.info[_PENDING_KEY] = {"low": version, "high": version, "deltas": {}}
+        pending["low"] = min(pending["low"], version)
+        pending["high"] = max(pending["high"], version)
+
+        deltas = pending["deltas"]
+        for account_id, entry_date, debit, credit in postings:
+            key = (account_id, entry_date.toordinal())
+            day_debit, day_credit = deltas.get(key, (0, 0))
+            deltas[key] = (day_debit + debit, day_credit + credit)
+
+        # once=True 리스너는 같은 세션에서 한 번만 실행되므로 세션당 한 번 상시 등록
+        if not event.contains(db, "after_commit", self._after_commit):
+            event.listen(db, "after_commit", self._after_commit)
+            event.listen(db, "after_rollback", self._after_rollback)
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending is None:
+            return
+        with self._lock:
+            if (not self._loaded and not self._building) or pending["high"] <= self._version:
+                # 아직 구성 전이거나 이미 구성에 포함된 변경
+                return
+            self._held[pending["low"]] = (pending["high"], pending["deltas"])
+            if self._loaded:
+                self._apply_held()
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+    def _apply_held(self) -> None:
+        """현재 버전 바로 다음부터 이어지는 보류 증감분을 차례로 반영"""
+        while self._version + 1 in self._held:
+            high, deltas = self._held.pop(self._version + 1)
+            for (account_id, day), (debit, credit) in deltas.items():
+                if debit or credit:
+                    self._add(account_id, day, debit, credit)
+            self._version = high
+
+    def invalidate(self) -> None:
+        """인덱스를 비우고 다음 조회 시 바로 백그라운드 재구성을 시작하도록 합니다."""
+        with self._lock:
+            self._loaded = False
+            self._trees = {}
+            self._held = {}
+            self._last_refresh = 0.0
+
+    # ------------------------------------------------------------------
+    # 구성
+    # ------------------------------------------------------------------
+    def rebuild(self, db: Session) -> None:
+        """journal_lines를 (계정, 거래일)별로 집계해 인덱스를 다시 만듭니다."""
+        with self._lock:
+            self._building += 1
+        try:
+            version, trees = self._build(db)
+        except Exception:
+            with self._lock:
+                self._building -= 1
+            raise
+        with self._lock:
+            self._building -= 1
+            self._swap(version, trees)
+
+    def wait(self, timeout: float | None = None) -> None:
+        """진행 중인 백그라운드 재구성이 끝날 때까지 기다립니다."""
+        refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout)
+
+    def _ready(self, version: int | None) -> bool:
+        """조회에 쓸 수 있는 상태인지 확인하고, 구성 전이거나 뒤처졌으면 재구성을 예약합니다."""
+        with self._lock:
+            behind = not self._loaded or (version is not None and version > self._version)
+        if behind:
+            self._schedule_rebuild()
+        return not behind
+
+    def _schedule_rebuild(self) -> None:
+        """진행 중인 재구성이 없고 최소 간격이 지났으면 백그라운드 재구성을 시작합니다."""
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            now = time.monotonic()
+            if self._last_refresh and now - self._last_refresh < get_settings().balance_index_rebuild_interval:
+                return
+            self._last_refresh = now
+            self._refresher = threading.Thread(
+                target=self._refresh, name="balance-index-rebuild", daemon=True
+            )
+            self._refresher.start()
+
+    def _refresh(self) -> None:
+        session = SessionLocal()
+        try:
+            self.rebuild(session)
+        except Exception:
+            logger.exception("잔액 인덱스 재구성 중 오류가 발생했습니다.")
+        finally:
+            session.close()
+
+    def _build(self, db: Session) -> tuple[int, dict[int, _FenwickTree]]:
+        """(원장 버전, 계정별 트리) 구성 - 잠금 없이 실행"""
+        # 원장 버전과 집계를 같은 스냅샷에서 읽음 (리포트 스냅샷 안이면 그대로 사용)
+        with read_snapshot(db):
+            version = LedgerStateRepository(db).current()
+            rows = (
+                db.query(
+                    JournalLine.account_id,
+                    JournalEntry.date,
+                    func.coalesce(func.sum(JournalLine.debit), 0),
+                    func.coalesce(func.sum(JournalLine.credit), 0),
+                )
+                .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+                .filter(JournalEntry.is_deleted == False)
+                .group_by(JournalLine.account_id, JournalEntry.date)
+                .all()
+            )
+
+        points: dict[int, dict[int, tuple[int, int]]] = {}
+        for account_id, entry_date, debit, credit in rows:
+            points.setdefault(account_id, {})[entry_date.toordinal()] = (debit, credit)
+
+        trees: dict[int, _FenwickTree] = {}
+        for account_id, account_points in points.items():
+            origin = min(account_points)
+            size = max(account_points) - origin + _HEADROOM_DAYS
+            trees[account_id] = _FenwickTree(origin, size, account_points)
+        return version, trees
+
+    def _swap(self, version: int, trees: dict[int, _FenwickTree]) -> None:
+        """구성 결과로 교체 (잠금 안에서 호출)"""
+        if self._loaded and version < self._version:
+            # 구성하는 동안 증감분으로 이미 더 최신이 됨
+            return
+        self._trees = trees
+        self._loaded = True
+        self._version = version
+        # 구성에 포함된 버전의 보류 증감분은 버리고, 이어지는 것은 바로 반영
+        self._held = {low: held for low, held in self._held.items() if held[0] > version}
+        self._apply_held()
+
+    def _add(self, account_id: int, day: int, debit: int, credit: int) -> None:
+        tree = self._trees.get(account_id)
+        if tree is None:
+            tree = self._trees[account_id] = _FenwickTree(day, _HEADROOM_DAYS)
+        elif not tree.covers(day):
+            tree = self._trees[account_id] = tree.widened(day)
+        tree.add(day, debit, credit)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def totals_before(
+        self,
+        db: Session,
+        account_ids: list[int],
+        before: date,
+        version: int | None = None,
+    ) -> dict[int, tuple[int, int]] | None:
+        """
+        기준일 이전(미포함) 계정별 (차변 합계, 대변 합계)
+
+        거래가 없는 계정은 결과에서 제외됩니다.
+        구성 전이거나, version(리포트 스냅샷의 원장 버전)을 주었는데 인덱스가 그 버전이 아니면
+        None을 반환합니다. (db는 인터페이스 호환용 - 인덱스는 조회 시 SQL을 실행하지 않음)
+        """
+        if not account_ids:
+            return {}
+        if not self._ready(version):
+            return None
+        day = before.toordinal() - 1
+        with self._lock:
+            if version is not None and version != self._version:
+                return None
+            return self._collect(account_ids, lambda tree: tree.prefix(day))
+
+    def range_totals(
+        self,
+        db: Session,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date,
+        version: int | None = None,
+    ) -> dict[int, tuple[int, int]] | None:
+        """
+        기간 내 계정별 (차변 합계, 대변 합계)
+
+        거래가 없는 계정은 결과에서 제외됩니다.
+        구성 전이거나 version을 주었는데 인덱스가 그 버전이 아니면 None을 반환합니다.
+        """
+        if not account_ids:
+            return {}
+        if not self._ready(version):
+            return None
+        start, end = from_date.toordinal() - 1, to_date.toordinal()
+
+        def period(tree: _FenwickTree) -> tuple[int, int]:
+            end_debit, end_credit = tree.prefix(end)
+            start_debit, start_credit = tree.prefix(start)
+            return end_debit - start_debit, end_credit - start_credit
+
+        with self._lock:
+            if version is not None and version != self._version:
+                return None
+            return self._collect(account_ids, period)
+
+    def _collect(self, account_ids, compute) -> dict[int, tuple[int, int]]:
+        totals: dict[int, tuple[int, int]] = {}
+        for account_id in account_ids:
+            tree = self._trees.get(account_id)
+            if tree is None:
+                continue
+            debit, credit = compute(tree)
+            if debit or credit:
+                totals[account_id] = (debit, credit)
+        return totals
+
+
+balance_index = BalanceIndex()
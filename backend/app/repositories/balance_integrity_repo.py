@@ -0,0 +1,150 @@
+"""
+잔액 무결성 검사(Balance Integrity) Repository
+
+journal_lines를 라인 ID 키셋 구간으로 나눠 집계하는 쿼리와,
+요약 테이블(account_balances, account_usage)의 저장값 조회를 담당합니다.
+무결성 검사(BalanceVerifier)와 병렬 전체 재구성(BalanceRebuilder)이 함께 사용합니다.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.account import Account
+from app.models.account_balance import AccountBalance
+from app.models.account_usage import AccountUsage
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+
+# 계정별 (차변 합계, 대변 합계, 라인 수)
+LineTotals = tuple[int, int, int]
+# 계정별 (차변 합계, 대변 합계, 라인 수, 최초 거래일, 최종 거래일)
+LineSummary = tuple[int, int, int, date | None, date | None]
+
+
+class BalanceIntegrityRepository:
+    """잔액 무결성 검사 Repository"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    def max_line_id(self) -> int:
+        """현재 마지막 라인 ID (검사 범위의 끝, 라인이 없으면 0)"""
+        return self.db.scalar(select(func.max(JournalLine.id))) or 0
+
+    def line_id_range(self) -> tuple[int, int]:
+        """(최소 라인 ID, 최대 라인 ID) - 라인이 없으면 (0, 0)"""
+        low, high = self.db.execute(select(func.min(JournalLine.id), func.max(JournalLine.id))).one()
+        return low or 0, high or 0
+
+    def chunk_upper_bound(self, after: int, size: int) -> int | None:
+        """
+        after 이후 size번째 라인 ID (PK 인덱스 범위에서 size건만 건너뜀)
+
+        남은 라인이 size건보다 적으면 None을 반환합니다.
+        """
+        return self.db.scalar(
+            select(JournalLine.id)
+            .where(JournalLine.id > after)
+            .order_by(JournalLine.id)
+            .offset(size - 1)
+            .limit(1)
+        )
+
+    def chunk_totals(self, after: int, upper: int) -> dict[int, LineTotals]:
+        """라인 ID (after, upper] 구간의 삭제되지 않은 라인 계정별 합계"""
+        rows = self.db.execute(
+            select(
+                JournalLine.account_id,
+                func.sum(JournalLine.debit),
+                func.sum(JournalLine.credit),
+                func.count(JournalLine.id),
+            )
+            .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+            .where(
+                JournalLine.id > after,
+                JournalLine.id <= upper,
+                JournalEntry.is_deleted == False,
+            )
+            .group_by(JournalLine.account_id)
+        )
+        return {account_id: (int(debit), int(credit), count) for account_id, debit, credit, count in rows}
+
+    def partition_summaries(self, after: int, upper: int) -> dict[int, LineSummary]:
+        """라인 ID (after, upper] 구간의 삭제되지 않은 라인 계정별 합계와 거래일 범위"""
+        rows = self.db.execute(
+            select(
+                JournalLine.account_id,
+                func.sum(JournalLine.debit),
+                func.sum(JournalLine.credit),
+                func.count(JournalLine.id),
+                func.min(JournalEntry.date),
+                func.max(JournalEntry.date),
+            )
+            .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+            .where(
+                JournalLine.id > after,
+                JournalLine.id <= upper,
+                JournalEntry.is_deleted == False,
+            )
+            .group_by(JournalLine.account_id)
+        )
+        return {
+            account_id: (int(debit), int(credit), count, first, last)
+            for account_id, debit, credit, count, first, last in rows
+        }
+
+    def account_ids(self) -> list[int]:
+        """전체 계정 ID"""
+        return list(self.db.scalars(select(Account.id).order_by(Account.id)))
+
+    def account_totals(self, account_ids: Sequence[int]) -> dict[int, LineTotals]:
+        """지정 계정의 삭제되지 않은 라인 합계 (계정 인덱스 범위 집계)"""
+        if not account_ids:
+            return {}
+        rows = self.db.execute(
+            select(
+                JournalLine.account_id,
+                func.sum(JournalLine.debit),
+                func.sum(JournalLine.credit),
+                func.count(JournalLine.id),
+            )
+            .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+            .where(
+                JournalLine.account_id.in_(account_ids),
+                JournalEntry.is_deleted == False,
+            )
+            .group_by(JournalLine.account_id)
+        )
+        return {account_id: (int(debit), int(credit), count) for account_id, debit, credit, count in rows}
+
+    def stored_summaries(
+        self, account_ids: Sequence[int] | None = None
+    ) -> dict[int, tuple[int | None, int | None, int | None, int | None]]:
+        """
+        계정별 저장된 (차변 합계, 대변 합계, 잔액, 라인 수) - 요약 행이 없으면 None
+
+        Args:
+            account_ids: 조회할 계정 ID (None이면 전체 계정)
+        """
+        query = (
+            select(
+                Account.id,
+                AccountBalance.total_debit,
+                AccountBalance.total_credit,
+                AccountBalance.balance,
+                AccountUsage.line_count,
+            )
+            .outerjoin(AccountBalance, AccountBalance.account_id == Account.id)
+            .outerjoin(AccountUsage, AccountUsage.account_id == Account.id)
+        )
+        if account_ids is not None:
+            query = query.where(Account.id.in_(account_ids))
+        return {row[0]: tuple(row[1:]) for row in self.db.execute(query)}
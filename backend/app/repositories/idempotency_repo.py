@@ -0,0 +1,87 @@
+"""
+멱등성 키(Idempotency Key) Repository
+
+저장된 응답 조회/기록과 만료된 키 정리를 담당합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.models.idempotency_key import IdempotencyKey
+
+
+class IdempotencyRepository:
+    """
+    멱등성 키 Repository
+
+    재시도 판별은 PK 단건 조회 한 번으로 끝납니다.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    def get_active(self, key: str, now: datetime) -> IdempotencyKey | None:
+        """
+        만료되지 않은 멱등성 키 조회
+
+        만료된 키가 남아 있으면 삭제하여 같은 키로 새 요청을 기록할 수 있게 합니다.
+
+        Args:
+            key: Idempotency-Key
+            now: 기준 시각
+
+        Returns:
+            저장된 응답 (없거나 만료된 경우 None)
+        """
+        record = self.db.get(IdempotencyKey, key)
+        if record is None:
+            return None
+        if record.expires_at <= now:
+            self.db.delete(record)
+            self.db.flush()
+            return None
+        return record
+
+    def save(
+        self,
+        key: str,
+        request_hash: str,
+        status_code: int,
+        response_body: Any,
+        now: datetime,
+        ttl_seconds: int,
+    ) -> IdempotencyKey:
+        """
+        최초 응답 기록
+
+        분개 생성과 같은 트랜잭션에서 기록되므로, 커밋된 분개에는 항상 저장된 응답이 있습니다.
+        """
+        record = IdempotencyKey(
+            key=key,
+            request_hash=request_hash,
+            status_code=status_code,
+            response_body=response_body,
+            created_at=now,
+            expires_at=now + timedelta(seconds=ttl_seconds),
+        )
+        self.db.add(record)
+        self.db.flush()
+        return record
+
+    def purge_expired(self, now: datetime) -> int:
+        """
+        만료된 멱등성 키 일괄 삭제 (expires_at 인덱스 사용)
+
+        Returns:
+            삭제된 행 수
+        """
+        result = self.db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)
+        )
+        return result.rowcount or 0
@@ -0,0 +1,111 @@
+"""
+분개 보관(Journal Archive) Repository
+
+soft-delete된 분개를 보관 테이블(archived_journal_entries / archived_journal_lines)로
+옮기는 쿼리와 보관 분개 조회를 담당합니다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.archived_journal_entry import ArchivedJournalEntry
+from app.models.archived_journal_line import ArchivedJournalLine
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+
+
+class JournalArchiveRepository:
+    """분개 보관 Repository"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    def archivable_ids(self, deleted_before: datetime, limit: int) -> list[int]:
+        """
+        deleted_before 이전에 삭제된 분개 ID (삭제 시각 순 최대 limit건, 삭제 분개 부분 인덱스 순서)
+
+        삭제된 분개는 수정/재삭제가 불가능하므로 마지막 수정 시간(updated_at)이 삭제 시간입니다.
+        운영 테이블의 ID는 재사용되지 않으므로(SQLite AUTOINCREMENT, PostgreSQL 시퀀스)
+        보관 테이블에 같은 ID를 그대로 옮깁니다.
+        """
+        return list(
+            self.db.scalars(
+                select(JournalEntry.id)
+                .where(
+                    JournalEntry.is_deleted == True,
+                    JournalEntry.updated_at < deleted_before,
+                )
+                .order_by(JournalEntry.updated_at, JournalEntry.id)
+                .limit(limit)
+            )
+        )
+
+    def move(self, entry_ids: Sequence[int], archived_at: datetime) -> tuple[int, int]:
+        """
+        분개와 라인을 보관 테이블로 옮깁니다. (호출자의 트랜잭션 안에서 INSERT ... SELECT 후 DELETE)
+
+        Args:
+            entry_ids: 옮길 분개 ID (삭제되지 않은 분개는 무시)
+            archived_at: 보관 시간
+
+        Returns:
+            (옮긴 분개 수, 옮긴 라인 수)
+        """
+        if not entry_ids:
+            return 0, 0
+        deleted_entries = (JournalEntry.id.in_(entry_ids), JournalEntry.is_deleted == True)
+
+        self.db.execute(
+            insert(ArchivedJournalEntry).from_select(
+                ["id", "date", "description", "created_at", "deleted_at", "archived_at"],
+                select(
+                    JournalEntry.id,
+                    JournalEntry.date,
+                    JournalEntry.description,
+                    JournalEntry.created_at,
+                    JournalEntry.updated_at,
+                    literal(archived_at, ArchivedJournalEntry.archived_at.type),
+                ).where(*deleted_entries),
+            )
+        )
+        self.db.execute(
+            insert(ArchivedJournalLine).from_select(
+                ["id", "entry_id", "account_id", "debit", "credit", "entry_date", "created_at"],
+                select(
+                    JournalLine.id,
+                    JournalLine.entry_id,
+                    JournalLine.account_id,
+                    JournalLine.debit,
+                    JournalLine.credit,
+                    JournalLine.entry_date,
+                    JournalLine.created_at,
+                )
+                .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+                .where(*deleted_entries),
+            )
+        )
+
+        archived_ids = select(ArchivedJournalEntry.id).where(ArchivedJournalEntry.id.in_(entry_ids))
+        lines = self.db.execute(
+            delete(JournalLine).where(JournalLine.entry_id.in_(archived_ids))
+        ).rowcount
+        entries = self.db.execute(
+            delete(JournalEntry).where(JournalEntry.id.in_(archived_ids))
+        ).rowcount
+        return entries, lines
+
+    def get_by_id(self, entry_id: int) -> ArchivedJournalEntry | None:
+        """보관 분개 단건 조회 (라인 포함)"""
+        return self.db.scalar(
+            select(ArchivedJournalEntry)
+            .where(ArchivedJournalEntry.id == entry_id)
+            .options(selectinload(ArchivedJournalEntry.lines))
+        )
@@ -4,11 +4,12 @@
 데이터베이스 접근 로직을 담당합니다.
 """
 from datetime import date
-from decimal import Decimal
 
-from sqlalchemy import String, func
+from sqlalchemy import delete, func
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.models.account import Account
 from app.models.journal_entry import JournalEntry
 from app.models.journal_line import JournalLine
 from app.schemas.journal_schema import JournalEntryCreate, JournalEntryUpdate
@@ -120,49 +121,104 @@ class JournalRepository:
                     account_id=line.account_id,
                     debit=line.debit,
                     credit=line.credit,
+                    entry_date=payload.date,
                 )
             )
 
+        # flush 시 PK와 Python 측 기본값(created_at 등)이 객체에 채워지므로
+        # refresh로 다시 SELECT 하지 않고 메모리 상태를 그대로 응답에 사용합니다.
         self.db.add(entry)
         self.db.flush()
-        self.db.refresh(entry)
         return entry
 
-    def update_entry(self, entry: JournalEntry, payload: JournalEntryUpdate) -> JournalEntry:
+    def update_entry(
+        self,
+        entry: JournalEntry,
+        payload: JournalEntryUpdate,
+    ) -> tuple[JournalEntry, set[int]]:
         """
-        분개 수정
+        분개 수정 (라인 diff 적용)
 
-        기존 라인들을 모두 삭제하고 새로 생성합니다.
+        기존 라인과 새 라인을 비교해 변경분만 반영합니다.
+        - 계정/금액이 같은 라인은 그대로 유지
+        - 남은 라인은 순서대로 짝지어 UPDATE
+        - 짝이 없는 기존 라인은 한 번의 DELETE 문으로 일괄 삭제
+        - 짝이 없는 새 라인만 INSERT
 
         Args:
             entry: 수정할 분개
             payload: 수정 데이터
 
         Returns:
-            수정된 분개
+            (수정된 분개, 잔액/사용 현황 재계산이 필요한 계정 ID 집합)
+            적요만 바뀐 경우 빈 집합을 반환합니다.
         """
-        # 기본 필드 업데이트
+        # 기본 필드 업데이트 (값이 같으면 SQLAlchemy가 UPDATE를 생략)
+        date_changed = entry.date != payload.date
         entry.date = payload.date
         entry.description = payload.description
 
-        # 기존 라인 모두 삭제
+        # 1. 계정/금액이 동일한 라인 매칭
+        unmatched_existing: dict[tuple[int, int, int], list[JournalLine]] = {}
         for line in entry.lines:
-            self.db.delete(line)
-        self.db.flush()
+            key = (line.account_id, int(line.debit), int(line.credit))
+            unmatched_existing.setdefault(key, []).append(line)
 
-        # 새로운 라인 추가
+        result_lines: list[JournalLine | None] = []
+        pending_data = []
         for line_data in payload.lines:
-            new_line = JournalLine(
-                entry_id=entry.id,
-                account_id=line_data.account_id,
-                debit=line_data.debit,
-                credit=line_data.credit,
+            key = (line_data.account_id, int(line_data.debit), int(line_data.credit))
+            candidates = unmatched_existing.get(key)
+            if candidates:
+                result_lines.append(candidates.pop(0))
+            else:
+                result_lines.append(None)
+                pending_data.append((len(result_lines) - 1, line_data))
+
+        leftovers = [line for lines in unmatched_existing.values() for line in lines]
+        leftovers.sort(key=lambda line: line.id)
+        changed_account_ids: set[int] = set()
+
+        # 2. 남은 기존 라인은 새 라인과 짝지어 제자리 수정, 나머지는 신규 생성
+        for index, line_data in pending_data:
+            if leftovers:
+                line = leftovers.pop(0)
+                changed_account_ids.add(line.account_id)
+                line.account_id = line_data.account_id
+                line.debit = line_data.debit
+                line.credit = line_data.credit
+            else:
+                line = JournalLine(
+                    entry_id=entry.id,
+                    account_id=line_data.account_id,
+                    debit=line_data.debit,
+                    credit=line_data.credit,
+                    entry_date=payload.date,
+                )
+                self.db.add(line)
+            changed_account_ids.add(line_data.account_id)
+            result_lines[index] = line
+
+        # 3. 짝이 없는 기존 라인은 한 번에 삭제
+        if leftovers:
+            self.db.execute(
+                delete(JournalLine).where(
+                    JournalLine.id.in_([line.id for line in leftovers])
+                )
             )
-            self.db.add(new_line)
+            for line in leftovers:
+                changed_account_ids.add(line.account_id)
+                self.db.expunge(line)
+
+        # 거래일이 바뀌면 모든 계정의 최초/최종 거래일(사용 현황)이 달라질 수 있음
+        if date_changed:
+            changed_account_ids.update(line.account_id for line in result_lines)
+            for line in result_lines:
+                line.entry_date = payload.date
 
+        set_committed_value(entry, "lines", result_lines)
         self.db.flush()
-        self.db.refresh(entry)
-        return entry
+        return entry, changed_account_ids
 
     def delete_entry(self, entry: JournalEntry) -> JournalEntry:
         """
@@ -176,40 +232,38 @@ class JournalRepository:
         """
         entry.is_deleted = True
         self.db.flush()
-        self.db.refresh(entry)
         return entry
 
-    def get_account_transactions(
-        self,
-        account_id: int,
-        from_date: date,
-        to_date: date,
-        search: str | None = None,
-    ) -> list[dict]:
+    def iter_export_rows(self, from_date: date, to_date: date, chunk_size: int = 1000):
+        """
+        분개 라인 내보내기용 행을 순서대로 스트리밍합니다.
+
+        결과 전체를 메모리에 올리지 않도록 chunk_size 단위로 가져옵니다.
+
+        Yields:
+            (date, entry_id, description, account_code, account_name, debit, credit)
+        """
         query = (
             self.db.query(
-                JournalEntry.id.label("entry_id"),
                 JournalEntry.date,
+                JournalEntry.id.label("entry_id"),
                 JournalEntry.description,
+                Account.code.label("account_code"),
+                Account.name.label("account_name"),
                 JournalLine.debit,
                 JournalLine.credit,
             )
             .join(JournalLine, JournalLine.entry_id == JournalEntry.id)
+            .join(Account, Account.id == JournalLine.account_id)
             .filter(
-                JournalLine.account_id == account_id,
                 JournalEntry.is_deleted == False,
                 JournalEntry.date >= from_date,
                 JournalEntry.date <= to_date,
             )
-            .order_by(JournalEntry.date, JournalEntry.id)
+            .order_by(JournalEntry.date, JournalEntry.id, JournalLine.id)
+            .yield_per(chunk_size)
         )
-        if search:
-            like_value = f"%{search.strip().lower()}%"
-            query = query.filter(
-                JournalEntry.description.ilike(like_value)
-                | func.cast(JournalEntry.id, String).ilike(like_value)
-            )
-        return [row._asdict() for row in query.all()]
+        yield from query
 
     def get_summary_list(
         self,
@@ -228,43 +282,40 @@ class JournalRepository:
         Returns:
             분개 요약 목록
         """
-        # 서브쿼리: 각 분개의 차변/대변 총액 계산
-        line_summary = (
-            self.db.query(
-                JournalLine.entry_id,
-                func.sum(JournalLine.debit).label("debit_total"),
-                func.sum(JournalLine.credit).label("credit_total"),
-            )
-            .group_by(JournalLine.entry_id)
+        # 서브쿼리: 최신순 limit건의 분개만 먼저 고름 (삭제되지 않은 분개의 거래일/ID 부분 인덱스 순서)
+        page = self.db.query(
+            JournalEntry.id,
+            JournalEntry.date,
+            JournalEntry.description,
+        ).filter(JournalEntry.is_deleted == False)
+
+        # 날짜 필터링
+        if from_date:
+            page = page.filter(JournalEntry.date >= from_date)
+        if to_date:
+            page = page.filter(JournalEntry.date <= to_date)
+
+        page = (
+            page.order_by(JournalEntry.date.desc(), JournalEntry.id.desc())
+            .limit(limit)
             .subquery()
         )
 
-        # 메인 쿼리
+        # 메인 쿼리: 고른 분개의 라인만 집계해 차변/대변 총액 계산
         query = (
             self.db.query(
-                JournalEntry.id,
-                JournalEntry.date,
-                JournalEntry.description,
-                line_summary.c.debit_total,
-                line_summary.c.credit_total,
+                page.c.id,
+                page.c.date,
+                page.c.description,
+                func.sum(JournalLine.debit).label("debit_total"),
+                func.sum(JournalLine.credit).label("credit_total"),
             )
-            .join(line_summary, JournalEntry.id == line_summary.c.entry_id)
-            .filter(JournalEntry.is_deleted == False)
-        )
-
-        # 날짜 필터링
-        if from_date:
-            query = query.filter(JournalEntry.date >= from_date)
-        if to_date:
-            query = query.filter(JournalEntry.date <= to_date)
-
-        # 정렬
-        query = query.order_by(
-            JournalEntry.date.desc(),
-            JournalEntry.id.desc()
+            .join(JournalLine, JournalLine.entry_id == page.c.id)
+            .group_by(page.c.id, page.c.date, page.c.description)
+            .order_by(page.c.date.desc(), page.c.id.desc())
         )
 
-        results = query.limit(limit).all()
+        results = query.all()
 
         # 딕셔너리로 변환
         return [
@@ -272,8 +323,8 @@ class JournalRepository:
                 "id": r.id,
                 "date": r.date,
                 "description": r.description,
-                "debit_total": r.debit_total or Decimal("0.00"),
-                "credit_total": r.credit_total or Decimal("0.00"),
+                "debit_total": r.debit_total or 0,
+                "credit_total": r.credit_total or 0,
             }
             for r in results
         ]
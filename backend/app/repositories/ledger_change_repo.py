@@ -0,0 +1,67 @@
+"""
+변경 로그(Ledger Change) Repository
+
+변경 로그 추가와 순번 이후 조회를 담당합니다. 로그는 추가만 하며 수정/삭제 메서드는 두지 않습니다.
+"""
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.ledger_change import LedgerChange
+
+
+class LedgerChangeRepository:
+    """변경 로그 Repository"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    def append(
+        self,
+        seq: int,
+        event_type: str,
+        entity_id: int,
+        payload: dict[str, Any],
+        ledger_version: int | None = None,
+    ) -> None:
+        """
+        변경 한 건 추가 (쓰기 트랜잭션 안에서 호출, ORM 객체 없이 INSERT 한 번)
+
+        Args:
+            seq: LedgerStateRepository.bump()로 발급한 순번
+            event_type: 변경 종류
+            entity_id: 분개 ID 또는 계정 ID
+            payload: 변경 내용
+            ledger_version: 분개 변경의 원장 버전
+        """
+        self.db.execute(
+            insert(LedgerChange).values(
+                seq=seq,
+                event_type=event_type,
+                entity_id=entity_id,
+                ledger_version=ledger_version,
+                payload=payload,
+            )
+        )
+
+    def list_since(self, since: int, limit: int) -> list[LedgerChange]:
+        """
+        순번 이후의 변경 (PK 범위 조회, 순번 오름차순 최대 limit건)
+
+        Args:
+            since: 이 순번 이후 (미포함)
+            limit: 최대 건수
+        """
+        return list(
+            self.db.scalars(
+                select(LedgerChange)
+                .where(LedgerChange.seq > since)
+                .order_by(LedgerChange.seq)
+                .limit(limit)
+            )
+        )
@@ -0,0 +1,417 @@
+"""
+NumPy 기반 인메모리 시산표 엔진 (선택 사항)
+
+삭제되지 않은 분개 라인을 계정 ID / 거래일(ordinal) / 분개 ID / 차변 / 대변의 int64 열로
+메모리에 보관하고, (계정, 거래일, 분개) 순으로 정렬된 복합 키와 누적합으로
+기간 합계·기초 잔액·거래 건수·최근 거래를 SQL 없이 계산합니다.
+
+    key = account_id * DAY_SPAN + day_ordinal          (정렬됨)
+    lo  = searchsorted(key, account_id * DAY_SPAN + from_day, "left")
+    hi  = searchsorted(key, account_id * DAY_SPAN + to_day,   "right")
+    기간 차변 합계 = cum_debit[hi] - cum_debit[lo]     (int64, 정확한 정수 합)
+
+갱신은 증분 방식입니다. 커밋된 새 라인은 마지막으로 읽은 라인 ID 이후만 읽고,
+수정/삭제된 분개는 해당 분개의 라인만 다시 읽습니다. JournalService가 커밋 후
+변경 사실을 알려 주며, 다음 조회 시점에 한 번의 SELECT로 반영합니다.
+새 열은 잠금 밖에서 만들어 잠금 안에서 교체하므로, 갱신하는 동안 다른 조회는 기존 스냅샷을 읽습니다.
+
+스냅샷에는 반영한 원장 버전(ledger_state.version)이 함께 기록됩니다. 리포트가 자신의
+읽기 스냅샷 버전으로 조회하면 그 버전까지 커밋된 변경만 반영하고, 그 사이 버전 중
+이 프로세스가 알지 못하는 변경(다른 프로세스의 쓰기)이 있으면 전체를 다시 읽습니다.
+열이 이미 더 최신이면 None을 돌려 호출자가 SQL 집계를 사용하게 합니다.
+
+numpy가 설치되어 있지 않으면 TRIAL_BALANCE_ENGINE=numpy 설정은 SQL 경로로 대체됩니다.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Any, Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+
+try:  # numpy는 선택 의존성
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+# date.max.toordinal()(3652059)보다 큰 값 - 계정별 키 구간이 겹치지 않도록 함
+DAY_SPAN = 4_000_000
+
+_PENDING_KEY = "ledger_columns_pending"
+
+
+def numpy_available() -> bool:
+    """numpy 설치 여부"""
+    return np is not None
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """정렬된 열 스냅샷 (교체만 하고 변경하지 않으므로 잠금 없이 읽을 수 있음)"""
+
+    line_id: Any
+    entry_id: Any
+    keys: Any
+    cum_debit: Any
+    cum_credit: Any
+    debit: Any
+    credit: Any
+    day: Any
+    # 분개 ID별 적요와 읽은 최대 라인 ID (다음 증분 갱신의 시작점)
+    descriptions: dict[int, str]
+    max_line_id: int
+    version: int | None = None
+
+
+class LedgerColumns:
+    """
+    분개 라인 열 저장소
+
+    - period_totals(): 기간 합계와 거래 건수
+    - totals_before(): 기초(기간 이전) 합계
+    - recent_lines(): 계정별 최근 거래
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stale = False
+        # 커밋 후 다시 읽을 분개 {분개 ID: 변경한 원장 버전}과 커밋된 버전 구간 {시작: 끝}
+        self._dirty_entries: dict[int, int] = {}
+        self._committed: dict[int, int] = {}
+        self._snapshot: _Snapshot | None = None
+        # 스냅샷을 교체하거나 무효화할 때마다 증가 (잠금 밖에서 만든 스냅샷이 낡았는지 확인)
+        self._generation = 0
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def track_commit(self, db: Session, entry_ids: Iterable[int], version: int) -> None:
+        """
+        현재 트랜잭션이 커밋되면 변경 사실을 엔진에 알리도록 예약합니다.
+
+        Args:
+            db: 쓰기 세션
+            entry_ids: 생성/수정/삭제된 분개 ID
+            version: 이 변경으로 올린 원장 버전
+        """
+        pending = db.info.get(_PENDING_KEY)
+        if pending is None:
+            pending = db.info[_PENDING_KEY] = {"low": version, "high": version, "entries": set()}
+        pending["low"] = min(pending["low"], version)
+        pending["high"] = max(pending["high"], version)
+        pending["entries"].update(entry_ids)
+        # once=True 리스너는 같은 세션에서 한 번만 실행되므로 세션당 한 번 상시 등록
+        if not event.contains(db, "after_commit", self._after_commit):
+            event.listen(db, "after_commit", self._after_commit)
+            event.listen(db, "after_rollback", self._after_rollback)
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending is None:
+            return
+        with self._lock:
+            high = pending["high"]
+            for entry_id in pending["entries"]:
+                self._dirty_entries[entry_id] = max(self._dirty_entries.get(entry_id, 0), high)
+            self._committed[pending["low"]] = high
+            self._stale = True
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+    def invalidate(self) -> None:
+        """다음 조회 시 전체를 다시 읽도록 합니다."""
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def refresh(self, db: Session, full: bool = False, version: int | None = None) -> _Snapshot:
+        """
+        열 데이터 갱신
+
+        무엇을 다시 읽을지는 잠금 안에서 정하고, 조회와 정렬/누적합 계산은 잠금 밖에서 수행한 뒤
+        잠금 안에서 교체합니다. 읽는 동안 다른 조회는 기존 스냅샷을 그대로 사용합니다.
+        그 사이 다른 갱신이 먼저 교체했으면 만든 스냅샷은 이 호출에서만 사용합니다.
+
+        Args:
+            db: 조회 세션
+            full: True면 전체를 다시 읽음
+            version: 조회 세션 스냅샷의 원장 버전 (None이면 커밋된 변경을 모두 반영)
+
+        Returns:
+            조회에 사용할 스냅샷
+        """
+        with self._lock:
+            base = self._snapshot
+            loaded_version = base.version if base is not None else None
+            if full or base is None:
+                base = None
+            elif version is None:
+                if not self._stale:
+                    return base
+            elif loaded_version is not None and version <= loaded_version:
+                # 이미 그 버전이거나 더 최신 (호출자가 버전 불일치를 확인)
+                return base
+            elif loaded_version is None or not self._covers(loaded_version, version):
+                # 알지 못하는 변경이 끼어 있으면 전체를 다시 읽음
+                base = None
+            generation = self._generation
+            dirty = dict(self._dirty_entries)
+            committed = set(self._committed)
+
+        if base is None:
+            snapshot = self._load_all(db, version)
+        else:
+            snapshot = self._load_changes(db, base, dirty, version)
+
+        with self._lock:
+            if self._generation == generation:
+                self._snapshot = snapshot
+                self._generation += 1
+                self._consume(version, dirty, committed)
+        return snapshot
+
+    def _covers(self, start: int, end: int) -> bool:
+        """(start, end] 버전이 모두 이 프로세스가 커밋한 변경 구간으로 이어지는지 여부"""
+        while start < end:
+            high = self._committed.get(start + 1)
+            if high is None or high > end:
+                return False
+            start = high
+        return True
+
+    def _query(self, db: Session):
+        return (
+            db.query(
+                JournalLine.id,
+                JournalLine.entry_id,
+                JournalLine.account_id,
+                JournalEntry.date,
+                JournalLine.debit,
+                JournalLine.credit,
+                JournalEntry.description,
+            )
+            .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+            .filter(JournalEntry.is_deleted == False)
+        )
+
+    def _load_all(self, db: Session, version: int | None) -> _Snapshot:
+        """전체 라인으로 새 스냅샷 구성 - 잠금 없이 실행"""
+        descriptions: dict[int, str] = {}
+        columns = self._to_columns(self._query(db).yield_per(5000), descriptions)
+        return self._build(*columns, descriptions=descriptions, version=version)
+
+    def _load_changes(
+        self,
+        db: Session,
+        base: _Snapshot,
+        dirty_entries: dict[int, int],
+        version: int | None,
+    ) -> _Snapshot:
+        """기존 스냅샷에 변경된 분개만 다시 읽어 합친 새 스냅샷 구성 - 잠금 없이 실행"""
+        # 스냅샷 버전 이후에 커밋된 분개는 아직 보이지 않으므로 다음 갱신으로 미룸
+        dirty = {
+            entry_id
+            for entry_id, changed in dirty_entries.items()
+            if version is None or changed <= version
+        }
+        # 새 라인의 분개 ID는 PK 범위 조회로 찾음 (OR 조건 조인은 전체 스캔이 됨)
+        dirty.update(
+            db.scalars(select(JournalLine.entry_id).where(JournalLine.id > base.max_line_id).distinct())
+        )
+        if not dirty:
+            return replace(base, version=version)
+
+        # 수정/삭제된 분개의 기존 라인은 제외하고 현재 상태로 다시 읽음
+        keep = ~np.isin(base.entry_id, np.fromiter(dirty, dtype=np.int64))
+        descriptions = dict(base.descriptions)
+        for entry_id in dirty:
+            descriptions.pop(entry_id, None)
+
+        added = self._to_columns(
+            self._query(db).filter(JournalLine.entry_id.in_(sorted(dirty))), descriptions
+        )
+        existing = (
+            base.line_id[keep],
+            base.entry_id[keep],
+            base.keys[keep],
+            base.debit[keep],
+            base.credit[keep],
+        )
+        return self._build(
+            *(np.concatenate((old, new)) for old, new in zip(existing, added)),
+            descriptions=descriptions,
+            version=version,
+            max_line_id=base.max_line_id,
+        )
+
+    def _consume(self, version: int | None, dirty: dict[int, int], committed: set[int]) -> None:
+        """
+        교체한 스냅샷에 반영된 변경 기록을 비움 (잠금 안에서 호출)
+
+        버전을 지정한 갱신은 그 버전까지의 기록을 비우고(이후 버전은 다음 갱신까지 유지),
+        최신 상태를 읽은 갱신은 읽기 전에 알고 있던 기록만 비웁니다. (읽는 동안 커밋된 변경은 유지)
+        """
+        if version is None:
+            for entry_id, changed in dirty.items():
+                if self._dirty_entries.get(entry_id) == changed:
+                    del self._dirty_entries[entry_id]
+            for low in committed:
+                self._committed.pop(low, None)
+        else:
+            self._dirty_entries = {
+                entry_id: changed for entry_id, changed in self._dirty_entries.items() if changed > version
+            }
+            self._committed = {low: high for low, high in self._committed.items() if high > version}
+        self._stale = bool(self._dirty_entries)
+
+    @staticmethod
+    def _to_columns(rows, descriptions: dict[int, str]):
+        """조회 결과를 (line_id, entry_id, key, debit, credit) int64 열로 변환 (적요는 descriptions에 기록)"""
+        values = []
+        for line_id, entry_id, account_id, entry_date, debit, credit, description in rows:
+            values.append((line_id, entry_id, account_id * DAY_SPAN + entry_date.toordinal(), debit, credit))
+            descriptions[entry_id] = description
+        columns = np.array(values, dtype=np.int64).reshape(len(values), 5)
+        return tuple(columns.T)
+
+    @staticmethod
+    def _build(
+        line_id,
+        entry_id,
+        keys,
+        debit,
+        credit,
+        descriptions: dict[int, str],
+        version: int | None = None,
+        max_line_id: int = 0,
+    ) -> _Snapshot:
+        """(계정, 거래일, 분개 ID, 라인 ID) 순으로 정렬하고 누적합을 계산합니다."""
+        # lexsort는 마지막 키가 1순위 (key = 계정 * DAY_SPAN + 거래일)
+        order = np.lexsort((line_id, entry_id, keys))
+        keys = keys[order]
+        debit = debit[order]
+        credit = credit[order]
+        zero = np.zeros(1, dtype=np.int64)
+        return _Snapshot(
+            line_id=line_id[order],
+            entry_id=entry_id[order],
+            keys=keys,
+            cum_debit=np.concatenate((zero, np.cumsum(debit))),
+            cum_credit=np.concatenate((zero, np.cumsum(credit))),
+            debit=debit,
+            credit=credit,
+            day=keys % DAY_SPAN,
+            descriptions=descriptions,
+            max_line_id=max(max_line_id, int(line_id.max())) if len(line_id) else max_line_id,
+            version=version,
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _bounds(self, db: Session, account_ids: list[int], from_day: int, to_day: int, version: int | None):
+        snapshot = self.refresh(db, version=version)
+        if version is not None and snapshot.version != version:
+            return None
+        base = np.asarray(account_ids, dtype=np.int64) * DAY_SPAN
+        lo = np.searchsorted(snapshot.keys, base + from_day, side="left")
+        hi = np.searchsorted(snapshot.keys, base + to_day, side="right")
+        return snapshot, lo, hi
+
+    def period_totals(
+        self,
+        db: Session,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date,
+        version: int | None = None,
+    ) -> dict[int, tuple[int, int, int]] | None:
+        """
+        기간 내 계정별 (차변 합계, 대변 합계, 라인 수)
+
+        거래가 없는 계정은 결과에서 제외됩니다.
+        version(리포트 스냅샷의 원장 버전)을 주면 열이 그 버전이 아닐 때 None을 반환합니다.
+        """
+        if not account_ids:
+            return {}
+        bounds = self._bounds(db, account_ids, from_date.toordinal(), to_date.toordinal(), version)
+        if bounds is None:
+            return None
+        snapshot, lo, hi = bounds
+        debit = snapshot.cum_debit[hi] - snapshot.cum_debit[lo]
+        credit = snapshot.cum_credit[hi] - snapshot.cum_credit[lo]
+        counts = hi - lo
+        return {
+            acc_id: (int(debit[i]), int(credit[i]), int(counts[i]))
+            for i, acc_id in enumerate(account_ids)
+            if counts[i]
+        }
+
+    def totals_before(
+        self,
+        db: Session,
+        account_ids: list[int],
+        before: date,
+        version: int | None = None,
+    ) -> dict[int, tuple[int, int]] | None:
+        """기준일 이전(미포함) 계정별 (차변 합계, 대변 합계) - 버전 불일치 시 None"""
+        if not account_ids:
+            return {}
+        bounds = self._bounds(db, account_ids, 0, before.toordinal() - 1, version)
+        if bounds is None:
+            return None
+        snapshot, lo, hi = bounds
+        debit = snapshot.cum_debit[hi] - snapshot.cum_debit[lo]
+        credit = snapshot.cum_credit[hi] - snapshot.cum_credit[lo]
+        return {
+            acc_id: (int(debit[i]), int(credit[i]))
+            for i, acc_id in enumerate(account_ids)
+            if hi[i] > lo[i]
+        }
+
+    def recent_lines(
+        self,
+        db: Session,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date,
+        limit: int = 5,
+        version: int | None = None,
+    ) -> dict[int, list[dict]] | None:
+        """기간 내 계정별 최근 거래 (거래일, 분개 ID 내림차순 최대 limit건) - 버전 불일치 시 None"""
+        if not account_ids:
+            return {}
+        bounds = self._bounds(db, account_ids, from_date.toordinal(), to_date.toordinal(), version)
+        if bounds is None:
+            return None
+        snapshot, lo, hi = bounds
+        descriptions = snapshot.descriptions
+        recent: dict[int, list[dict]] = {}
+        for i, acc_id in enumerate(account_ids):
+            start, end = int(lo[i]), int(hi[i])
+            if start == end:
+                continue
+            positions = range(end - 1, max(start, end - limit) - 1, -1)
+            recent[acc_id] = [
+                {
+                    "date": str(date.fromordinal(int(snapshot.day[pos]))),
+                    "description": descriptions.get(int(snapshot.entry_id[pos]), ""),
+                    "debit": int(snapshot.debit[pos]),
+                    "credit": int(snapshot.credit[pos]),
+                }
+                for pos in positions
+            ]
+        return recent
+
+
+ledger_columns = LedgerColumns()
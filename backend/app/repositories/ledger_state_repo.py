@@ -0,0 +1,89 @@
+"""
+원장 상태(Ledger State) Repository
+
+원장 버전·변경 로그 순번 발급과 조회를 담당합니다.
+"""
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.models.ledger_state import LEDGER_STATE_ID, LedgerState
+
+
+class LedgerStamp(NamedTuple):
+    """한 번의 변경에 발급된 (원장 버전, 변경 로그 순번)"""
+
+    version: int
+    change_seq: int
+
+
+class LedgerStateRepository:
+    """원장 버전 Repository"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    def bump(self, journal_change: bool = True) -> LedgerStamp:
+        """
+        변경 로그 순번을 1 올리고, 분개 변경이면 원장 버전도 1 올립니다. (쓰기 트랜잭션 안에서 호출)
+
+        단일 행 UPSERT ... RETURNING 한 번으로 처리하며, 행 잠금이 커밋까지 유지되므로
+        동시에 쓰는 트랜잭션들의 버전과 순번은 커밋 순서대로 겹치지 않게 매겨집니다.
+
+        Args:
+            journal_change: False면 원장 버전은 그대로 두고 순번만 발급 (계정 변경)
+        """
+        step = 1 if journal_change else 0
+        stmt = dialect_insert(self.db, LedgerState).values(
+            id=LEDGER_STATE_ID, version=step, change_seq=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LedgerState.id],
+            set_={
+                "version": LedgerState.version + step,
+                "change_seq": LedgerState.change_seq + 1,
+            },
+        ).returning(LedgerState.version, LedgerState.change_seq)
+        version, change_seq = self.db.execute(stmt).one()
+        return LedgerStamp(version, change_seq)
+
+    def current(self) -> int:
+        """현재 트랜잭션(스냅샷)에서 보이는 원장 버전 (행이 없으면 0)"""
+        version = self.db.scalar(
+            select(LedgerState.version).where(LedgerState.id == LEDGER_STATE_ID)
+        )
+        return version or 0
+
+    def latest(self) -> int:
+        """
+        현재 커밋된 원장 버전을 조회하고, 이 조회로 시작한 읽기 트랜잭션은 바로 끝냅니다.
+
+        요청 병합 키처럼 리포트 스냅샷을 열기 전에 버전만 필요할 때 사용합니다.
+        (이미 진행 중인 트랜잭션은 그대로 둠)
+        """
+        started = self.db.in_transaction()
+        try:
+            return self.current()
+        finally:
+            if not started:
+                self.db.rollback()
+
+    def change_seq(self, lock: bool = False) -> int:
+        """
+        마지막으로 발급된 변경 로그 순번 (행이 없으면 0)
+
+        Args:
+            lock: True면 행 잠금(SELECT ... FOR UPDATE)을 잡아 커밋까지 다른 쓰기의
+                순번 발급을 막습니다. (PostgreSQL - SQLite는 먼저 쓰기를 시작한 트랜잭션이
+                DB 쓰기 잠금을 갖고 있으므로 그대로 조회)
+        """
+        query = select(LedgerState.change_seq).where(LedgerState.id == LEDGER_STATE_ID)
+        if lock:
+            query = query.with_for_update()
+        return self.db.scalar(query) or 0
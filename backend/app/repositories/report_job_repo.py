@@ -0,0 +1,96 @@
+"""
+리포트 작업(Report Job) Repository
+
+작업 상태 저장과 워커의 작업 선점(claim)을 담당합니다.
+"""
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.report_job import ReportJob, ReportJobKind, ReportJobStatus
+
+
+class ReportJobRepository:
+    """리포트 작업 Repository"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    def create(self, kind: ReportJobKind, params: dict[str, Any]) -> ReportJob:
+        """대기(PENDING) 상태의 작업 생성"""
+        job = ReportJob(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            params=params,
+            status=ReportJobStatus.PENDING,
+            created_at=datetime.utcnow(),
+        )
+        self.db.add(job)
+        self.db.flush()
+        return job
+
+    def get_by_id(self, job_id: str) -> ReportJob | None:
+        """작업 단건 조회 (상태는 워커가 다른 세션에서 바꾸므로 항상 DB 값을 읽음)"""
+        return self.db.get(ReportJob, job_id, populate_existing=True)
+
+    def claim(self, job_id: str, now: datetime) -> bool:
+        """
+        대기 중인 작업을 실행 중(RUNNING)으로 선점합니다.
+
+        조건부 UPDATE이므로 같은 작업이 두 워커에서 동시에 실행되지 않습니다.
+
+        Returns:
+            선점 성공 여부
+        """
+        result = self.db.execute(
+            update(ReportJob)
+            .where(ReportJob.id == job_id, ReportJob.status == ReportJobStatus.PENDING)
+            .values(status=ReportJobStatus.RUNNING, started_at=now)
+        )
+        return result.rowcount == 1
+
+    def finish(
+        self,
+        job_id: str,
+        now: datetime,
+        result_path: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """작업 완료(SUCCEEDED) 또는 실패(FAILED) 기록"""
+        self.db.execute(
+            update(ReportJob)
+            .where(ReportJob.id == job_id)
+            .values(
+                status=ReportJobStatus.FAILED if error else ReportJobStatus.SUCCEEDED,
+                result_path=result_path,
+                error=error,
+                finished_at=now,
+            )
+        )
+
+    def requeue_unfinished(self) -> list[str]:
+        """
+        서버 재시작 전에 끝나지 않은 작업을 다시 대기 상태로 돌립니다.
+
+        Returns:
+            대기 중인 작업 ID 목록 (생성 순)
+        """
+        self.db.execute(
+            update(ReportJob)
+            .where(ReportJob.status == ReportJobStatus.RUNNING)
+            .values(status=ReportJobStatus.PENDING, started_at=None)
+        )
+        rows = (
+            self.db.query(ReportJob.id)
+            .filter(ReportJob.status == ReportJobStatus.PENDING)
+            .order_by(ReportJob.created_at)
+            .all()
+        )
+        return [row.id for row in rows]
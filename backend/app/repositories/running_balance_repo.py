@@ -0,0 +1,385 @@
+"""
+러닝 잔액(Running Balance) Repository
+
+삭제되지 않은 분개 라인마다 계정별 누적 잔액(차변 - 대변)을 저장합니다.
+원장 순서는 (거래일, 분개 ID, 라인 ID)이며 journal_lines의
+(account_id, entry_date, entry_id, id) 인덱스를 그대로 따릅니다.
+
+    running_balance(L) = running_balance(L 직전 라인) + L.debit - L.credit
+
+- 분개 반영(post_entry): 분개 라인의 러닝 잔액을 채우고, 같은 계정의 이후 라인은
+  분개 순액만큼 한 번의 UPDATE로 밀어 줍니다. 최신 거래일로 추가되는 일반적인 경우
+  이후 라인이 없으므로 갱신되는 행은 분개 라인뿐입니다.
+- 분개 제외(unpost_entry): 분개 라인의 러닝 잔액을 NULL로 만들고 이후 라인을 되돌립니다.
+- 전체 재계산(resequence): 서비스를 거치지 않고 넣은 데이터(시드, 마이그레이션)용
+
+post_entry는 직전 라인의 커밋된 러닝 잔액을 읽어 새 라인을 채우므로, 같은 계정을 동시에 쓰는
+트랜잭션은 직렬화되어야 합니다. PostgreSQL(READ COMMITTED)에서는 반영/제외 전에 계정별
+account_balances 행을 계정 ID 순서로 잠가(SELECT ... FOR UPDATE) 교착 없이 차례로 진행하고,
+SQLite는 쓰기 트랜잭션이 하나뿐이므로 잠그지 않습니다.
+
+원장 조회는 기간 시작 직전 라인의 러닝 잔액 하나로 기초 잔액을 얻고,
+기간 라인은 인덱스 범위(키셋) 조회로 저장된 잔액과 함께 읽습니다.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Iterable, Sequence
+
+from sqlalchemy import String, and_, case, func, or_, select, tuple_, update
+from sqlalchemy.orm import Session, aliased
+
+from app.core.database import dialect_insert
+from app.models.account_balance import AccountBalance
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+
+# 원장 키: (거래일, 분개 ID, 라인 ID)
+LedgerKey = tuple[date, int, int]
+
+
+class RunningBalanceRepository:
+    """계정별 러닝 잔액 Repository"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    # ------------------------------------------------------------------
+    # 유지
+    # ------------------------------------------------------------------
+    def post_entry(self, entry_id: int, entry_date: date, account_ids: Iterable[int]) -> None:
+        """
+        분개 라인을 원장 순서에 반영합니다. (라인이 flush된 뒤 호출)
+
+        Args:
+            entry_id: 분개 ID
+            entry_date: 분개 거래일
+            account_ids: 분개 라인의 계정 ID
+        """
+        id_list = sorted(set(account_ids))
+        if not id_list:
+            return
+        self._lock_accounts(id_list)
+
+        previous = aliased(JournalLine)
+        same_entry = aliased(JournalLine)
+        entry_key = tuple_(entry_date, entry_id)
+
+        # 분개 직전 라인의 러닝 잔액 (같은 계정, 삭제되지 않은 라인)
+        opening = (
+            select(previous.running_balance)
+            .where(
+                previous.account_id == JournalLine.account_id,
+                previous.running_balance.is_not(None),
+                tuple_(previous.entry_date, previous.entry_id) < entry_key,
+            )
+            .order_by(previous.entry_date.desc(), previous.entry_id.desc(), previous.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        # 같은 분개 안에서 자신까지의 순액 (한 분개에 같은 계정 라인이 여러 개일 수 있음)
+        own = (
+            select(func.sum(same_entry.debit - same_entry.credit))
+            .where(
+                same_entry.entry_id == entry_id,
+                same_entry.account_id == JournalLine.account_id,
+                same_entry.id <= JournalLine.id,
+            )
+            .scalar_subquery()
+        )
+        net = self._entry_net(entry_id)
+
+        self.db.execute(
+            update(JournalLine)
+            .where(
+                JournalLine.account_id.in_(id_list),
+                or_(
+                    JournalLine.entry_id == entry_id,
+                    and_(
+                        JournalLine.running_balance.is_not(None),
+                        tuple_(JournalLine.entry_date, JournalLine.entry_id) > entry_key,
+                    ),
+                ),
+            )
+            .values(
+                running_balance=case(
+                    (JournalLine.entry_id == entry_id, func.coalesce(opening, 0) + own),
+                    else_=JournalLine.running_balance + net,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def unpost_entry(self, entry_id: int, entry_date: date, account_ids: Iterable[int]) -> None:
+        """
+        분개 라인을 원장 순서에서 제외합니다. (라인을 바꾸거나 삭제 표시하기 전에 호출)
+
+        Args:
+            entry_id: 분개 ID
+            entry_date: 분개의 기존 거래일
+            account_ids: 분개 라인의 기존 계정 ID
+        """
+        id_list = sorted(set(account_ids))
+        if not id_list:
+            return
+        self._lock_accounts(id_list)
+
+        self.db.execute(
+            update(JournalLine)
+            .where(
+                JournalLine.account_id.in_(id_list),
+                JournalLine.running_balance.is_not(None),
+                or_(
+                    JournalLine.entry_id == entry_id,
+                    tuple_(JournalLine.entry_date, JournalLine.entry_id) > tuple_(entry_date, entry_id),
+                ),
+            )
+            .values(
+                running_balance=case(
+                    (JournalLine.entry_id == entry_id, None),
+                    else_=JournalLine.running_balance - self._entry_net(entry_id),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _lock_accounts(self, account_ids: list[int]) -> None:
+        """
+        계정별 account_balances 행을 계정 ID 순서로 잠급니다. (PostgreSQL - 커밋까지 유지)
+
+        첫 거래라 요약 행이 아직 없는 계정은 빈 행을 먼저 만들어 잠글 대상을 확보합니다.
+        """
+        if not uses_row_locks(self.db):
+            return
+        self.db.execute(
+            dialect_insert(self.db, AccountBalance)
+            .values([{"account_id": account_id} for account_id in account_ids])
+            .on_conflict_do_nothing(index_elements=[AccountBalance.account_id])
+        )
+        self.db.execute(account_lock_query(account_ids))
+
+    def resequence(self, account_ids: Sequence[int] | None = None) -> None:
+        """
+        러닝 잔액 전체 재계산
+
+        거래일 복사본(entry_date)을 분개 헤더와 맞춘 뒤, 삭제되지 않은 라인의 러닝 잔액을
+        윈도우 함수 한 번으로 다시 계산합니다. 삭제된 분개의 라인은 NULL이 됩니다.
+
+        Args:
+            account_ids: 재계산할 계정 ID (None이면 전체)
+        """
+        account_filter = JournalLine.account_id.in_(account_ids) if account_ids is not None else None
+
+        sync_dates = (
+            update(JournalLine)
+            .values(
+                entry_date=select(JournalEntry.date)
+                .where(JournalEntry.id == JournalLine.entry_id)
+                .scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if account_filter is not None:
+            sync_dates = sync_dates.where(account_filter)
+        self.db.execute(sync_dates)
+
+        line = aliased(JournalLine)
+        sequenced = (
+            select(
+                line.id,
+                func.sum(line.debit - line.credit)
+                .over(
+                    partition_by=line.account_id,
+                    order_by=(line.entry_date, line.entry_id, line.id),
+                )
+                .label("running_balance"),
+            )
+            .join(JournalEntry, JournalEntry.id == line.entry_id)
+            .where(JournalEntry.is_deleted == False)
+        )
+        if account_ids is not None:
+            sequenced = sequenced.where(line.account_id.in_(account_ids))
+        sequenced = sequenced.subquery()
+
+        # 삭제된 분개의 라인은 NULL, 나머지는 UPDATE ... FROM 조인으로 한 번에 채움
+        clear = update(JournalLine).values(running_balance=None).execution_options(synchronize_session=False)
+        if account_filter is not None:
+            clear = clear.where(account_filter)
+        self.db.execute(clear)
+        self.db.execute(
+            update(JournalLine)
+            .where(JournalLine.id == sequenced.c.id)
+            .values(running_balance=sequenced.c.running_balance)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _entry_net(self, entry_id: int):
+        """분개의 계정별 순액(차변 - 대변) 상관 서브쿼리"""
+        same_entry = aliased(JournalLine)
+        return (
+            select(func.sum(same_entry.debit - same_entry.credit))
+            .where(
+                same_entry.entry_id == entry_id,
+                same_entry.account_id == JournalLine.account_id,
+            )
+            .scalar_subquery()
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def balance_before(self, account_id: int, before: date) -> int:
+        """
+        거래일 직전까지의 러닝 잔액 (인덱스 역방향 조회 한 번)
+
+        Args:
+            account_id: 계정 ID
+            before: 이 날짜 이전 라인까지 누적
+        """
+        return self._latest_balance(account_id, JournalLine.entry_date < before)
+
+    def balance_through(self, account_id: int, key: LedgerKey) -> int:
+        """
+        원장 키의 라인까지 포함한 러닝 잔액 (키셋 페이지의 직전 누적 잔액)
+
+        Args:
+            account_id: 계정 ID
+            key: (거래일, 분개 ID, 라인 ID)
+        """
+        return self._latest_balance(
+            account_id,
+            tuple_(JournalLine.entry_date, JournalLine.entry_id, JournalLine.id) <= tuple_(*key),
+        )
+
+    def _latest_balance(self, account_id: int, condition) -> int:
+        """조건을 만족하는 원장 순서상 마지막 라인의 러닝 잔액"""
+        balance = self.db.scalar(
+            select(JournalLine.running_balance)
+            .where(
+                JournalLine.account_id == account_id,
+                JournalLine.running_balance.is_not(None),
+                condition,
+            )
+            .order_by(
+                JournalLine.entry_date.desc(),
+                JournalLine.entry_id.desc(),
+                JournalLine.id.desc(),
+            )
+            .limit(1)
+        )
+        return balance or 0
+
+    def period_totals(
+        self,
+        account_id: int,
+        from_date: date,
+        to_date: date,
+        search: str | None = None,
+        through: LedgerKey | None = None,
+    ) -> tuple[int, int]:
+        """
+        기간 내 계정 원장 라인의 (차변 합계, 대변 합계) - 인덱스 범위 집계 한 번
+
+        Args:
+            through: 이 원장 키의 라인까지만 합산 (검색 결과 페이지의 직전 누적 합계)
+        """
+        query = (
+            select(
+                func.coalesce(func.sum(JournalLine.debit), 0),
+                func.coalesce(func.sum(JournalLine.credit), 0),
+            )
+            .where(
+                JournalLine.account_id == account_id,
+                JournalLine.running_balance.is_not(None),
+                JournalLine.entry_date >= from_date,
+                JournalLine.entry_date <= to_date,
+            )
+        )
+        if through is not None:
+            query = query.where(
+                tuple_(JournalLine.entry_date, JournalLine.entry_id, JournalLine.id) <= tuple_(*through)
+            )
+        if search:
+            query = self._apply_search(query.join(JournalEntry, JournalEntry.id == JournalLine.entry_id), search)
+        debit, credit = self.db.execute(query).one()
+        return int(debit), int(credit)
+
+    def list_lines(
+        self,
+        account_id: int,
+        from_date: date,
+        to_date: date,
+        search: str | None = None,
+        after: LedgerKey | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """
+        기간 내 계정 원장 라인 (저장된 러닝 잔액 포함, 원장 순서)
+
+        Args:
+            account_id: 계정 ID
+            from_date: 시작일
+            to_date: 종료일
+            search: 전표 ID 또는 적요 검색어
+            after: 이 키 이후의 라인만 조회 (키셋 페이지)
+            limit: 최대 라인 수
+
+        Returns:
+            entry_id, line_id, date, description, debit, credit, balance 딕셔너리 목록
+        """
+        query = (
+            select(
+                JournalLine.entry_id,
+                JournalLine.id.label("line_id"),
+                JournalLine.entry_date.label("date"),
+                JournalEntry.description,
+                JournalLine.debit,
+                JournalLine.credit,
+                JournalLine.running_balance.label("balance"),
+            )
+            .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+            .where(
+                JournalLine.account_id == account_id,
+                JournalLine.running_balance.is_not(None),
+                JournalLine.entry_date >= from_date,
+                JournalLine.entry_date <= to_date,
+            )
+            .order_by(JournalLine.entry_date, JournalLine.entry_id, JournalLine.id)
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(JournalLine.entry_date, JournalLine.entry_id, JournalLine.id) > tuple_(*after)
+            )
+        if search:
+            query = self._apply_search(query, search)
+        if limit is not None:
+            query = query.limit(limit)
+        return [row._asdict() for row in self.db.execute(query)]
+
+    @staticmethod
+    def _apply_search(query, search: str):
+        """전표 ID 또는 적요 검색 조건 (journal_entries 조인 필요)"""
+        like_value = f"%{search.strip().lower()}%"
+        return query.where(
+            JournalEntry.description.ilike(like_value)
+            | func.cast(JournalEntry.id, String).ilike(like_value)
+        )
+
+
+def uses_row_locks(db: Session) -> bool:
+    """계정 행 잠금이 필요한 DB인지 (SQLite는 DB 쓰기 잠금으로 이미 직렬화됨)"""
+    return db.get_bind().dialect.name != "sqlite"
+
+
+def account_lock_query(account_ids: Sequence[int]):
+    """계정별 요약 행 잠금 쿼리 (교착을 피하려고 항상 계정 ID 순서로 잠금)"""
+    return (
+        select(AccountBalance.account_id)
+        .where(AccountBalance.account_id.in_(account_ids))
+        .order_by(AccountBalance.account_id)
+        .with_for_update()
+    )
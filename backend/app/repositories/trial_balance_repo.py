@@ -3,47 +3,64 @@
 
 합계 시산표(A 방식): 차변 합계 + 대변 합계 + 잔액
 """
+import logging
 from datetime import date
-from decimal import Decimal
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models.account import Account, AccountType
+from app.core.config import get_settings
+from app.models.account import AccountType
 from app.models.journal_entry import JournalEntry
 from app.models.journal_line import JournalLine
-from app.services.trial_balance_types import RecentEntryRecord, TrialBalanceEntry
+from app.repositories.account_catalog import account_catalog
+from app.repositories.balance_index import balance_index
+from app.repositories.ledger_columns import ledger_columns, numpy_available
+from app.services.trial_balance_types import RecentEntryRecord, TrialBalanceEntry, TrialBalanceFilter
+
+logger = logging.getLogger(__name__)
 
 
 class TrialBalanceRepository:
-    """시산표 Repository"""
+    """
+    시산표 Repository
+
+    ledger_version에 리포트 스냅샷의 원장 버전을 지정하면 인메모리 집계(잔액 인덱스, 열 엔진)는
+    정확히 그 버전일 때만 사용하고, 다르면 같은 스냅샷에서 SQL로 집계합니다.
+    """
 
     def __init__(self, db: Session):
         self.db = db
+        self.ledger_version: int | None = None
 
     def calculate_trial_balance(
         self,
         from_date: date,
-        to_date: date
+        to_date: date,
+        include_recent: bool = False,
+        filters: TrialBalanceFilter | None = None,
     ) -> list[TrialBalanceEntry]:
         """
         시산표 계산 (A 방식: 합계 시산표)
 
         N+1 문제를 방지하기 위해 계정별 합계를 한 번의 쿼리로 조회합니다.
+        최근 거래는 include_recent=True일 때만 조회합니다.
+        filters의 계정 조건(type, 코드 범위, 계정 ID)은 집계 전에 적용되어
+        집계 쿼리의 account_id IN 목록 자체가 줄어듭니다.
 
         Args:
             from_date: 시작일
             to_date: 종료일
+            include_recent: 계정별 최근 거래 포함 여부
+            filters: 계정 필터 (None이면 전체 활성 계정)
 
         Returns:
             계정별 시산표 데이터 리스트
         """
-        # 1. 활성 계정 목록 조회 (필요한 필드만)
-        accounts = (
-            self.db.query(Account.id, Account.code, Account.name, Account.type)
-            .filter(Account.is_active == True)
-            .all()
-        )
+        # 1. 활성 계정 목록 (계정 카탈로그 캐시 사용, 필터 조건 적용)
+        accounts = account_catalog.active_accounts(self.db)
+        if filters is not None:
+            accounts = [account for account in accounts if filters.matches(account)]
 
         if not accounts:
             return []
@@ -54,16 +71,19 @@ class TrialBalanceRepository:
         # 2. 모든 계정의 차변/대변 합계를 한 번에 조회 (N+1 문제 해결)
         totals_map = self._calculate_all_period_totals(account_ids, from_date, to_date)
 
-        # 3. 모든 계정의 거래 건수와 최근 거래를 한 번에 조회
-        counts_map, recent_map = self._get_all_recent_transactions(
-            account_ids, from_date, to_date
+        # 3. 모든 계정의 거래 건수(와 요청 시 최근 거래)를 한 번에 조회
+        counts_map = self._count_all_transactions(account_ids, from_date, to_date)
+        recent_map = (
+            self._get_all_recent_transactions(account_ids, from_date, to_date)
+            if include_recent
+            else {}
         )
 
         # 4. 결과 조합
         entries: list[TrialBalanceEntry] = []
 
         for acc_id, account in account_map.items():
-            total_debit, total_credit = totals_map.get(acc_id, (Decimal("0"), Decimal("0")))
+            total_debit, total_credit = totals_map.get(acc_id, (0, 0))
             balance = total_debit - total_credit
             transaction_count = counts_map.get(acc_id, 0)
             recent_entries = recent_map.get(acc_id, [])
@@ -97,7 +117,7 @@ class TrialBalanceRepository:
         account_ids: list[int],
         from_date: date,
         to_date: date
-    ) -> dict[int, tuple[Decimal, Decimal]]:
+    ) -> dict[int, tuple[int, int]]:
         """
         모든 계정의 기간 내 차변/대변 합계를 한 번에 계산 (N+1 문제 해결)
 
@@ -111,7 +131,21 @@ class TrialBalanceRepository:
         """
         if not account_ids:
             return {}
+        if balance_index_enabled():
+            totals = balance_index.range_totals(
+                self.db, account_ids, from_date, to_date, self.ledger_version
+            )
+            if totals is not None:
+                return totals
+        return self._scan_period_totals(account_ids, from_date, to_date)
 
+    def _scan_period_totals(
+        self,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date
+    ) -> dict[int, tuple[int, int]]:
+        """기간 합계 SQL 집계 (잔액 인덱스를 사용하지 않을 때의 대체 경로)"""
         results = (
             self.db.query(
                 JournalLine.account_id,
@@ -129,11 +163,9 @@ class TrialBalanceRepository:
             .all()
         )
 
+        # 금액 컬럼(Amount)이 int를 반환하므로 변환 없이 그대로 사용
         return {
-            row.account_id: (
-                Decimal(str(row.total_debit or 0)),
-                Decimal(str(row.total_credit or 0))
-            )
+            row.account_id: (row.total_debit, row.total_credit)
             for row in results
         }
 
@@ -141,10 +173,13 @@ class TrialBalanceRepository:
         self,
         account_ids: list[int],
         from_date: date,
-    ) -> dict[int, tuple[Decimal, Decimal]]:
+    ) -> dict[int, tuple[int, int]]:
         """
         기간 시작 이전까지의 모든 계정의 차변/대변 합계를 계산
 
+        잔액 인덱스(BALANCE_INDEX=1, 기본값)를 사용하면 계정당 O(log 일수)로 계산하고,
+        인덱스를 끈 경우에만 journal_lines를 집계합니다.
+
         Args:
             account_ids: 계정 ID 목록
             from_date: 조회 시작일 (포함하지 않음)
@@ -154,7 +189,18 @@ class TrialBalanceRepository:
         """
         if not account_ids:
             return {}
+        if balance_index_enabled():
+            totals = balance_index.totals_before(self.db, account_ids, from_date, self.ledger_version)
+            if totals is not None:
+                return totals
+        return self._scan_totals_before_period(account_ids, from_date)
 
+    def _scan_totals_before_period(
+        self,
+        account_ids: list[int],
+        from_date: date,
+    ) -> dict[int, tuple[int, int]]:
+        """기초 합계 SQL 집계 (잔액 인덱스를 사용하지 않을 때의 대체 경로)"""
         results = (
             self.db.query(
                 JournalLine.account_id,
@@ -171,37 +217,32 @@ class TrialBalanceRepository:
             .all()
         )
 
+        # 금액 컬럼(Amount)이 int를 반환하므로 변환 없이 그대로 사용
         return {
-            row.account_id: (
-                Decimal(str(row.total_debit or 0)),
-                Decimal(str(row.total_credit or 0))
-            )
+            row.account_id: (row.total_debit, row.total_credit)
             for row in results
         }
 
-    def _get_all_recent_transactions(
+    def _count_all_transactions(
         self,
         account_ids: list[int],
         from_date: date,
-        to_date: date,
-        limit: int = 5
-    ) -> tuple[dict[int, int], dict[int, list]]:
+        to_date: date
+    ) -> dict[int, int]:
         """
-        모든 계정의 거래 건수와 최근 거래를 한 번에 조회 (N+1 문제 해결)
+        모든 계정의 기간 내 거래 건수를 한 번에 조회 (N+1 문제 해결)
 
         Args:
             account_ids: 계정 ID 목록
             from_date: 시작일
             to_date: 종료일
-            limit: 계정당 최근 거래 조회 수
 
         Returns:
-            (거래 건수 딕셔너리, 최근 거래 딕셔너리)
+            {account_id: 거래 건수} 딕셔너리
         """
         if not account_ids:
-            return {}, {}
+            return {}
 
-        # 1. 거래 건수 계산
         count_results = (
             self.db.query(
                 JournalLine.account_id,
@@ -218,59 +259,134 @@ class TrialBalanceRepository:
             .all()
         )
 
-        counts_map = {row.account_id: row.count for row in count_results}
+        return {row.account_id: row.count for row in count_results}
 
-        # 2. 최근 거래 조회 (윈도우 함수 또는 서브쿼리 사용)
-        # SQLite는 윈도우 함수를 지원하므로 ROW_NUMBER를 사용할 수 있습니다
-        from sqlalchemy import literal_column
+    def _get_all_recent_transactions(
+        self,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date,
+        limit: int = 5
+    ) -> dict[int, list]:
+        """
+        모든 계정의 최근 거래를 한 번에 조회
 
-        # 각 계정별로 최근 거래를 조회
-        lines = (
-            self.db.query(
+        ROW_NUMBER 윈도우로 계정별 상위 limit건만 DB에서 잘라 가져옵니다.
+
+        Args:
+            account_ids: 계정 ID 목록
+            from_date: 시작일
+            to_date: 종료일
+            limit: 계정당 최근 거래 조회 수
+
+        Returns:
+            {account_id: 최근 거래 리스트} 딕셔너리
+        """
+        if not account_ids:
+            return {}
+
+        ranked = (
+            select(
                 JournalLine.account_id,
                 JournalEntry.date,
                 JournalEntry.description,
                 JournalLine.debit,
-                JournalLine.credit
+                JournalLine.credit,
+                func.row_number()
+                .over(
+                    partition_by=JournalLine.account_id,
+                    order_by=(JournalEntry.date.desc(), JournalEntry.id.desc()),
+                )
+                .label("rank"),
             )
             .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
-            .filter(
+            .where(
                 JournalLine.account_id.in_(account_ids),
                 JournalEntry.is_deleted == False,
                 JournalEntry.date >= from_date,
                 JournalEntry.date <= to_date
             )
-            .order_by(
-                JournalLine.account_id,
-                JournalEntry.date.desc(),
-                JournalEntry.id.desc()
-            )
-            .all()
+            .subquery()
         )
+        lines = self.db.execute(
+            select(ranked)
+            .where(ranked.c.rank <= limit)
+            .order_by(ranked.c.account_id, ranked.c.rank)
+        ).all()
 
-        # 계정별로 그룹화하고 limit 적용
         recent_map: dict[int, list] = {}
         for line in lines:
-            acc_id = line.account_id
-            if acc_id not in recent_map:
-                recent_map[acc_id] = []
+            recent_map.setdefault(line.account_id, []).append({
+                "date": str(line.date),
+                "description": line.description,
+                "debit": line.debit,
+                "credit": line.credit,
+            })
 
-            if len(recent_map[acc_id]) < limit:
-                recent_map[acc_id].append({
-                    "date": str(line.date),
-                    "description": line.description,
-                    "debit": line.debit,
-                    "credit": line.credit,
-                })
+        return recent_map
 
-        return counts_map, recent_map
+    def get_recent_entries(
+        self,
+        account_id: int,
+        limit: int,
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> list[RecentEntryRecord]:
+        """
+        계정 하나의 최근 거래 (계정 원장 인덱스 역방향 LIMIT 조회)
+
+        journal_lines의 (account_id, entry_date, entry_id, id) 인덱스를 거꾸로 읽으며
+        삭제되지 않은 라인 limit건을 찾으면 멈춥니다.
+
+        Args:
+            account_id: 계정 ID
+            limit: 최대 거래 수
+            from_date: 시작일 (None이면 제한 없음)
+            to_date: 종료일 (None이면 제한 없음)
+
+        Returns:
+            최근 거래 목록 (최신순)
+        """
+        query = (
+            select(
+                JournalLine.entry_date,
+                JournalEntry.description,
+                JournalLine.debit,
+                JournalLine.credit,
+            )
+            .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+            .where(
+                JournalLine.account_id == account_id,
+                JournalEntry.is_deleted == False,
+            )
+            .order_by(
+                JournalLine.entry_date.desc(),
+                JournalLine.entry_id.desc(),
+                JournalLine.id.desc(),
+            )
+            .limit(limit)
+        )
+        if from_date is not None:
+            query = query.where(JournalLine.entry_date >= from_date)
+        if to_date is not None:
+            query = query.where(JournalLine.entry_date <= to_date)
+
+        return [
+            RecentEntryRecord(
+                date=str(row.entry_date),
+                description=row.description,
+                debit=row.debit,
+                credit=row.credit,
+            )
+            for row in self.db.execute(query)
+        ]
 
     def _calculate_period_totals(
         self,
         account_id: int,
         from_date: date,
         to_date: date
-    ) -> tuple[Decimal, Decimal]:
+    ) -> tuple[int, int]:
         """
         기간 내 차변/대변 합계 계산
 
@@ -298,12 +414,9 @@ class TrialBalanceRepository:
         )
 
         if not result:
-            return Decimal("0.00"), Decimal("0.00")
-
-        total_debit = Decimal(result.total_debit or 0)
-        total_credit = Decimal(result.total_credit or 0)
+            return 0, 0
 
-        return total_debit, total_credit
+        return result.total_debit, result.total_credit
 
     def _get_recent_transactions(
         self,
@@ -380,3 +493,88 @@ class TrialBalanceRepository:
         # 부채, 자본, 수익: 대변이 정상 잔액
         else:
             return "CREDIT"
+
+
+class ColumnarTrialBalanceRepository(TrialBalanceRepository):
+    """
+    NumPy 인메모리 엔진(ledger_columns)을 사용하는 시산표 Repository
+
+    TrialBalanceRepository와 같은 인터페이스를 제공하며, 집계를 SQL 대신
+    정렬된 int64 열의 누적합으로 계산합니다. (TRIAL_BALANCE_ENGINE=numpy)
+    이 엔진을 쓰는 동안 잔액 인덱스는 꺼지므로(balance_index_enabled) 기초/기간 합계도 열에서
+    계산하고, 열이 리포트 스냅샷보다 최신이면 SQL 경로로 대체합니다.
+    """
+
+    def _scan_period_totals(
+        self,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date
+    ) -> dict[int, tuple[int, int]]:
+        totals = ledger_columns.period_totals(self.db, account_ids, from_date, to_date, self.ledger_version)
+        if totals is None:
+            return super()._scan_period_totals(account_ids, from_date, to_date)
+        return {acc_id: (debit, credit) for acc_id, (debit, credit, _) in totals.items()}
+
+    def _scan_totals_before_period(
+        self,
+        account_ids: list[int],
+        from_date: date,
+    ) -> dict[int, tuple[int, int]]:
+        totals = ledger_columns.totals_before(self.db, account_ids, from_date, self.ledger_version)
+        if totals is None:
+            return super()._scan_totals_before_period(account_ids, from_date)
+        return totals
+
+    def _count_all_transactions(
+        self,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date
+    ) -> dict[int, int]:
+        totals = ledger_columns.period_totals(self.db, account_ids, from_date, to_date, self.ledger_version)
+        if totals is None:
+            return super()._count_all_transactions(account_ids, from_date, to_date)
+        return {acc_id: count for acc_id, (_, _, count) in totals.items()}
+
+    def _get_all_recent_transactions(
+        self,
+        account_ids: list[int],
+        from_date: date,
+        to_date: date,
+        limit: int = 5
+    ) -> dict[int, list]:
+        recent = ledger_columns.recent_lines(
+            self.db, account_ids, from_date, to_date, limit, self.ledger_version
+        )
+        if recent is None:
+            return super()._get_all_recent_transactions(account_ids, from_date, to_date, limit)
+        return recent
+
+
+def balance_index_enabled() -> bool:
+    """
+    BALANCE_INDEX=1(기본값)이면 기초/기간 합계를 계정별 잔액 인덱스로 계산
+
+    TRIAL_BALANCE_ENGINE=numpy가 켜져 있으면 열 엔진이 우선하며 인덱스는 사용(갱신)하지 않습니다.
+    (인덱스가 먼저 답하면 열 엔진의 집계 경로에 도달하지 않으므로)
+    """
+    return get_settings().balance_index_enabled and not columnar_engine_enabled()
+
+
+def columnar_engine_enabled() -> bool:
+    """TRIAL_BALANCE_ENGINE=numpy 이고 numpy가 설치된 경우 True"""
+    return get_settings().trial_balance_engine == "numpy" and numpy_available()
+
+
+def create_trial_balance_repository(db: Session) -> TrialBalanceRepository:
+    """
+    설정에 맞는 시산표 Repository 생성
+
+    numpy 엔진이 설정되었지만 numpy가 없으면 경고 후 SQL 경로를 사용합니다.
+    """
+    if get_settings().trial_balance_engine == "numpy":
+        if numpy_available():
+            return ColumnarTrialBalanceRepository(db)
+        logger.warning("numpy가 설치되어 있지 않아 SQL 시산표 엔진을 사용합니다.")
+    return TrialBalanceRepository(db)
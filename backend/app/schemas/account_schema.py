@@ -3,7 +3,7 @@
 
 계정과목 CRUD API의 요청/응답 스키마를 정의합니다.
 """
-from datetime import datetime as DateTime
+from datetime import date as Date, datetime as DateTime
 from decimal import Decimal
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -89,6 +89,16 @@ class AccountBalanceSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AccountUsageSummary(BaseModel):
+    """계정 사용 현황 요약 (삭제되지 않은 분개 기준)"""
+
+    line_count: int = Field(default=0, ge=0, description="분개 라인 수")
+    first_posted_on: Date | None = Field(default=None, description="최초 거래일")
+    last_posted_on: Date | None = Field(default=None, description="최종 거래일")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class AccountRead(AccountBase):
     """
     계정과목 조회 응답 스키마
@@ -114,6 +124,10 @@ class AccountRead(AccountBase):
         default=None,
         description="계정 잔액 요약 정보",
     )
+    usage: AccountUsageSummary | None = Field(
+        default=None,
+        description="계정 사용 현황 (라인 수, 최초/최종 거래일)",
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,36 @@
+"""
+변경 로그(Ledger Change) API 스키마
+"""
+from datetime import datetime as DateTime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LedgerChangeRead(BaseModel):
+    """변경 로그 한 건"""
+
+    seq: int = Field(..., description="변경 순번 (커밋 순서)")
+    event_type: str = Field(..., description="변경 종류 (journal_entry.created 등)")
+    entity_id: int = Field(..., description="분개 ID 또는 계정 ID")
+    ledger_version: int | None = Field(None, description="분개 변경의 원장 버전 (계정 변경은 null)")
+    payload: dict[str, Any] = Field(..., description="변경 내용 (SSE 이벤트 data와 동일)")
+    created_at: DateTime = Field(..., description="기록 시각")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LedgerChangeListResponse(BaseModel):
+    """
+    변경 로그 조회 응답
+
+    Example:
+        {
+            "changes": [{"seq": 41, "event_type": "journal_entry.created", ...}],
+            "next_since": 41,
+            "has_more": false
+        }
+    """
+    changes: list[LedgerChangeRead] = Field(..., description="순번 오름차순 변경 목록")
+    next_since: int = Field(..., description="다음 요청의 since (마지막 순번, 변경이 없으면 요청한 since)")
+    has_more: bool = Field(..., description="limit 이후에도 변경이 남아 있는지 여부")
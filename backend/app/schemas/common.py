@@ -132,21 +132,29 @@ class ErrorCode:
     RESOURCE_NOT_FOUND = "RESOURCE_NOT_FOUND"
     ACCOUNT_NOT_FOUND = "ACCOUNT_NOT_FOUND"
     JOURNAL_ENTRY_NOT_FOUND = "JOURNAL_ENTRY_NOT_FOUND"
+    REPORT_JOB_NOT_FOUND = "REPORT_JOB_NOT_FOUND"
 
     # 409 Conflict
     CONFLICT = "CONFLICT"
     DUPLICATE_CODE = "DUPLICATE_CODE"
     ACCOUNT_IN_USE = "ACCOUNT_IN_USE"
+    REPORT_NOT_READY = "REPORT_NOT_READY"
 
     # 422 Unprocessable Entity
     INVALID_FORMAT = "INVALID_FORMAT"
     INVALID_DATE_FORMAT = "INVALID_DATE_FORMAT"
     INVALID_DATE_RANGE = "INVALID_DATE_RANGE"
+    IDEMPOTENCY_KEY_REUSED = "IDEMPOTENCY_KEY_REUSED"
+    INVALID_CURSOR = "INVALID_CURSOR"
+    INVALID_CODE_RANGE = "INVALID_CODE_RANGE"
 
     # 500 Internal Server Error
     INTERNAL_ERROR = "INTERNAL_ERROR"
     DATABASE_ERROR = "DATABASE_ERROR"
 
+    # 503 Service Unavailable
+    JOURNAL_WRITE_TIMEOUT = "JOURNAL_WRITE_TIMEOUT"
+
 
 # 에러 메시지 템플릿
 class ErrorMessage:
@@ -162,14 +170,21 @@ class ErrorMessage:
     # 리소스 없음
     ACCOUNT_NOT_FOUND = "계정을 찾을 수 없습니다."
     JOURNAL_ENTRY_NOT_FOUND = "분개를 찾을 수 없습니다."
+    REPORT_JOB_NOT_FOUND = "리포트 작업을 찾을 수 없습니다."
 
     # 충돌
     DUPLICATE_CODE = "이미 사용 중인 계정 코드입니다."
     ACCOUNT_IN_USE = "이미 분개에서 사용 중인 계정은 삭제할 수 없습니다."
+    REPORT_NOT_READY = "리포트가 아직 완료되지 않았습니다."
 
     # 형식 오류
     INVALID_DATE_FORMAT = "날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)"
     INVALID_DATE_RANGE = "시작 날짜는 종료 날짜보다 이전이어야 합니다."
+    IDEMPOTENCY_KEY_REUSED = "같은 Idempotency-Key로 다른 요청이 전송되었습니다."
+    INVALID_CURSOR = "페이지 커서가 올바르지 않습니다."
+    INVALID_CODE_RANGE = "시작 계정 코드는 종료 계정 코드보다 앞서야 합니다."
 
     # 서버 오류
     INTERNAL_ERROR = "서버 오류가 발생했습니다. 관리자에게 문의하세요."
+    DATABASE_ERROR = "데이터베이스 처리 중 오류가 발생했습니다."
+    JOURNAL_WRITE_TIMEOUT = "분개 저장이 지연되고 있습니다. 같은 Idempotency-Key로 다시 시도하세요."
@@ -14,7 +14,9 @@ class GeneralLedgerEntry(BaseModel):
     description: str = Field(..., description="적요")
     debit: DecimalType = Field(..., ge=0, description="차변 금액")
     credit: DecimalType = Field(..., ge=0, description="대변 금액")
-    balance: DecimalType = Field(..., description="누적 잔액")
+    balance: DecimalType = Field(
+        ..., description="누적 잔액 (search 지정 시 기초 잔액 + 검색 결과만의 누적 합계)"
+    )
 
 
 class GeneralLedgerResponse(BaseModel):
@@ -26,3 +28,8 @@ class GeneralLedgerResponse(BaseModel):
     current: CurrentPeriod = Field(..., description="기중 차변/대변 합계")
     closing_balance: BalanceAmount = Field(..., description="기말 잔액")
     entries: list[GeneralLedgerEntry] = Field(..., description="계정별 원장 행")
+    page_opening_balance: BalanceAmount | None = Field(
+        None, description="페이지 첫 행 직전 누적 잔액 (limit 지정 시)"
+    )
+    next_cursor: str | None = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    ledger_version: int = Field(..., description="조회에 사용한 원장 버전")
@@ -168,6 +168,42 @@ class JournalEntryRead(JournalEntryBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ArchivedJournalLineRead(JournalLineBase):
+    """보관 분개 라인 조회 응답 스키마"""
+    id: int
+    created_at: DateTime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ArchivedJournalEntryRead(JournalEntryBase):
+    """
+    보관 분개 조회 응답 스키마
+
+    soft-delete 후 보관 테이블로 옮겨진 분개입니다.
+
+    Example:
+        {
+            "id": 3,
+            "date": "2025-01-05",
+            "description": "급여 지급",
+            "is_deleted": true,
+            "created_at": "2025-01-05T10:00:00",
+            "deleted_at": "2025-01-06T09:00:00",
+            "archived_at": "2025-04-07T03:00:00",
+            "lines": [...]
+        }
+    """
+    id: int
+    is_deleted: bool = Field(default=True, description="삭제 여부 (보관 분개는 항상 true)")
+    created_at: DateTime
+    deleted_at: DateTime
+    archived_at: DateTime
+    lines: list[ArchivedJournalLineRead]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class JournalEntrySummary(JournalEntryBase):
     """
     분개 목록 조회용 요약 스키마
@@ -0,0 +1,75 @@
+"""
+리포트 작업(Report Job) API 스키마
+
+리포트 작업 제출/상태 조회 스키마를 정의합니다.
+"""
+from datetime import date as Date, datetime as DateTime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.models.report_job import ReportJobKind, ReportJobStatus
+
+
+class ReportJobCreate(BaseModel):
+    """
+    리포트 작업 제출 스키마
+
+    Example:
+        {
+            "kind": "GENERAL_LEDGER",
+            "from": "2025-01-01",
+            "to": "2025-12-31",
+            "account_id": 1
+        }
+    """
+    kind: ReportJobKind = Field(..., description="리포트 종류")
+    from_date: Date = Field(..., alias="from", description="시작일 (YYYY-MM-DD)")
+    to_date: Date = Field(..., alias="to", description="종료일 (YYYY-MM-DD)")
+    account_id: int | None = Field(None, description="계정 ID (GENERAL_LEDGER 필수)")
+    search: str | None = Field(None, max_length=100, description="전표 ID 또는 적요 검색 (GENERAL_LEDGER)")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @model_validator(mode="after")
+    def validate_params(self):
+        """원장 리포트는 계정 ID가 필요합니다."""
+        if self.kind == ReportJobKind.GENERAL_LEDGER and self.account_id is None:
+            raise ValueError("GENERAL_LEDGER 리포트에는 account_id가 필요합니다.")
+        return self
+
+    def to_params(self) -> dict[str, Any]:
+        """작업 테이블에 저장할 파라미터 (JSON 직렬화 가능)"""
+        params: dict[str, Any] = {
+            "from": self.from_date.isoformat(),
+            "to": self.to_date.isoformat(),
+        }
+        if self.kind == ReportJobKind.GENERAL_LEDGER:
+            params["account_id"] = self.account_id
+            params["search"] = self.search
+        return params
+
+
+class ReportJobRead(BaseModel):
+    """
+    리포트 작업 상태 응답 스키마
+
+    download_url은 SUCCEEDED 상태일 때만 채워집니다.
+    """
+    id: str
+    kind: ReportJobKind
+    status: ReportJobStatus
+    params: dict[str, Any]
+    error: str | None = None
+    created_at: DateTime
+    started_at: DateTime | None = None
+    finished_at: DateTime | None = None
+    download_url: str | None = Field(None, description="결과 다운로드 경로")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="after")
+    def fill_download_url(self):
+        if self.status == ReportJobStatus.SUCCEEDED:
+            self.download_url = f"/api/v1/report-jobs/{self.id}/download"
+        return self
@@ -89,7 +89,10 @@ class TrialBalanceRow(BaseModel):
     ending_balance: BalanceAmount = Field(..., description="기말 잔액")
 
     transaction_count: int = Field(..., ge=0, description="거래 건수")
-    recent_entries: list[RecentEntry] = Field(default_factory=list, description="최근 거래 내역")
+    recent_entries: list[RecentEntry] = Field(
+        default_factory=list,
+        description="최근 거래 내역 (include_recent=true일 때만 채움)",
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -156,6 +159,7 @@ class TrialBalanceResponse(BaseModel):
     period: TrialBalancePeriod = Field(..., description="조회 기간")
     rows: list[TrialBalanceRow] = Field(..., description="계정별 시산표 행")
     total: TrialBalanceTotal = Field(..., description="합계 정보")
+    ledger_version: int = Field(..., description="집계에 사용한 원장 버전 (같은 버전이면 같은 결과)")
 
     class Config:
         json_schema_extra = {
@@ -191,3 +195,19 @@ class TrialBalanceResponse(BaseModel):
                 }
             }
         }
+
+
+class TrialBalanceRecentResponse(BaseModel):
+    """
+    계정별 최근 거래 응답 스키마 (시산표 상세 펼침용)
+
+    Example:
+        {
+            "account_id": 1,
+            "entries": [
+                {"date": "2025-01-31", "description": "매출", "debit": 0, "credit": 500000}
+            ]
+        }
+    """
+    account_id: int = Field(..., description="계정 ID")
+    entries: list[RecentEntry] = Field(..., description="최근 거래 내역 (최신순)")
@@ -9,6 +9,7 @@ if str(ROOT_DIR) not in sys.path:
 
 from app.core.database import session_scope
 from app.models import Account, JournalEntry, JournalLine
+from app.repositories.running_balance_repo import RunningBalanceRepository
 from app.seed_accounts import seed_accounts
 from app.services.account_balance_service import AccountBalanceService
 
@@ -78,37 +79,40 @@ def seed_sample_entries():
         if missing_codes:
             raise RuntimeError(f"Missing accounts for codes: {', '.join(sorted(missing_codes))}")
 
-        affected_account_ids = set()
-
-        for entry_payload in SAMPLE_ENTRIES:
-            exists = (
-                session.query(JournalEntry)
-                .filter(JournalEntry.description == entry_payload["description"])
-                .first()
-            )
-            if exists:
-                continue
+        # 분개마다 재계산하지 않고 종료 시 한 번에 재계산
+        balance_service = AccountBalanceService(session)
+        with balance_service.batch():
+            for entry_payload in SAMPLE_ENTRIES:
+                exists = (
+                    session.query(JournalEntry)
+                    .filter(JournalEntry.description == entry_payload["description"])
+                    .first()
+                )
+                if exists:
+                    continue
 
-            entry = JournalEntry(description=entry_payload["description"], date=entry_payload["date"])
-            session.add(entry)
-            session.flush()
+                entry = JournalEntry(description=entry_payload["description"], date=entry_payload["date"])
+                session.add(entry)
+                session.flush()
 
-            for line_payload in entry_payload["lines"]:
-                account = accounts_by_code[line_payload["account_code"]]
-                affected_account_ids.add(account.id)
-                session.add(
-                    JournalLine(
-                        entry_id=entry.id,
-                        account_id=account.id,
-                        debit=line_payload["debit"],
-                        credit=line_payload["credit"],
+                for line_payload in entry_payload["lines"]:
+                    account = accounts_by_code[line_payload["account_code"]]
+                    session.add(
+                        JournalLine(
+                            entry_id=entry.id,
+                            account_id=account.id,
+                            debit=line_payload["debit"],
+                            credit=line_payload["credit"],
+                            entry_date=entry.date,
+                        )
                     )
+                balance_service.request_recalculation(
+                    accounts_by_code[line["account_code"]].id for line in entry_payload["lines"]
                 )
 
-        # 잔액 재계산
-        if affected_account_ids:
-            balance_service = AccountBalanceService(session)
-            balance_service.recalculate_balances(affected_account_ids)
+        # 분개를 직접 넣었으므로 러닝 잔액도 한 번에 재계산
+        session.flush()
+        RunningBalanceRepository(session).resequence()
 
 
 if __name__ == "__main__":
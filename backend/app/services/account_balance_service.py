@@ -1,29 +1,55 @@
 """
 계정 잔액(Account Balance) Service
 
-계정별 차변/대변 합계와 잔액을 요약 테이블에 저장합니다.
+계정별 차변/대변 합계와 잔액, 사용 현황(라인 수, 최초/최종 거래일)을 요약 테이블에 저장합니다.
 """
 from __future__ import annotations
 
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from decimal import Decimal
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, event, func, literal, select, true
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
+from app.core.config import get_settings
+from app.core.database import dialect_insert
 from app.models.account import Account
 from app.models.account_balance import AccountBalance
+from app.models.account_usage import AccountUsage
+from app.models.balance_recalc_outbox import BalanceRecalcOutbox
 from app.models.journal_entry import JournalEntry
 from app.models.journal_line import JournalLine
 
+_BATCH_KEY = "balance_recalc_batch"
+
+
+@dataclass
+class _RecalcBatch:
+    """batch() 컨텍스트 동안 모아 둔 재계산 대상"""
+
+    account_ids: set[int] = field(default_factory=set)
+    full: bool = False
+    # 블록 안에서 이미 커밋된 변경의 재계산 대상 (블록이 실패해도 반드시 처리)
+    committed_ids: set[int] = field(default_factory=set)
+    committed_full: bool = False
+
+    def mark_committed(self) -> None:
+        self.committed_ids |= self.account_ids
+        self.committed_full = self.committed_full or self.full
+        self.account_ids = set()
+        self.full = False
+
 
 class AccountBalanceService:
     """
     계정 잔액 요약 서비스
 
-    분개 변경 시 영향받는 계정의 차변/대변 합계와 잔액을 재계산하여
-    account_balances 테이블을 최신 상태로 유지합니다.
+    분개 변경 시 영향받는 계정의 차변/대변 합계와 잔액, 사용 현황을 재계산하여
+    account_balances / account_usage 테이블을 최신 상태로 유지합니다.
     """
 
     def __init__(self, db: Session):
@@ -33,92 +59,239 @@ class AccountBalanceService:
         """
         self.db = db
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        재계산 병합 컨텍스트
+
+        블록 안에서 발생한 재계산 요청(request_recalculation, recalculate_balances)은
+        즉시 실행되지 않고 계정 ID만 모아 두었다가, 블록이 정상 종료될 때
+        한 번의 집계로 재계산합니다. 상태는 세션(Session.info)에 저장되므로
+        같은 세션을 쓰는 다른 서비스의 요청도 함께 병합됩니다.
+        정상 종료 시 커밋은 호출자가 담당합니다.
+
+        블록 안의 서비스 호출이 각자 커밋할 수 있으므로(@with_transaction) 커밋된 변경의 대상은
+        따로 기억합니다. 블록이 예외로 끝나면 커밋되지 않은 작업은 롤백하고, 이미 커밋된 변경의
+        계정만 재계산해 커밋한 뒤 예외를 다시 던집니다. (요약 행이 누락되지 않도록)
+
+        사용 예:
+            with AccountBalanceService(session).batch():
+                for payload in payloads:
+                    journal_service.create_entry(payload)
+            session.commit()
+        """
+        if _BATCH_KEY in self.db.info:
+            # 바깥 batch가 종료될 때 함께 처리
+            yield
+            return
+
+        pending = _RecalcBatch()
+        self.db.info[_BATCH_KEY] = pending
+        if not event.contains(self.db, "after_commit", _mark_batch_committed):
+            event.listen(self.db, "after_commit", _mark_batch_committed)
+        try:
+            yield
+        except Exception:
+            self.db.info.pop(_BATCH_KEY, None)
+            self.db.rollback()
+            if pending.committed_full or pending.committed_ids:
+                self._apply_recalculation(None if pending.committed_full else pending.committed_ids)
+                self.db.commit()
+            raise
+        finally:
+            self.db.info.pop(_BATCH_KEY, None)
+
+        # 블록 안에서 추가된 라인이 집계에 포함되도록 먼저 flush
+        self.db.flush()
+        if pending.full or pending.committed_full:
+            self._apply_recalculation(None)
+        elif pending.account_ids or pending.committed_ids:
+            self._apply_recalculation(pending.account_ids | pending.committed_ids)
+        self.db.flush()
+
+    def request_recalculation(
+        self,
+        account_ids: Iterable[int],
+        read_your_writes: bool = False,
+    ) -> None:
+        """
+        잔액 재계산 요청
+
+        기본(sync) 모드에서는 즉시 재계산합니다. background 모드에서는 현재
+        트랜잭션에 아웃박스 행만 기록하고, 커밋 후 워커가 계정별로 병합해 처리합니다.
+
+        Args:
+            account_ids: 재계산할 계정 ID 목록
+            read_your_writes: True면 모드와 관계없이 즉시 재계산 (응답 직후 잔액 조회용)
+        """
+        unique_ids = {acc_id for acc_id in account_ids if acc_id is not None}
+        if not unique_ids:
+            return
+
+        if _BATCH_KEY in self.db.info:
+            self.recalculate_balances(unique_ids)
+            return
+
+        if read_your_writes or get_settings().balance_recalc_mode != "background":
+            self.recalculate_balances(unique_ids)
+            return
+
+        now = datetime.utcnow()
+        stmt = dialect_insert(self.db, BalanceRecalcOutbox).values(
+            [{"account_id": acc_id, "requested_at": now} for acc_id in sorted(unique_ids)]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BalanceRecalcOutbox.account_id],
+            set_={"requested_at": stmt.excluded.requested_at},
+        )
+        self.db.execute(stmt)
+        # 세션이 재사용되어도 커밋마다 워커를 깨우도록 상시 리스너로 등록
+        if not event.contains(self.db, "after_commit", _notify_balance_worker):
+            event.listen(self.db, "after_commit", _notify_balance_worker)
+
     def recalculate_balances(self, account_ids: Iterable[int] | None = None) -> None:
         """
         지정된 계정(또는 전체 계정)의 차변/대변 합계와 잔액을 재계산합니다.
 
+        batch() 컨텍스트 안에서는 대상 계정만 기록하고 종료 시점에 한 번에 처리합니다.
+
         Args:
             account_ids: 재계산할 계정 ID 목록. None이면 전체 계정.
         """
-        accounts_query = self.db.query(Account)
-        id_list: Sequence[int] | None = None
+        pending: _RecalcBatch | None = self.db.info.get(_BATCH_KEY)
+        if pending is not None:
+            if account_ids is None:
+                pending.full = True
+            else:
+                pending.account_ids.update(acc_id for acc_id in account_ids if acc_id is not None)
+            return
+
+        self._apply_recalculation(account_ids)
+
+    def _apply_recalculation(self, account_ids: Iterable[int] | None) -> None:
+        """
+        계정 잔액/사용 현황 재계산을 실제로 수행합니다.
 
+        ORM 객체를 계정마다 만들지 않고 요약 테이블마다 집계와 저장을 한 문장으로 처리합니다.
+            INSERT INTO account_balances (...)
+            SELECT accounts.id, SUM(...) ... GROUP BY
+            ON CONFLICT (account_id) DO UPDATE SET ...
+        """
+        id_list: list[int] | None = None
         if account_ids is not None:
-            unique_ids = {acc_id for acc_id in account_ids if acc_id is not None}
-            if not unique_ids:
+            id_list = sorted({acc_id for acc_id in account_ids if acc_id is not None})
+            if not id_list:
                 return
-            id_list = list(unique_ids)
-            accounts_query = accounts_query.filter(Account.id.in_(id_list))
 
-        accounts = accounts_query.all()
-        if not accounts:
-            return
+        line_totals = self._line_totals_subquery(id_list)
+        total_debit = func.coalesce(line_totals.c.total_debit, 0)
+        total_credit = func.coalesce(line_totals.c.total_credit, 0)
+        now = literal(datetime.utcnow(), DateTime)
 
-        if id_list is None:
-            id_list = [account.id for account in accounts]
+        self._upsert_summary(
+            AccountBalance,
+            "balance_summary",
+            {
+                "total_debit": total_debit,
+                "total_credit": total_credit,
+                "balance": total_debit - total_credit,
+                "updated_at": now,
+            },
+            line_totals,
+            id_list,
+        )
+        self._upsert_summary(
+            AccountUsage,
+            "usage",
+            {
+                "line_count": func.coalesce(line_totals.c.line_count, 0),
+                "first_posted_on": line_totals.c.first_posted_on,
+                "last_posted_on": line_totals.c.last_posted_on,
+                "updated_at": now,
+            },
+            line_totals,
+            id_list,
+        )
 
-        aggregates = self._fetch_aggregates(id_list)
-        existing_map = self._fetch_existing_records(id_list)
-        now = datetime.utcnow()
+    def _upsert_summary(
+        self,
+        model,
+        relationship_name: str,
+        values: dict,
+        line_totals,
+        id_list: list[int] | None,
+    ) -> None:
+        """계정별 요약 테이블 하나를 INSERT ... SELECT ... ON CONFLICT로 갱신합니다."""
+        source = (
+            select(Account.id, *values.values())
+            .outerjoin(line_totals, line_totals.c.account_id == Account.id)
+            # SQLite는 INSERT ... SELECT ... ON CONFLICT 구문에 WHERE 절이 필요합니다.
+            .where(Account.id.in_(id_list) if id_list is not None else true())
+        )
 
-        for account in accounts:
-            total_debit, total_credit = aggregates.get(
-                account.id, (Decimal("0"), Decimal("0"))
-            )
-            balance_value = total_debit - total_credit
-
-            record = existing_map.get(account.id)
-            if record:
-                record.total_debit = total_debit
-                record.total_credit = total_credit
-                record.balance = balance_value
-                record.updated_at = now
-            else:
-                record = AccountBalance(
-                    account_id=account.id,
-                    total_debit=total_debit,
-                    total_credit=total_credit,
-                    balance=balance_value,
-                    updated_at=now,
-                )
-                self.db.add(record)
+        stmt = dialect_insert(self.db, model).from_select(["account_id", *values], source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.account_id],
+            set_={column: stmt.excluded[column] for column in values},
+        ).returning(
+            model.account_id,
+            *(getattr(model, column) for column in values),
+        )
 
-    def _fetch_aggregates(self, account_ids: Sequence[int]) -> dict[int, tuple[Decimal, Decimal]]:
-        """분개 라인에서 계정별 차변/대변 합계를 계산합니다."""
-        if not account_ids:
-            return {}
+        self._sync_identity_map(model, relationship_name, self.db.execute(stmt).all())
 
-        totals = (
-            self.db.query(
+    def _line_totals_subquery(self, account_ids: Sequence[int] | None):
+        """삭제되지 않은 분개 라인의 계정별 합계/건수/거래일 범위 서브쿼리"""
+        query = (
+            select(
                 JournalLine.account_id,
-                func.coalesce(func.sum(JournalLine.debit), 0).label("total_debit"),
-                func.coalesce(func.sum(JournalLine.credit), 0).label("total_credit"),
+                func.sum(JournalLine.debit).label("total_debit"),
+                func.sum(JournalLine.credit).label("total_credit"),
+                func.count(JournalLine.id).label("line_count"),
+                func.min(JournalEntry.date).label("first_posted_on"),
+                func.max(JournalEntry.date).label("last_posted_on"),
             )
             .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
-            .filter(
-                JournalLine.account_id.in_(account_ids),
-                JournalEntry.is_deleted == False,
-            )
+            .where(JournalEntry.is_deleted == False)
             .group_by(JournalLine.account_id)
-            .all()
         )
+        if account_ids is not None:
+            query = query.where(JournalLine.account_id.in_(account_ids))
+        return query.subquery()
 
-        return {
-            row.account_id: (
-                Decimal(row.total_debit or 0),
-                Decimal(row.total_credit or 0),
-            )
-            for row in totals
-        }
-
-    def _fetch_existing_records(self, account_ids: Sequence[int]) -> dict[int, AccountBalance]:
-        """기존 잔액 레코드를 조회해 딕셔너리로 반환합니다."""
-        if not account_ids:
-            return {}
-
-        records = (
-            self.db.query(AccountBalance)
-            .filter(AccountBalance.account_id.in_(account_ids))
-            .all()
-        )
-        return {record.account_id: record for record in records}
+    def _sync_identity_map(self, model, relationship_name: str, rows) -> None:
+        """
+        RETURNING 결과로 세션에 이미 로드된 객체만 갱신합니다.
+
+        - 로드된 요약 객체는 값만 교체 (추가 SELECT 없음)
+        - 요약 객체가 없던 Account에는 새 요약 객체를 연결
+        """
+        for row in rows:
+            values = row._asdict()
+            record = self.db.identity_map.get(identity_key(model, row.account_id))
+            if record is not None:
+                for key, value in values.items():
+                    set_committed_value(record, key, value)
+                continue
+
+            account = self.db.identity_map.get(identity_key(Account, row.account_id))
+            if account is not None:
+                # 이미 DB에 기록된 행이므로 INSERT 없이 persistent 상태로 세션에 연결
+                record = model(**values)
+                make_transient_to_detached(record)
+                self.db.add(record)
+                set_committed_value(account, relationship_name, record)
+
+
+def _mark_batch_committed(session: Session) -> None:
+    """batch() 진행 중 커밋되면 그때까지 모은 대상을 커밋된 대상으로 옮깁니다."""
+    pending: _RecalcBatch | None = session.info.get(_BATCH_KEY)
+    if pending is not None:
+        pending.mark_committed()
+
+
+def _notify_balance_worker(session: Session) -> None:
+    """커밋된 아웃박스 행을 처리하도록 워커를 깨웁니다."""
+    from app.services.balance_recalc_worker import balance_worker
+
+    balance_worker.notify()
@@ -5,11 +5,15 @@
 """
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
+from app.repositories.account_catalog import account_catalog
 from app.repositories.account_repo import AccountRepository
+from app.repositories.ledger_state_repo import LedgerStateRepository
 from app.schemas.account_schema import AccountCreate, AccountUpdate
 from app.schemas.common import ErrorCode, ErrorMessage
 from app.core.exceptions import conflict, not_found, with_transaction, bad_request
 from app.services.account_balance_service import AccountBalanceService
+from app.services.ledger_events import ledger_events
 
 
 class AccountService:
@@ -27,6 +31,7 @@ class AccountService:
         self.db = db
         self.repo = AccountRepository(db)
         self.balance_service = AccountBalanceService(db)
+        self.ledger_state_repo = LedgerStateRepository(db)
 
     def list_accounts(self, include_inactive: bool = False):
         """
@@ -88,6 +93,8 @@ class AccountService:
         # 계정 생성 및 초기 잔액 설정
         account = self.repo.create_account(payload)
         self.balance_service.recalculate_balances({account.id})
+        account_catalog.invalidate_on_commit(self.db)
+        self._publish("account.created", account)
 
         return account
 
@@ -107,14 +114,17 @@ class AccountService:
             HTTPException(404): 계정을 찾을 수 없는 경우
         """
         account = self.get_account(account_id)
-        return self.repo.update_account(account, payload)
+        account_catalog.invalidate_on_commit(self.db)
+        updated = self.repo.update_account(account, payload)
+        self._publish("account.updated", updated)
+        return updated
 
     @with_transaction
     def deactivate_account(self, account_id: int, activate: bool = False):
         """
         계정과목 비활성화/재활성화 (soft-delete)
 
-        사용 중인 계정은 비활성화할 수 없습니다.
+        사용 중인 계정(삭제되지 않은 분개에서 사용)은 비활성화할 수 없습니다.
 
         Args:
             account_id: 계정 ID
@@ -129,9 +139,9 @@ class AccountService:
         """
         account = self.get_account(account_id)
 
-        # 비활성화 시도 시 사용 중인지 확인
-        if not activate and self.repo.is_account_in_use(account_id):
-            usage_count = self.repo.get_usage_count(account_id)
+        # 비활성화 시도 시 사용 중인지 확인 (account_usage 요약 사용 - COUNT 쿼리 없음)
+        usage_count = account.usage.line_count if account.usage else 0
+        if not activate and usage_count > 0:
             raise conflict(
                 ErrorCode.ACCOUNT_IN_USE,
                 ErrorMessage.ACCOUNT_IN_USE,
@@ -140,6 +150,37 @@ class AccountService:
                     "usage_count": usage_count
                 }
             )
+        # 백그라운드 재계산 모드에서는 아웃박스에 남은 계정의 요약이 아직 0일 수 있으므로
+        # 분개 라인을 직접 확인 (워커는 요약 갱신과 아웃박스 삭제를 한 트랜잭션에서 커밋)
+        # sync 모드는 요약이 분개와 같은 트랜잭션에서 갱신되므로 추가 쿼리 없음
+        if (
+            not activate
+            and get_settings().balance_recalc_mode == "background"
+            and self.repo.has_pending_recalculation(account_id)
+            and self.repo.has_live_lines(account_id)
+        ):
+            raise conflict(
+                ErrorCode.ACCOUNT_IN_USE,
+                ErrorMessage.ACCOUNT_IN_USE,
+                {
+                    "account_id": account_id,
+                    "usage_pending": True
+                }
+            )
 
         target_status = activate  # True면 활성화, False면 비활성화
-        return self.repo.set_account_status(account, target_status)
+        account_catalog.invalidate_on_commit(self.db)
+        updated = self.repo.set_account_status(account, target_status)
+        self._publish("account.updated", updated)
+        return updated
+
+    def _publish(self, event_type: str, account) -> None:
+        """계정 변경을 변경 로그에 기록하고 이벤트(SSE)를 커밋 후 발행하도록 예약"""
+        stamp = self.ledger_state_repo.bump(journal_change=False)
+        ledger_events.record(
+            self.db,
+            stamp.change_seq,
+            event_type,
+            account.id,
+            {"account_id": account.id, "code": account.code, "is_active": account.is_active},
+        )
@@ -0,0 +1,252 @@
+"""
+계정 잔액 병렬 전체 재구성(Balance Rebuilder) Service
+
+마이그레이션 직후나 무결성 검사에서 차이가 발견된 뒤 account_balances / account_usage를
+처음부터 다시 만듭니다. 요청 경로 밖(CLI: python -m app.rebuild_balances)에서 실행합니다.
+
+1. 집계: 라인 ID 범위를 partitions개 구간으로 나누고, 구간마다 워커 프로세스가 자체 읽기
+   연결로 계정별 부분 합계(차변, 대변, 라인 수, 최초/최종 거래일)를 집계합니다.
+2. 병합: 부분 합계를 계정별로 합칩니다.
+3. 쓰기: 하나의 쓰기 트랜잭션에서 전체 계정의 요약 행을 배치 UPSERT로 저장하고,
+   같은 트랜잭션에서 라인별 러닝 잔액(journal_lines.running_balance)도 다시 계산합니다.
+
+워커들의 읽기는 하나의 스냅샷이 아니므로, 집계 시작 이후 커밋된 분개 변경은 변경 로그
+(ledger_changes)로 찾아 쓰기 트랜잭션 안에서 해당 계정만 SQL로 다시 계산합니다.
+쓰기 트랜잭션은 시작부터 원장 쓰기를 막으므로(SQLite BEGIN IMMEDIATE, PostgreSQL
+ledger_state 행 잠금) 커밋 시점의 요약과 러닝 잔액은 분개 라인과 일치합니다.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.database import dialect_insert
+from app.models.account_balance import AccountBalance
+from app.models.account_usage import AccountUsage
+from app.repositories.balance_integrity_repo import BalanceIntegrityRepository, LineSummary
+from app.repositories.ledger_change_repo import LedgerChangeRepository
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.repositories.running_balance_repo import RunningBalanceRepository
+from app.services.account_balance_service import AccountBalanceService
+
+# 변경 로그를 한 번에 읽는 건수
+_CHANGE_PAGE = 1000
+
+
+@dataclass
+class RebuildReport:
+    """재구성 결과"""
+
+    partitions: int
+    workers: int
+    lines: int
+    accounts: int
+    reconciled_accounts: int
+    scan_seconds: float
+    write_seconds: float
+
+    @property
+    def elapsed(self) -> float:
+        return self.scan_seconds + self.write_seconds
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+
+class BalanceRebuilder:
+    """
+    계정 잔액 병렬 전체 재구성기
+
+    사용 예:
+        report = BalanceRebuilder(session, workers=4).run()
+    """
+
+    def __init__(self, db: Session, workers: int | None = None, partitions: int | None = None):
+        """
+        Args:
+            db: 재구성에 사용할 세션 (트랜잭션을 직접 끝내므로 다른 작업과 공유하지 않음)
+            workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 집계)
+            partitions: 라인 ID 구간 수 (None이면 워커 수의 4배 - 구간 크기 편차를 흡수)
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+        if partitions is not None and partitions < 1:
+            raise ValueError("partitions는 1 이상이어야 합니다.")
+        self.db = db
+        self.workers = workers
+        self.partitions = partitions if partitions is not None else workers * 4
+        self.repo = BalanceIntegrityRepository(db)
+
+    def run(self) -> RebuildReport:
+        """전체 재구성 실행 (커밋까지 수행)"""
+        started = time.perf_counter()
+        try:
+            start_seq = LedgerStateRepository(self.db).change_seq()
+            low, high = self.repo.line_id_range()
+        finally:
+            self.db.rollback()
+
+        bounds = _partition_bounds(low, high, self.partitions)
+        summaries = self._scan(bounds)
+        scanned = time.perf_counter()
+
+        try:
+            self._lock_ledger()
+            account_ids = self.repo.account_ids()
+            self._write(account_ids, summaries)
+            reconciled = self._changed_accounts(start_seq)
+            if reconciled:
+                AccountBalanceService(self.db).recalculate_balances(reconciled)
+            RunningBalanceRepository(self.db).resequence()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return RebuildReport(
+            partitions=len(bounds),
+            workers=self.workers if self._uses_pool(bounds) else 1,
+            lines=sum(summary[2] for summary in summaries.values()),
+            accounts=len(account_ids),
+            reconciled_accounts=len(reconciled),
+            scan_seconds=scanned - started,
+            write_seconds=time.perf_counter() - scanned,
+        )
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+    def _scan(self, bounds: list[tuple[int, int]]) -> dict[int, LineSummary]:
+        """구간별 부분 합계를 집계해 계정별로 병합합니다."""
+        merged: dict[int, LineSummary] = {}
+        if not self._uses_pool(bounds):
+            for after, upper in bounds:
+                try:
+                    _merge(merged, self.repo.partition_summaries(after, upper))
+                finally:
+                    self.db.rollback()
+            return merged
+
+        database_url = self.db.get_bind().url.render_as_string(hide_password=False)
+        # 부모 프로세스의 스레드(워커, 연결 풀) 상태를 물려받지 않도록 spawn으로 시작
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(bounds)), mp_context=context) as pool:
+            futures = [pool.submit(_scan_partition, database_url, after, upper) for after, upper in bounds]
+            for future in as_completed(futures):
+                _merge(merged, future.result())
+        return merged
+
+    def _uses_pool(self, bounds: list[tuple[int, int]]) -> bool:
+        if self.workers < 2 or len(bounds) < 2:
+            return False
+        url = self.db.get_bind().url
+        # 인메모리 SQLite는 다른 프로세스에서 열 수 없음
+        return not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"))
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def _lock_ledger(self) -> None:
+        """쓰기 트랜잭션을 시작하고 커밋까지 다른 원장 쓰기를 막습니다."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            self.db.execute(text("BEGIN IMMEDIATE"))
+        LedgerStateRepository(self.db).change_seq(lock=True)
+
+    def _write(self, account_ids: list[int], summaries: dict[int, LineSummary]) -> None:
+        """전체 계정의 요약 행을 배치 UPSERT로 저장합니다. (라인이 없는 계정은 0)"""
+        now = datetime.utcnow()
+        balances, usages = [], []
+        for account_id in account_ids:
+            debit, credit, count, first, last = summaries.get(account_id, (0, 0, 0, None, None))
+            balances.append(
+                {
+                    "account_id": account_id,
+                    "total_debit": debit,
+                    "total_credit": credit,
+                    "balance": debit - credit,
+                    "updated_at": now,
+                }
+            )
+            usages.append(
+                {
+                    "account_id": account_id,
+                    "line_count": count,
+                    "first_posted_on": first,
+                    "last_posted_on": last,
+                    "updated_at": now,
+                }
+            )
+        self._upsert(AccountBalance, balances)
+        self._upsert(AccountUsage, usages)
+
+    def _upsert(self, model, rows: list[dict]) -> None:
+        """executemany UPSERT (드라이버가 여러 행씩 묶어 실행)"""
+        if not rows:
+            return
+        stmt = dialect_insert(self.db, model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.account_id],
+            set_={column: stmt.excluded[column] for column in rows[0] if column != "account_id"},
+        )
+        self.db.execute(stmt, rows)
+
+    def _changed_accounts(self, since: int) -> set[int]:
+        """집계 시작 이후 커밋된 분개 변경이 영향을 준 계정"""
+        repo = LedgerChangeRepository(self.db)
+        account_ids: set[int] = set()
+        while True:
+            changes = repo.list_since(since, _CHANGE_PAGE)
+            for change in changes:
+                if change.event_type.startswith("journal_entry."):
+                    account_ids.update(change.payload.get("account_ids", ()))
+            if len(changes) < _CHANGE_PAGE:
+                return account_ids
+            since = changes[-1].seq
+
+
+def _partition_bounds(low: int, high: int, partitions: int) -> list[tuple[int, int]]:
+    """라인 ID [low, high]를 partitions개의 (after, upper] 구간으로 균등 분할"""
+    if high < low or high == 0:
+        return []
+    step = -(-(high - low + 1) // partitions)
+    return [(after, min(after + step, high)) for after in range(low - 1, high, step)]
+
+
+def _merge(merged: dict[int, LineSummary], partial: dict[int, LineSummary]) -> None:
+    for account_id, (debit, credit, count, first, last) in partial.items():
+        current = merged.get(account_id)
+        if current is None:
+            merged[account_id] = (debit, credit, count, first, last)
+            continue
+        merged[account_id] = (
+            current[0] + debit,
+            current[1] + credit,
+            current[2] + count,
+            min(_dates(current[3], first)),
+            max(_dates(current[4], last)),
+        )
+
+
+def _dates(*values) -> Iterable:
+    return [value for value in values if value is not None] or [None]
+
+
+def _scan_partition(database_url: str, after: int, upper: int) -> dict[int, LineSummary]:
+    """워커 프로세스: 자체 읽기 연결로 라인 ID (after, upper] 구간을 집계합니다."""
+    engine = create_engine(database_url, poolclass=NullPool, future=True)
+    try:
+        with Session(engine) as session:
+            return BalanceIntegrityRepository(session).partition_summaries(after, upper)
+    finally:
+        engine.dispose()
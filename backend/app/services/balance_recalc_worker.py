@@ -0,0 +1,132 @@
+"""
+잔액 재계산 백그라운드 워커
+
+balance_recalc_outbox 테이블에 쌓인 계정을 모아 요청 경로 밖에서 재계산합니다.
+아웃박스는 분개와 같은 트랜잭션에 기록되므로 서버가 재시작되어도 요청이 유실되지 않습니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+from sqlalchemy import delete, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.balance_recalc_outbox import BalanceRecalcOutbox
+from app.services.account_balance_service import AccountBalanceService
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceRecalcWorker:
+    """
+    아웃박스 기반 잔액 재계산 워커 (스레드 1개)
+
+    - notify() 호출 또는 poll_interval 경과 시 깨어나 아웃박스를 비웁니다.
+    - 한 번의 배치에서 계정별 요청은 이미 한 행으로 병합되어 있으므로
+      계정마다 재계산은 한 번만 수행됩니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        poll_interval: float = 1.0,
+        batch_size: int = 500,
+    ):
+        self._session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """워커 스레드 시작 (재시작 전 남아 있던 아웃박스도 바로 처리)"""
+        if self.is_running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="balance-recalc-worker", daemon=True
+        )
+        self._thread.start()
+        self.notify()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """워커 스레드 종료"""
+        if not self._thread:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def notify(self) -> None:
+        """처리할 아웃박스가 생겼음을 알립니다."""
+        self._wakeup.set()
+
+    def drain(self) -> int:
+        """
+        아웃박스를 모두 처리합니다.
+
+        Returns:
+            재계산한 계정 수
+        """
+        processed = 0
+        while True:
+            batch = self._process_batch()
+            processed += batch
+            if batch < self.batch_size:
+                return processed
+
+    def _process_batch(self) -> int:
+        session = self._session_factory()
+        try:
+            pending = (
+                session.query(BalanceRecalcOutbox.account_id, BalanceRecalcOutbox.requested_at)
+                .order_by(BalanceRecalcOutbox.requested_at)
+                .limit(self.batch_size)
+                .all()
+            )
+            if not pending:
+                return 0
+
+            AccountBalanceService(session).recalculate_balances(
+                row.account_id for row in pending
+            )
+
+            # 처리 도중 다시 요청된 계정(requested_at 변경)은 남겨 두어 다음 배치에서 처리
+            session.execute(
+                delete(BalanceRecalcOutbox).where(
+                    tuple_(BalanceRecalcOutbox.account_id, BalanceRecalcOutbox.requested_at).in_(
+                        [(row.account_id, row.requested_at) for row in pending]
+                    )
+                )
+            )
+            session.commit()
+            return len(pending)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                self.drain()
+            except Exception:  # noqa: BLE001 - 다음 주기에 재시도
+                logger.exception("잔액 재계산 워커 처리 중 오류가 발생했습니다.")
+
+
+balance_worker = BalanceRecalcWorker(poll_interval=get_settings().balance_worker_interval)
@@ -0,0 +1,230 @@
+"""
+계정 잔액 무결성 검사(Balance Verifier) Service
+
+account_balances / account_usage 요약이 journal_lines와 일치하는지 검사합니다.
+요청 경로 밖(CLI: python -m app.verify_balances)에서 대용량 DB에도 쓸 수 있도록:
+
+- 라인 ID 키셋 구간(chunk_size건)마다 짧은 읽기 트랜잭션 하나로 계정별 합계만 집계하고
+  바로 트랜잭션을 끝냅니다. 메모리는 계정 수에 비례합니다.
+- 구간을 마칠 때마다 진행 상태(마지막 라인 ID, 누적 합계)를 체크포인트 파일에 기록하므로
+  중단 후 같은 체크포인트로 다시 실행하면 이어서 검사합니다.
+- 검사 범위는 시작 시점의 마지막 라인 ID까지입니다. 검사 도중 커밋된 분개 때문에 생긴
+  차이를 잘못 보고하지 않도록, 차이가 난 계정만 마지막에 하나의 읽기 스냅샷에서
+  계정별로 다시 집계해 확인된 것만 보고합니다.
+- repair=True이면 확인된 계정만 AccountBalanceService로 다시 계산합니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.database import read_snapshot
+from app.repositories.balance_integrity_repo import BalanceIntegrityRepository, LineTotals
+from app.services.account_balance_service import AccountBalanceService
+
+
+@dataclass
+class VerifyProgress:
+    """체크포인트로 저장되는 진행 상태"""
+
+    high_water: int
+    after_line_id: int = 0
+    chunks: int = 0
+    lines: int = 0
+    elapsed: float = 0.0
+    # {계정 ID: [차변 합계, 대변 합계, 라인 수]}
+    totals: dict[int, list[int]] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        return self.after_line_id >= self.high_water
+
+    def add(self, chunk: dict[int, LineTotals]) -> None:
+        for account_id, (debit, credit, count) in chunk.items():
+            total = self.totals.setdefault(account_id, [0, 0, 0])
+            total[0] += debit
+            total[1] += credit
+            total[2] += count
+            self.lines += count
+
+    def save(self, path: Path) -> None:
+        # 쓰는 도중 중단되어도 이전 체크포인트가 남도록 임시 파일에 쓴 뒤 교체
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> VerifyProgress:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["totals"] = {int(account_id): total for account_id, total in data["totals"].items()}
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class BalanceDrift:
+    """요약 테이블과 분개 라인 집계가 다른 계정"""
+
+    account_id: int
+    expected_debit: int
+    expected_credit: int
+    expected_line_count: int
+    stored_debit: int | None
+    stored_credit: int | None
+    stored_balance: int | None
+    stored_line_count: int | None
+
+
+@dataclass
+class VerifyReport:
+    """검사 결과 (completed=False면 max_chunks에서 멈춤 - 같은 체크포인트로 이어서 실행)"""
+
+    completed: bool
+    progress: VerifyProgress
+    drifts: list[BalanceDrift] = field(default_factory=list)
+    repaired: bool = False
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.progress.lines / self.progress.elapsed if self.progress.elapsed else 0.0
+
+
+class BalanceVerifier:
+    """
+    계정 잔액 무결성 검사기
+
+    사용 예:
+        report = BalanceVerifier(session, checkpoint_path=Path(".balance_verify.json")).run()
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        chunk_size: int = 50_000,
+        checkpoint_path: Path | None = None,
+    ):
+        """
+        Args:
+            db: 검사에 사용할 세션 (구간마다 트랜잭션을 끝내므로 다른 작업과 공유하지 않음)
+            chunk_size: 한 번에 집계할 라인 수
+            checkpoint_path: 진행 상태 파일 (None이면 이어서 실행 불가)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+        self.db = db
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.repo = BalanceIntegrityRepository(db)
+
+    def run(
+        self,
+        repair: bool = False,
+        max_chunks: int | None = None,
+        on_chunk: Callable[[VerifyProgress], None] | None = None,
+    ) -> VerifyReport:
+        """
+        검사 실행 (체크포인트가 있으면 이어서)
+
+        Args:
+            repair: 확인된 차이를 재계산으로 바로잡을지 여부
+            max_chunks: 이번 실행에서 처리할 최대 구간 수 (None이면 끝까지)
+            on_chunk: 구간마다 호출되는 진행 콜백
+
+        Returns:
+            검사 결과. 끝까지 검사하면 체크포인트 파일을 지웁니다.
+        """
+        progress = self._load_progress()
+        processed = 0
+        while not progress.done:
+            if max_chunks is not None and processed >= max_chunks:
+                return VerifyReport(completed=False, progress=progress)
+            self._scan_chunk(progress)
+            processed += 1
+            if self.checkpoint_path is not None:
+                progress.save(self.checkpoint_path)
+            if on_chunk is not None:
+                on_chunk(progress)
+
+        drifts = self._confirm(self._candidates(progress))
+        repaired = False
+        if repair and drifts:
+            AccountBalanceService(self.db).recalculate_balances(drift.account_id for drift in drifts)
+            self.db.commit()
+            repaired = True
+        if self.checkpoint_path is not None:
+            self.checkpoint_path.unlink(missing_ok=True)
+        return VerifyReport(completed=True, progress=progress, drifts=drifts, repaired=repaired)
+
+    def _load_progress(self) -> VerifyProgress:
+        if self.checkpoint_path is not None and self.checkpoint_path.exists():
+            return VerifyProgress.load(self.checkpoint_path)
+        try:
+            return VerifyProgress(high_water=self.repo.max_line_id())
+        finally:
+            self.db.rollback()
+
+    def _scan_chunk(self, progress: VerifyProgress) -> None:
+        """다음 구간 하나를 집계해 누적합니다. (구간마다 짧은 읽기 트랜잭션)"""
+        started = time.perf_counter()
+        try:
+            upper = self.repo.chunk_upper_bound(progress.after_line_id, self.chunk_size)
+            upper = progress.high_water if upper is None else min(upper, progress.high_water)
+            progress.add(self.repo.chunk_totals(progress.after_line_id, upper))
+        finally:
+            self.db.rollback()
+        progress.after_line_id = upper
+        progress.chunks += 1
+        progress.elapsed += time.perf_counter() - started
+
+    def _candidates(self, progress: VerifyProgress) -> list[int]:
+        """구간 집계와 저장값이 다른 계정 (검사 중 변경으로 인한 차이 포함)"""
+        try:
+            stored = self.repo.stored_summaries()
+        finally:
+            self.db.rollback()
+        account_ids = set(stored) | set(progress.totals)
+        return sorted(
+            account_id
+            for account_id in account_ids
+            if _drifted(tuple(progress.totals.get(account_id, (0, 0, 0))), stored.get(account_id))
+        )
+
+    def _confirm(self, candidates: list[int]) -> list[BalanceDrift]:
+        """후보 계정만 하나의 읽기 스냅샷에서 다시 집계해 실제 차이를 확인합니다."""
+        if not candidates:
+            return []
+        with read_snapshot(self.db):
+            expected = self.repo.account_totals(candidates)
+            stored = self.repo.stored_summaries(candidates)
+
+        drifts = []
+        for account_id in candidates:
+            if account_id not in stored:
+                # 검사 도중 삭제된 계정
+                continue
+            totals = expected.get(account_id, (0, 0, 0))
+            summary = stored[account_id]
+            if _drifted(totals, summary):
+                debit, credit, count = totals
+                drifts.append(BalanceDrift(account_id, debit, credit, count, *summary))
+        return drifts
+
+
+def _drifted(totals: LineTotals, summary) -> bool:
+    """집계 합계와 저장된 요약(차변, 대변, 잔액, 라인 수)이 다른지 여부"""
+    debit, credit, count = totals
+    if summary is None or summary[0] is None or summary[3] is None:
+        # 요약 행 없음 - 라인이 없는 계정이면 정상(0)으로 봄
+        return bool(debit or credit or count)
+    stored_debit, stored_credit, stored_balance, stored_count = summary
+    return (
+        stored_debit != debit
+        or stored_credit != credit
+        or stored_balance != debit - credit
+        or stored_count != count
+    )
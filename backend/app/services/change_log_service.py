@@ -0,0 +1,42 @@
+"""
+변경 로그(Ledger Change) Service
+
+마지막으로 처리한 순번 이후의 변경을 조회합니다. (증분 소비자용)
+"""
+from sqlalchemy.orm import Session
+
+from app.repositories.ledger_change_repo import LedgerChangeRepository
+from app.schemas.change_schema import LedgerChangeListResponse, LedgerChangeRead
+
+
+class ChangeLogService:
+    """변경 로그 서비스"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+        self.repo = LedgerChangeRepository(db)
+
+    def list_changes(self, since: int = 0, limit: int = 100) -> LedgerChangeListResponse:
+        """
+        순번 이후의 변경 조회
+
+        Args:
+            since: 이 순번 이후 (미포함, 처음이면 0)
+            limit: 최대 건수
+
+        Returns:
+            변경 목록과 다음 요청에 사용할 since
+        """
+        # 남은 변경이 있는지 알기 위해 한 건 더 조회
+        changes = self.repo.list_since(since, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        return LedgerChangeListResponse(
+            changes=[LedgerChangeRead.model_validate(change) for change in changes],
+            next_since=changes[-1].seq if changes else since,
+            has_more=has_more,
+        )
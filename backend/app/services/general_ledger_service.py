@@ -1,26 +1,34 @@
 from __future__ import annotations
 
-from decimal import Decimal
+import base64
+import binascii
 from datetime import date
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from app.repositories.account_repo import AccountRepository
-from app.repositories.journal_repo import JournalRepository
-from app.repositories.trial_balance_repo import TrialBalanceRepository
+from app.core.database import read_snapshot
+from app.core.exceptions import unprocessable_entity
+from app.core.single_flight import SingleFlight
+from app.repositories.account_catalog import account_catalog
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.repositories.running_balance_repo import LedgerKey, RunningBalanceRepository
+from app.repositories.trial_balance_repo import create_trial_balance_repository
+from app.schemas.common import ErrorCode, ErrorMessage
 from app.schemas.general_ledger_schema import GeneralLedgerEntry, GeneralLedgerResponse
 from app.schemas.trial_balance_schema import BalanceAmount, CurrentPeriod, TrialBalancePeriod
 
+# 같은 계정/기간/검색어/페이지의 원장 동시 요청은 하나의 조회를 공유
+_general_ledger_flight = SingleFlight()
+
 
 class GeneralLedgerService:
     def __init__(self, db: Session):
         self.db = db
-        self.account_repo = AccountRepository(db)
-        self.journal_repo = JournalRepository(db)
-        self.trial_repo = TrialBalanceRepository(db)
+        self.running_balance_repo = RunningBalanceRepository(db)
+        self.trial_repo = create_trial_balance_repository(db)
 
-    def _compute_balance(self, amount: Decimal, account_type: str) -> tuple[Decimal, str]:
+    def _compute_balance(self, amount: int, account_type: str) -> tuple[int, str]:
         normal_direction = self.trial_repo.get_normal_balance_direction(account_type)
         if amount > 0:
             direction = "DEBIT"
@@ -36,40 +44,119 @@ class GeneralLedgerService:
         from_date: date,
         to_date: date,
         search: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> GeneralLedgerResponse:
-        account = self.account_repo.get_by_id(account_id)
-        if not account:
-            raise HTTPException(status_code=404, detail="계정을 찾을 수 없습니다.")
+        after = _decode_cursor(cursor) if cursor else None
+        # 원장 버전을 키에 넣어 방금 커밋한 쓰기 이전에 시작된 조회에는 합류하지 않음
+        ledger_version = LedgerStateRepository(self.db).latest()
+        key = (
+            account_id,
+            from_date,
+            to_date,
+            search.strip().lower() if search else None,
+            limit,
+            after,
+            ledger_version,
+        )
+        return _general_ledger_flight.do(
+            key,
+            lambda: self._build_general_ledger(account_id, from_date, to_date, search, limit, after),
+        )
 
-        opening_totals = self.trial_repo.calculate_totals_before_period([account_id], from_date)
-        opening_debit, opening_credit = opening_totals.get(account_id, (Decimal("0"), Decimal("0")))
-        opening_balance_value = opening_debit - opening_credit
+    def _build_general_ledger(
+        self,
+        account_id: int,
+        from_date: date,
+        to_date: date,
+        search: str | None,
+        limit: int | None = None,
+        after: LedgerKey | None = None,
+    ) -> GeneralLedgerResponse:
+        # 계정 조회·기초 잔액·페이지 라인·기간 합계를 같은 읽기 스냅샷에서 조회
+        # (스냅샷을 첫 쿼리보다 먼저 열어야 PostgreSQL에서 REPEATABLE READ가 적용됨)
+        with read_snapshot(self.db):
+            account = account_catalog.get(self.db, account_id)
+            if not account:
+                raise HTTPException(status_code=404, detail="계정을 찾을 수 없습니다.")
+            ledger_version = LedgerStateRepository(self.db).current()
+            return self._compose(account, from_date, to_date, search, limit, after, ledger_version)
+
+    def _compose(
+        self,
+        account,
+        from_date: date,
+        to_date: date,
+        search: str | None,
+        limit: int | None,
+        after: LedgerKey | None,
+        ledger_version: int,
+    ) -> GeneralLedgerResponse:
+        account_id = account.id
+        # 기초 잔액은 기간 직전 라인의 저장된 러닝 잔액 (인덱스 조회 한 번)
+        opening_balance_value = self.running_balance_repo.balance_before(account_id, from_date)
         opening_amount, opening_direction = self._compute_balance(opening_balance_value, account.type)
 
-        entries = self.journal_repo.get_account_transactions(
-            account_id, from_date, to_date, search
+        # 다음 페이지가 있는지 알기 위해 한 건 더 조회
+        entries = self.running_balance_repo.list_lines(
+            account_id,
+            from_date,
+            to_date,
+            search,
+            after=after,
+            limit=limit + 1 if limit is not None else None,
         )
+        next_cursor = None
+        if limit is not None and len(entries) > limit:
+            entries = entries[:limit]
+            last = entries[-1]
+            next_cursor = _encode_cursor((last["date"], last["entry_id"], last["line_id"]))
 
-        current_debit = sum(entry["debit"] for entry in entries)
-        current_credit = sum(entry["credit"] for entry in entries)
+        if limit is None:
+            current_debit = sum(entry["debit"] for entry in entries)
+            current_credit = sum(entry["credit"] for entry in entries)
+        else:
+            # 페이지와 무관하게 기간 전체 합계 (인덱스 범위 집계 한 번)
+            current_debit, current_credit = self.running_balance_repo.period_totals(
+                account_id, from_date, to_date, search
+            )
         closing_balance_value = opening_balance_value + (current_debit - current_credit)
         closing_amount, closing_direction = self._compute_balance(closing_balance_value, account.type)
 
-        running_balance = opening_balance_value
-        ledger_entries: list[GeneralLedgerEntry] = []
-
-        for entry in entries:
-            running_balance += entry["debit"] - entry["credit"]
-            ledger_entries.append(
-                GeneralLedgerEntry(
-                    entry_id=entry["entry_id"],
-                    date=entry["date"],
-                    description=entry["description"],
-                    debit=entry["debit"],
-                    credit=entry["credit"],
-                    balance=Decimal(running_balance),
+        # 페이지 첫 행 직전 누적 잔액 (첫 페이지는 기초 잔액)
+        page_opening_value = opening_balance_value
+        if after is not None:
+            if search:
+                through_debit, through_credit = self.running_balance_repo.period_totals(
+                    account_id, from_date, to_date, search, through=after
                 )
+                page_opening_value += through_debit - through_credit
+            else:
+                page_opening_value = self.running_balance_repo.balance_through(account_id, after)
+        if search:
+            # 저장된 러닝 잔액은 검색에서 빠진 라인까지 누적한 값이므로,
+            # 검색 시 행 잔액은 기말 잔액과 맞도록 검색 결과만 누적해 계산
+            running_balance = page_opening_value
+            for entry in entries:
+                running_balance += entry["debit"] - entry["credit"]
+                entry["balance"] = running_balance
+
+        page_opening_balance = None
+        if limit is not None:
+            page_amount, page_direction = self._compute_balance(page_opening_value, account.type)
+            page_opening_balance = BalanceAmount(amount=page_amount, direction=page_direction)
+
+        ledger_entries = [
+            GeneralLedgerEntry(
+                entry_id=entry["entry_id"],
+                date=entry["date"],
+                description=entry["description"],
+                debit=entry["debit"],
+                credit=entry["credit"],
+                balance=entry["balance"],
             )
+            for entry in entries
+        ]
 
         return GeneralLedgerResponse(
             account_id=account.id,
@@ -80,4 +167,28 @@ class GeneralLedgerService:
             current=CurrentPeriod(debit=current_debit, credit=current_credit),
             closing_balance=BalanceAmount(amount=closing_amount, direction=closing_direction),
             entries=ledger_entries,
+            page_opening_balance=page_opening_balance,
+            next_cursor=next_cursor,
+            ledger_version=ledger_version,
         )
+
+
+def _encode_cursor(key: LedgerKey) -> str:
+    """원장 키 (거래일, 분개 ID, 라인 ID)를 불투명 커서 문자열로 변환"""
+    entry_date, entry_id, line_id = key
+    raw = f"{entry_date.isoformat()}:{entry_id}:{line_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> LedgerKey:
+    """커서 문자열을 원장 키로 복원 (형식 오류는 422)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        entry_date, entry_id, line_id = base64.urlsafe_b64decode(padded).decode().split(":")
+        return date.fromisoformat(entry_date), int(entry_id), int(line_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise unprocessable_entity(
+            ErrorCode.INVALID_CURSOR,
+            ErrorMessage.INVALID_CURSOR,
+            {"cursor": cursor},
+        ) from None
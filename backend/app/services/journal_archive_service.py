@@ -0,0 +1,110 @@
+"""
+분개 보관(Journal Archive) Service
+
+soft-delete 후 보관 기간(JOURNAL_ARCHIVE_RETENTION_DAYS)이 지난 분개를 보관 테이블로 옮기고,
+보관된 분개 조회를 제공합니다. 보관 작업은 요청 경로 밖(CLI: python -m app.archive_journal_entries)에서
+실행합니다.
+
+삭제된 분개는 어떤 집계에도 포함되지 않으므로 옮겨도 잔액 요약, 러닝 잔액, 원장 버전과
+인메모리 집계(시점 잔액 인덱스, 열 엔진)는 바뀌지 않습니다. 분개 batch_size건마다 짧은
+트랜잭션 하나로 옮기므로 작업 도중 중단되어도 이미 옮긴 배치만 반영됩니다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.exceptions import not_found
+from app.repositories.journal_archive_repo import JournalArchiveRepository
+from app.schemas.common import ErrorCode, ErrorMessage
+
+
+@dataclass
+class ArchiveReport:
+    """보관 작업 결과"""
+
+    deleted_before: datetime
+    entries: int = 0
+    lines: int = 0
+    batches: int = 0
+
+
+class JournalArchiveService:
+    """분개 보관 서비스"""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+        self.repo = JournalArchiveRepository(db)
+
+    def archive_deleted(
+        self,
+        retention_days: int | None = None,
+        batch_size: int = 1000,
+        max_batches: int | None = None,
+        now: datetime | None = None,
+    ) -> ArchiveReport:
+        """
+        보관 기간이 지난 삭제 분개를 보관 테이블로 옮깁니다. (배치마다 커밋)
+
+        Args:
+            retention_days: 삭제 후 운영 테이블에 남겨 둘 기간(일). None이면 설정값
+            batch_size: 한 트랜잭션에서 옮길 분개 수
+            max_batches: 이번 실행의 최대 배치 수 (None이면 대상이 없을 때까지)
+            now: 기준 시각 (테스트용, 기본은 현재 UTC)
+
+        Returns:
+            옮긴 분개/라인 수
+        """
+        if retention_days is None:
+            retention_days = get_settings().journal_archive_retention_days
+        if retention_days < 0:
+            raise ValueError("retention_days는 0 이상이어야 합니다.")
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+
+        now = now or datetime.utcnow()
+        report = ArchiveReport(deleted_before=now - timedelta(days=retention_days))
+        while max_batches is None or report.batches < max_batches:
+            try:
+                entry_ids = self.repo.archivable_ids(report.deleted_before, batch_size)
+                if not entry_ids:
+                    self.db.rollback()
+                    break
+                entries, lines = self.repo.move(entry_ids, now)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            report.entries += entries
+            report.lines += lines
+            report.batches += 1
+        return report
+
+    def get_archived_entry(self, entry_id: int):
+        """
+        보관 분개 단건 조회
+
+        Args:
+            entry_id: 원래 분개 ID
+
+        Returns:
+            보관 분개 (라인 포함)
+
+        Raises:
+            HTTPException(404): 보관된 분개가 없는 경우
+        """
+        entry = self.repo.get_by_id(entry_id)
+        if not entry:
+            raise not_found(
+                ErrorCode.JOURNAL_ENTRY_NOT_FOUND,
+                ErrorMessage.JOURNAL_ENTRY_NOT_FOUND,
+                {"entry_id": entry_id, "archived": True}
+            )
+        return entry
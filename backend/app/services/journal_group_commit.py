@@ -0,0 +1,219 @@
+"""
+분개 그룹 커밋(Group Commit) 작성기
+
+SQLite는 쓰기를 직렬화하므로 동시에 들어온 분개 생성 요청이 각자 커밋(fsync)과
+잔액 재계산을 수행하며 DB 잠금을 기다립니다. 그룹 커밋 모드에서는 작성기 스레드
+하나가 대기열의 요청을 모아 한 트랜잭션에서 검증/저장하고, 영향받는 계정의 잔액을
+한 번만 재계산한 뒤 커밋하고 각 호출자의 Future를 완료합니다.
+BALANCE_RECALC_MODE=background에서는 즉시 재계산하지 않고 아웃박스에 기록해 잔액 워커에
+맡깁니다. 단, read_your_writes 요청이 하나라도 섞인 묶음은 묶음 전체를 한 번에 즉시 재계산합니다.
+
+호출자는 정해진 시간(GROUP_COMMIT_TIMEOUT)만 기다리고 넘으면 503을 받습니다. 아직 처리되지
+않은 요청은 취소되어 저장되지 않고, 이미 처리 중이던 요청은 커밋될 수 있으므로
+Idempotency-Key로 재시도하면 중복 없이 최초 응답을 받습니다.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from contextlib import nullcontext
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.core.exceptions import internal_error, service_unavailable
+from app.schemas.common import ErrorCode, ErrorMessage
+from app.schemas.journal_schema import JournalEntryCreate, JournalEntryRead
+from app.services.account_balance_service import AccountBalanceService
+from app.services.journal_service import JournalService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingPosting:
+    """대기열에 들어간 분개 생성 요청"""
+
+    payload: JournalEntryCreate
+    read_your_writes: bool = False
+    idempotency_key: str | None = None
+    future: Future = field(default_factory=Future)
+
+
+class JournalGroupCommitter:
+    """
+    분개 생성 그룹 커밋 작성기 (스레드 1개)
+
+    - 첫 요청이 들어오면 max_wait 동안(또는 max_batch개가 찰 때까지) 요청을 더 모읍니다.
+    - 검증에 실패한 요청은 해당 Future에만 예외를 전달하고 나머지는 함께 커밋합니다.
+    - 커밋이 실패하면 배치 안의 모든 요청이 같은 오류를 받습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_batch: int = 100,
+        max_wait: float = 0.005,
+    ):
+        self._session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: queue.Queue[PendingPosting | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """작성기 스레드 시작"""
+        if self.is_running:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="journal-group-commit", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """대기 중인 요청을 처리한 뒤 작성기 스레드 종료"""
+        if not self._thread:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(
+        self,
+        payload: JournalEntryCreate,
+        read_your_writes: bool = False,
+        idempotency_key: str | None = None,
+    ) -> Future:
+        """
+        분개 생성 요청을 대기열에 넣습니다.
+
+        Returns:
+            JournalEntryRead(또는 재시도 시 저장된 응답 본문)로 완료되는 Future
+        """
+        posting = PendingPosting(payload, read_your_writes, idempotency_key)
+        self._queue.put(posting)
+        return posting.future
+
+    def create_entry(
+        self,
+        payload: JournalEntryCreate,
+        read_your_writes: bool = False,
+        idempotency_key: str | None = None,
+        timeout: float | None = None,
+    ):
+        """
+        분개 생성 요청을 대기열에 넣고 결과를 기다립니다.
+
+        Raises:
+            HTTPException(503): timeout(초) 안에 커밋되지 않은 경우
+        """
+        future = self.submit(payload, read_your_writes, idempotency_key)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # 작성기가 아직 꺼내지 않은 요청이면 취소되어 저장되지 않음
+            raise service_unavailable(
+                ErrorCode.JOURNAL_WRITE_TIMEOUT,
+                ErrorMessage.JOURNAL_WRITE_TIMEOUT,
+                {"timeout": timeout, "cancelled": future.cancel()},
+            ) from None
+
+    def process(self, postings: list[PendingPosting]) -> None:
+        """요청 묶음을 한 트랜잭션으로 처리하고 각 Future를 완료합니다."""
+        # 기다리다 취소한 요청은 제외하고, 나머지는 실행 중으로 표시해 더는 취소되지 않게 함
+        postings = [posting for posting in postings if posting.future.set_running_or_notify_cancel()]
+        if not postings:
+            return
+        session = self._session_factory()
+        results: list[tuple[PendingPosting, object]] = []
+        try:
+            service = JournalService(session)
+            with self._recalculation(session, postings):
+                for posting in postings:
+                    try:
+                        result = service.stage_entry(
+                            posting.payload,
+                            posting.read_your_writes,
+                            posting.idempotency_key,
+                        )
+                    except HTTPException as exc:
+                        # 검증 오류는 쓰기 전에 발생하므로 이 요청만 제외
+                        posting.future.set_exception(exc)
+                        continue
+                    results.append((posting, result))
+
+            # 세션을 닫기 전에 응답 스키마로 변환 (호출자 스레드에서 지연 로딩 방지)
+            responses = [
+                (posting, result if isinstance(result, dict) else JournalEntryRead.model_validate(result))
+                for posting, result in results
+            ]
+            session.commit()
+        except Exception as exc:  # noqa: BLE001 - 배치 전체 실패를 각 호출자에게 전달
+            session.rollback()
+            logger.exception("분개 그룹 커밋 처리 중 오류가 발생했습니다.")
+            error = internal_error(ErrorMessage.DATABASE_ERROR, {"error": str(exc)})
+            for posting in postings:
+                if not posting.future.done():
+                    posting.future.set_exception(error)
+            return
+        finally:
+            session.close()
+
+        for posting, response in responses:
+            posting.future.set_result(response)
+
+    @staticmethod
+    def _recalculation(session: Session, postings: list[PendingPosting]):
+        """
+        묶음의 잔액 재계산 방식
+
+        sync 모드이거나 read_your_writes 요청이 있으면 batch()로 묶음 종료 시 한 번에 재계산하고,
+        background 모드에서는 요청마다 아웃박스에 기록하도록 병합하지 않습니다.
+        """
+        if get_settings().balance_recalc_mode == "background" and not any(
+            posting.read_your_writes for posting in postings
+        ):
+            return nullcontext()
+        return AccountBalanceService(session).batch()
+
+    def _collect(self, first: PendingPosting) -> tuple[list[PendingPosting], bool]:
+        """첫 요청 이후 max_wait 동안 도착한 요청을 모읍니다. (종료 신호 여부 함께 반환)"""
+        postings = [first]
+        stopping = False
+        while len(postings) < self.max_batch:
+            try:
+                posting = self._queue.get(timeout=self.max_wait)
+            except queue.Empty:
+                break
+            if posting is None:
+                stopping = True
+                break
+            postings.append(posting)
+        return postings, stopping
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            postings, stopping = self._collect(first)
+            self.process(postings)
+            if stopping:
+                return
+
+
+_settings = get_settings()
+journal_committer = JournalGroupCommitter(
+    max_batch=_settings.group_commit_max_batch,
+    max_wait=_settings.group_commit_max_wait_ms / 1000,
+)
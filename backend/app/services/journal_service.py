@@ -3,17 +3,32 @@
 
 비즈니스 로직을 담당합니다.
 """
-from datetime import date
-from decimal import Decimal
+import hashlib
+from datetime import date, datetime
+from typing import Any, Iterable
 
+from fastapi import status
 from sqlalchemy.orm import Session
 
-from app.models.account import Account
+from app.core.config import get_settings
+from app.repositories.account_catalog import account_catalog
+from app.repositories.balance_index import Posting, balance_index
+from app.repositories.idempotency_repo import IdempotencyRepository
 from app.repositories.journal_repo import JournalRepository
+from app.repositories.ledger_columns import ledger_columns
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.repositories.running_balance_repo import RunningBalanceRepository
+from app.repositories.trial_balance_repo import balance_index_enabled, columnar_engine_enabled
 from app.repositories.account_repo import AccountRepository
-from app.schemas.journal_schema import JournalEntryCreate, JournalEntryUpdate, JournalLineCreate
+from app.schemas.journal_schema import (
+    JournalEntryCreate,
+    JournalEntryRead,
+    JournalEntryUpdate,
+    JournalLineCreate,
+)
 from app.schemas.common import ErrorCode, ErrorMessage
 from app.services.account_balance_service import AccountBalanceService
+from app.services.ledger_events import journal_event_data, ledger_events
 from app.core.exceptions import (
     bad_request,
     not_found,
@@ -38,6 +53,9 @@ class JournalService:
         self.db = db
         self.repo = JournalRepository(db)
         self.account_repo = AccountRepository(db)
+        self.idempotency_repo = IdempotencyRepository(db)
+        self.running_balance_repo = RunningBalanceRepository(db)
+        self.ledger_state_repo = LedgerStateRepository(db)
         self.balance_service = AccountBalanceService(db)
 
     def list_entries(
@@ -85,21 +103,54 @@ class JournalService:
         return entry
 
     @with_transaction
-    def create_entry(self, payload: JournalEntryCreate):
+    def create_entry(
+        self,
+        payload: JournalEntryCreate,
+        read_your_writes: bool = False,
+        idempotency_key: str | None = None,
+    ):
         """
         분개 생성
 
         차변/대변 검증 및 계정 유효성 검증을 수행합니다.
+        idempotency_key가 주어지면 최초 응답을 분개와 같은 트랜잭션에 저장하고,
+        같은 키로 재시도하면 검증/저장/잔액 재계산 없이 저장된 응답을 반환합니다.
 
         Args:
             payload: 분개 생성 데이터
+            read_your_writes: 백그라운드 재계산 모드에서도 잔액을 즉시 재계산할지 여부
+            idempotency_key: 클라이언트 재시도 식별 키 (Idempotency-Key 헤더)
 
         Returns:
-            생성된 분개 (라인과 계정 정보 포함)
+            생성된 분개 (라인과 계정 정보 포함) 또는 저장된 최초 응답 본문
 
         Raises:
             HTTPException(400): 계정 유효성 검증 실패 또는 차대변 불일치
+            HTTPException(422): 같은 키로 다른 요청 본문을 보낸 경우
+        """
+        return self.stage_entry(payload, read_your_writes, idempotency_key)
+
+    def stage_entry(
+        self,
+        payload: JournalEntryCreate,
+        read_your_writes: bool = False,
+        idempotency_key: str | None = None,
+    ):
+        """
+        커밋 없이 현재 트랜잭션에 분개를 추가합니다.
+
+        create_entry와 그룹 커밋 작성기가 공유하는 본문입니다.
+        검증 오류(HTTPException)는 DB에 쓰기 전에 발생하므로, 여러 분개를 한
+        트랜잭션에 모으는 호출자는 실패한 요청만 제외하고 나머지를 커밋할 수 있습니다.
         """
+        now = datetime.utcnow()
+        request_hash = None
+        if idempotency_key is not None:
+            request_hash = self._request_hash(payload)
+            replay = self._find_replay(idempotency_key, request_hash, now)
+            if replay is not None:
+                return replay
+
         # 1. 계정 유효성 검증
         self._validate_accounts(payload.lines)
 
@@ -109,18 +160,37 @@ class JournalService:
         # 3. 분개 생성 및 잔액 재계산
         entry = self.repo.create_entry(payload)
         affected_ids = {line.account_id for line in entry.lines}
-        self.balance_service.recalculate_balances(affected_ids)
+        self.running_balance_repo.post_entry(entry.id, entry.date, affected_ids)
+        self.balance_service.request_recalculation(affected_ids, read_your_writes)
+        self._track_ledger_change(entry.id, added=self._postings(entry))
+
+        # 4. 재시도용 응답 저장 (분개와 함께 커밋)
+        if idempotency_key is not None:
+            self.idempotency_repo.save(
+                idempotency_key,
+                request_hash,
+                status.HTTP_201_CREATED,
+                JournalEntryRead.model_validate(entry).model_dump(mode="json"),
+                now,
+                get_settings().idempotency_key_ttl,
+            )
 
         return entry
 
     @with_transaction
-    def update_entry(self, entry_id: int, payload: JournalEntryUpdate):
+    def update_entry(
+        self,
+        entry_id: int,
+        payload: JournalEntryUpdate,
+        read_your_writes: bool = False,
+    ):
         """
         분개 수정
 
         Args:
             entry_id: 분개 ID
             payload: 수정 데이터
+            read_your_writes: 백그라운드 재계산 모드에서도 잔액을 즉시 재계산할지 여부
 
         Returns:
             수정된 분개 (라인과 계정 정보 포함)
@@ -135,21 +205,34 @@ class JournalService:
         self._validate_accounts(payload.lines)
         self._validate_totals(payload.lines)
 
-        # 영향받는 계정 ID 수집 (이전 + 새로운)
-        original_account_ids = {line.account_id for line in entry.lines}
+        # 수정 전 라인 (잔액 인덱스에서 빼기 위함 - 수정 시 엔티티가 제자리 변경됨)
+        removed = self._postings(entry)
+        ledger_changed = sorted(removed) != sorted(
+            (line.account_id, payload.date, int(line.debit), int(line.credit))
+            for line in payload.lines
+        )
+
+        # 금액/계정/거래일이 바뀌면 러닝 잔액에서 기존 라인을 빼고 수정 후 다시 반영
+        if ledger_changed:
+            self.running_balance_repo.unpost_entry(
+                entry.id, entry.date, {line.account_id for line in entry.lines}
+            )
 
-        # 분개 수정
-        updated = self.repo.update_entry(entry, payload)
-        updated_account_ids = {line.account_id for line in updated.lines}
-        affected_ids = original_account_ids.union(updated_account_ids)
+        # 분개 수정 (변경된 라인만 반영)
+        updated, changed_account_ids = self.repo.update_entry(entry, payload)
+        if ledger_changed:
+            self.running_balance_repo.post_entry(
+                updated.id, updated.date, {line.account_id for line in updated.lines}
+            )
 
-        # 영향받는 모든 계정의 잔액 재계산
-        self.balance_service.recalculate_balances(affected_ids)
+        # 금액/거래일이 실제로 바뀐 계정만 재계산 (적요만 바뀐 경우 생략)
+        self.balance_service.request_recalculation(changed_account_ids, read_your_writes)
+        self._track_ledger_change(entry_id, removed, self._postings(updated))
 
         return updated
 
     @with_transaction
-    def delete_entry(self, entry_id: int):
+    def delete_entry(self, entry_id: int, read_your_writes: bool = False):
         """
         분개 삭제 (soft-delete)
 
@@ -157,6 +240,7 @@ class JournalService:
 
         Args:
             entry_id: 분개 ID
+            read_your_writes: 백그라운드 재계산 모드에서도 잔액을 즉시 재계산할지 여부
 
         Returns:
             삭제된 분개
@@ -167,11 +251,13 @@ class JournalService:
         entry = self.get_entry(entry_id)
         affected_ids = {line.account_id for line in entry.lines}
 
-        # soft-delete 처리
+        # soft-delete 처리 (러닝 잔액에서 제외)
+        self.running_balance_repo.unpost_entry(entry.id, entry.date, affected_ids)
         deleted = self.repo.delete_entry(entry)
 
         # 영향받는 계정의 잔액 재계산
-        self.balance_service.recalculate_balances(affected_ids)
+        self.balance_service.request_recalculation(affected_ids, read_your_writes)
+        self._track_ledger_change(entry_id, removed=self._postings(entry))
 
         return deleted
 
@@ -198,6 +284,69 @@ class JournalService:
         validate_date_range(from_date, to_date)
         return self.repo.get_summary_list(from_date, to_date, limit)
 
+    def _track_ledger_change(
+        self,
+        entry_id: int,
+        removed: Iterable[Posting] = (),
+        added: Iterable[Posting] = (),
+    ) -> None:
+        """
+        원장 버전을 올리고, 인메모리 집계(시산표 열 엔진, 시점 잔액 인덱스)에
+        커밋 후 변경분을 그 버전과 함께 반영하도록 알립니다. 변경 로그도 같은 트랜잭션에 기록하고
+        변경 이벤트(SSE)는 커밋 후 발행됩니다.
+
+        Args:
+            entry_id: 생성/수정/삭제된 분개 ID
+            removed: 빠지는 라인 (삭제된 분개, 수정 전 라인)
+            added: 더해지는 라인 (신규 분개, 수정 후 라인)
+        """
+        removed, added = list(removed), list(added)
+        version, change_seq = self.ledger_state_repo.bump()
+        event_type, data = journal_event_data(entry_id, removed, added, version)
+        ledger_events.record(self.db, change_seq, event_type, entry_id, data, version)
+        if columnar_engine_enabled():
+            ledger_columns.track_commit(self.db, [entry_id], version)
+        if balance_index_enabled():
+            balance_index.track_commit(
+                self.db,
+                [
+                    *((acc_id, day, -debit, -credit) for acc_id, day, debit, credit in removed),
+                    *added,
+                ],
+                version,
+            )
+
+    @staticmethod
+    def _postings(entry) -> list[Posting]:
+        """분개 라인을 (계정 ID, 거래일, 차변, 대변) 목록으로 변환"""
+        return [
+            (line.account_id, entry.date, int(line.debit), int(line.credit))
+            for line in entry.lines
+        ]
+
+    def _find_replay(self, key: str, request_hash: str, now: datetime) -> Any | None:
+        """
+        저장된 최초 응답 조회
+
+        Raises:
+            HTTPException(422): 같은 키가 다른 요청 본문에 사용된 경우
+        """
+        record = self.idempotency_repo.get_active(key, now)
+        if record is None:
+            return None
+        if record.request_hash != request_hash:
+            raise unprocessable_entity(
+                ErrorCode.IDEMPOTENCY_KEY_REUSED,
+                ErrorMessage.IDEMPOTENCY_KEY_REUSED,
+                {"idempotency_key": key}
+            )
+        return record.response_body
+
+    @staticmethod
+    def _request_hash(payload: JournalEntryCreate) -> str:
+        """요청 본문 SHA-256 (키 재사용 판별용)"""
+        return hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
+
     def _validate_accounts(self, lines: list[JournalLineCreate]) -> None:
         """
         계정 유효성 검증
@@ -213,12 +362,9 @@ class JournalService:
         """
         account_ids = {line.account_id for line in lines}
 
-        # 계정 존재 여부 확인 (최적화: 필요한 필드만 조회)
-        accounts = (
-            self.db.query(Account.id, Account.is_active, Account.code, Account.name)
-            .filter(Account.id.in_(account_ids))
-            .all()
-        )
+        # 계정 존재 여부 확인 (계정 카탈로그 캐시 사용 - DB 조회 없음)
+        catalog = account_catalog.accounts(self.db)
+        accounts = [catalog[acc_id] for acc_id in account_ids if acc_id in catalog]
 
         # 조회된 계정 ID 집합
         existing_ids = {acc.id for acc in accounts}
@@ -258,16 +404,17 @@ class JournalService:
         Raises:
             HTTPException(400): 차변 합계와 대변 합계가 일치하지 않는 경우
         """
-        total_debit = sum(Decimal(str(line.debit)) for line in lines)
-        total_credit = sum(Decimal(str(line.credit)) for line in lines)
+        # 스키마에서 정수 금액임을 검증하므로 int로 합산
+        total_debit = sum(int(line.debit) for line in lines)
+        total_credit = sum(int(line.credit) for line in lines)
 
         if total_debit != total_credit:
             raise bad_request(
                 ErrorCode.DEBIT_CREDIT_MISMATCH,
                 ErrorMessage.DEBIT_CREDIT_MISMATCH,
                 {
-                    "debit_total": int(total_debit),
-                    "credit_total": int(total_credit),
-                    "difference": int(total_debit - total_credit)
+                    "debit_total": total_debit,
+                    "credit_total": total_credit,
+                    "difference": total_debit - total_credit
                 }
             )
@@ -0,0 +1,186 @@
+"""
+원장 변경 이벤트 브로커 (Server-Sent Events용)
+
+JournalService/AccountService가 쓰기 트랜잭션 안에서 record()를 호출하면 변경 로그
+(ledger_changes)에 한 행을 추가하고, 커밋 직후에 구독자(SSE 연결)마다 전달합니다.
+롤백된 트랜잭션의 이벤트는 로그와 함께 버려집니다. 이벤트 id는 변경 로그 순번이므로
+재연결한 클라이언트는 Last-Event-ID 이후를 로그에서 다시 받을 수 있습니다.
+
+    journal_entry.created / updated / deleted
+        {"entry_id", "account_ids", "dates", "ledger_version"}
+    account.created / updated
+        {"account_id", "code", "is_active"}
+
+구독자는 이벤트 루프마다 asyncio.Queue를 하나씩 가지며, 서비스 스레드에서는
+call_soon_threadsafe로 넣습니다. 느린 구독자의 큐가 가득 차면 밀린 이벤트를 버리고
+resync 이벤트 하나만 남겨 클라이언트가 전체를 다시 조회하게 합니다.
+프로세스 단위 브로커이므로 다른 프로세스의 쓰기는 전달되지 않습니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.ledger_change import LedgerChange
+from app.repositories.balance_index import Posting
+from app.repositories.ledger_change_repo import LedgerChangeRepository
+
+_PENDING_KEY = "ledger_events_pending"
+_QUEUE_SIZE = 256
+
+RESYNC = "resync"
+
+
+@dataclass(frozen=True)
+class LedgerEvent:
+    """전달되는 변경 이벤트 (id는 변경 로그 순번)"""
+
+    id: int
+    type: str
+    data: dict[str, Any]
+
+    @classmethod
+    def from_change(cls, change: LedgerChange) -> LedgerEvent:
+        return cls(id=change.seq, type=change.event_type, data=change.payload)
+
+    def encode(self) -> str:
+        """SSE 메시지 형식 (id/event/data 필드 + 빈 줄)"""
+        payload = json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+@dataclass(eq=False)
+class Subscription:
+    """SSE 연결 하나의 이벤트 큐"""
+
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(_QUEUE_SIZE))
+
+    def _push(self, item: LedgerEvent) -> None:
+        # 이벤트 루프 스레드에서 실행
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            item = LedgerEvent(id=item.id, type=RESYNC, data={})
+        self.queue.put_nowait(item)
+
+    async def get(self) -> LedgerEvent:
+        return await self.queue.get()
+
+
+class LedgerEventBroker:
+    """
+    원장 변경 이벤트 브로커
+
+    - record(): 변경 로그 추가 + 커밋 후 발행 예약
+    - subscribe() / unsubscribe(): SSE 연결 등록/해제
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscription] = set()
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+    def record(
+        self,
+        db: Session,
+        seq: int,
+        event_type: str,
+        entity_id: int,
+        data: dict[str, Any],
+        ledger_version: int | None = None,
+    ) -> None:
+        """
+        변경 로그에 한 행을 추가하고, 현재 트랜잭션이 커밋되면 이벤트를 발행하도록 예약합니다.
+
+        Args:
+            db: 쓰기 세션
+            seq: LedgerStateRepository.bump()로 발급한 변경 로그 순번 (이벤트 id)
+            event_type: 이벤트 종류 (예: journal_entry.created)
+            entity_id: 분개 ID 또는 계정 ID
+            data: 이벤트 본문 (JSON 직렬화 가능)
+            ledger_version: 분개 변경의 원장 버전
+        """
+        LedgerChangeRepository(db).append(seq, event_type, entity_id, data, ledger_version)
+        db.info.setdefault(_PENDING_KEY, []).append(LedgerEvent(id=seq, type=event_type, data=data))
+        # once=True 리스너는 같은 세션에서 한 번만 실행되므로 세션당 한 번 상시 등록
+        if not event.contains(db, "after_commit", self._after_commit):
+            event.listen(db, "after_commit", self._after_commit)
+            event.listen(db, "after_rollback", self._after_rollback)
+
+    def _after_commit(self, session: Session) -> None:
+        for item in session.info.pop(_PENDING_KEY, ()):
+            self.publish(item)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+    def publish(self, item: LedgerEvent) -> None:
+        """구독 중인 모든 연결에 이벤트를 즉시 전달합니다."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._push, item)
+            except RuntimeError:
+                # 이미 닫힌 이벤트 루프 (연결 종료 직후)
+                self.unsubscribe(subscription)
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+    def subscribe(self) -> Subscription:
+        """현재 이벤트 루프에 큐를 만들어 구독합니다. (async 함수 안에서 호출)"""
+        subscription = Subscription(loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+def journal_event_data(
+    entry_id: int,
+    removed: Iterable[Posting],
+    added: Iterable[Posting],
+    ledger_version: int,
+) -> tuple[str, dict[str, Any]]:
+    """
+    분개 변경 이벤트 (종류, 본문)
+
+    수정 전 라인만 있으면 삭제, 수정 후 라인만 있으면 생성, 둘 다 있으면 수정입니다.
+    영향받은 계정과 거래일은 수정 전후를 모두 포함합니다.
+    """
+    removed, added = list(removed), list(added)
+    if not removed:
+        event_type = "journal_entry.created"
+    elif not added:
+        event_type = "journal_entry.deleted"
+    else:
+        event_type = "journal_entry.updated"
+    postings = removed + added
+    dates: set[date] = {entry_date for _, entry_date, _, _ in postings}
+    return event_type, {
+        "entry_id": entry_id,
+        "account_ids": sorted({account_id for account_id, _, _, _ in postings}),
+        "dates": [entry_date.isoformat() for entry_date in sorted(dates)],
+        "ledger_version": ledger_version,
+    }
+
+
+ledger_events = LedgerEventBroker()
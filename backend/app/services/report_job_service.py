@@ -0,0 +1,114 @@
+"""
+리포트 작업(Report Job) Service
+
+리포트 작업 제출/상태 조회/결과 파일 확인을 담당합니다.
+실행은 report_worker 풀이 요청 경로 밖에서 수행합니다.
+"""
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import conflict, not_found, validate_date_range, with_transaction
+from app.models.report_job import ReportJob, ReportJobKind, ReportJobStatus
+from app.repositories.report_job_repo import ReportJobRepository
+from app.schemas.common import ErrorCode, ErrorMessage
+from app.schemas.report_job_schema import ReportJobCreate
+from app.services.report_worker import RESULT_FORMATS
+
+# 커밋 후 워커 풀에 제출할 작업 ID 목록 (세션별)
+_PENDING_KEY = "report_jobs_pending"
+
+
+class ReportJobService:
+    """
+    리포트 작업 서비스
+
+    작업은 요청 트랜잭션에 기록되고, 커밋된 뒤에만 워커 풀에 제출됩니다.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+        self.repo = ReportJobRepository(db)
+
+    @with_transaction
+    def submit(self, payload: ReportJobCreate) -> ReportJob:
+        """
+        리포트 작업 제출
+
+        Returns:
+            대기(PENDING) 상태의 작업
+
+        Raises:
+            HTTPException(422): 날짜 범위가 유효하지 않은 경우
+        """
+        validate_date_range(payload.from_date, payload.to_date)
+        job = self.repo.create(payload.kind, payload.to_params())
+
+        # 커밋 전에 워커가 작업을 찾지 못하는 일이 없도록 커밋 후 제출 (롤백되면 버림)
+        self.db.info.setdefault(_PENDING_KEY, []).append(job.id)
+        if not event.contains(self.db, "after_commit", _enqueue_pending):
+            event.listen(self.db, "after_commit", _enqueue_pending)
+            event.listen(self.db, "after_rollback", _discard_pending)
+        return job
+
+    def get_job(self, job_id: str) -> ReportJob:
+        """
+        작업 조회
+
+        Raises:
+            HTTPException(404): 작업이 없는 경우
+        """
+        job = self.repo.get_by_id(job_id)
+        if not job:
+            raise not_found(
+                ErrorCode.REPORT_JOB_NOT_FOUND,
+                ErrorMessage.REPORT_JOB_NOT_FOUND,
+                {"job_id": job_id},
+            )
+        return job
+
+    def get_result(self, job_id: str) -> tuple[ReportJob, Path, str]:
+        """
+        완료된 작업의 결과 파일 조회
+
+        Returns:
+            (작업, 결과 파일 경로, Content-Type)
+
+        Raises:
+            HTTPException(404): 작업이 없거나 결과 파일이 삭제된 경우
+            HTTPException(409): 작업이 아직 완료되지 않았거나 실패한 경우
+        """
+        job = self.get_job(job_id)
+        if job.status != ReportJobStatus.SUCCEEDED or not job.result_path:
+            raise conflict(
+                ErrorCode.REPORT_NOT_READY,
+                ErrorMessage.REPORT_NOT_READY,
+                {"job_id": job_id, "status": job.status, "error": job.error},
+            )
+
+        path = Path(job.result_path)
+        if not path.exists():
+            raise not_found(
+                ErrorCode.REPORT_JOB_NOT_FOUND,
+                "리포트 결과 파일을 찾을 수 없습니다.",
+                {"job_id": job_id},
+            )
+        _, content_type = RESULT_FORMATS[ReportJobKind(job.kind)]
+        return job, path, content_type
+
+
+def _enqueue_pending(session: Session) -> None:
+    """커밋된 작업을 워커 풀에 제출합니다."""
+    from app.services.report_worker import report_worker
+
+    for job_id in session.info.pop(_PENDING_KEY, ()):
+        report_worker.submit(job_id)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,173 @@
+"""
+리포트 작업 워커 풀
+
+제출된 리포트 작업을 요청 처리 스레드와 분리된 스레드 풀에서 실행하고,
+결과를 로컬 디스크에 파일로 저장합니다. 동시 실행 수는 REPORT_WORKER_CONCURRENCY로 조절합니다.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.report_job import ReportJob, ReportJobKind
+from app.repositories.journal_repo import JournalRepository
+from app.repositories.report_job_repo import ReportJobRepository
+from app.services.general_ledger_service import GeneralLedgerService
+from app.services.trial_balance_service import TrialBalanceService
+
+logger = logging.getLogger(__name__)
+
+# 리포트 종류별 결과 파일 확장자와 Content-Type
+RESULT_FORMATS: dict[ReportJobKind, tuple[str, str]] = {
+    ReportJobKind.TRIAL_BALANCE: ("json", "application/json"),
+    ReportJobKind.GENERAL_LEDGER: ("json", "application/json"),
+    ReportJobKind.JOURNAL_EXPORT: ("csv", "text/csv"),
+}
+
+EXPORT_HEADER = ["date", "entry_id", "description", "account_code", "account_name", "debit", "credit"]
+
+
+class ReportWorkerPool:
+    """
+    리포트 작업 실행 풀
+
+    - submit(job_id)로 작업을 큐에 넣으면 풀의 스레드가 실행합니다.
+    - 작업은 조건부 UPDATE로 선점하므로 같은 작업이 중복 실행되지 않습니다.
+    - 결과는 임시 파일에 쓴 뒤 이름을 바꿔, 다운로드 시 반쯤 쓰인 파일이 보이지 않습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        concurrency: int = 2,
+        storage_dir: str | Path = "reports",
+    ):
+        self._session_factory = session_factory
+        self.concurrency = concurrency
+        self.storage_dir = Path(storage_dir)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """풀 생성 후 재시작 전에 끝나지 않은 작업을 다시 제출합니다."""
+        self._ensure_executor()
+        session = self._session_factory()
+        try:
+            job_ids = ReportJobRepository(session).requeue_unfinished()
+            session.commit()
+        finally:
+            session.close()
+        for job_id in job_ids:
+            self.submit(job_id)
+
+    def stop(self, wait: bool = True) -> None:
+        """풀 종료 (실행 중인 작업은 끝까지 수행)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def submit(self, job_id: str):
+        """작업 실행 예약"""
+        return self._ensure_executor().submit(self.run, job_id)
+
+    def run(self, job_id: str) -> None:
+        """작업 하나를 선점하여 실행하고 결과 또는 실패 사유를 기록합니다."""
+        session = self._session_factory()
+        repo = ReportJobRepository(session)
+        try:
+            if not repo.claim(job_id, datetime.utcnow()):
+                session.rollback()
+                return
+            session.commit()
+
+            job = repo.get_by_id(job_id)
+            # 리포트 서비스가 새 읽기 스냅샷을 열 수 있도록 작업 조회 트랜잭션을 먼저 끝냄
+            session.commit()
+            try:
+                path = self._write_result(session, job)
+            except Exception as exc:  # noqa: BLE001 - 실패 사유를 작업에 기록
+                session.rollback()
+                logger.exception("리포트 작업 %s 실행 중 오류가 발생했습니다.", job_id)
+                repo.finish(job_id, datetime.utcnow(), error=_describe_error(exc))
+            else:
+                repo.finish(job_id, datetime.utcnow(), result_path=str(path))
+            session.commit()
+        finally:
+            session.close()
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency, thread_name_prefix="report-worker"
+                )
+            return self._executor
+
+    def _write_result(self, session: Session, job: ReportJob) -> Path:
+        """결과를 임시 파일에 쓴 뒤 최종 경로로 원자적으로 이동합니다."""
+        kind = ReportJobKind(job.kind)
+        extension, _ = RESULT_FORMATS[kind]
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        path = self.storage_dir / f"{job.id}.{extension}"
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+        try:
+            self._render(session, kind, job.params, tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, path)
+        return path
+
+    def _render(
+        self,
+        session: Session,
+        kind: ReportJobKind,
+        params: dict[str, Any],
+        tmp_path: Path,
+    ) -> None:
+        """리포트 종류별 결과 생성 (JSON: 기존 조회 서비스 재사용, CSV: 스트리밍)"""
+        from_date = date.fromisoformat(params["from"])
+        to_date = date.fromisoformat(params["to"])
+
+        with tmp_path.open("w", encoding="utf-8", newline="") as fp:
+            if kind == ReportJobKind.TRIAL_BALANCE:
+                result = TrialBalanceService(session).get_trial_balance(from_date, to_date)
+                json.dump(result.model_dump(mode="json", by_alias=True), fp, ensure_ascii=False)
+            elif kind == ReportJobKind.GENERAL_LEDGER:
+                result = GeneralLedgerService(session).get_general_ledger(
+                    params["account_id"], from_date, to_date, params.get("search")
+                )
+                json.dump(result.model_dump(mode="json", by_alias=True), fp, ensure_ascii=False)
+            else:
+                writer = csv.writer(fp)
+                writer.writerow(EXPORT_HEADER)
+                for row in JournalRepository(session).iter_export_rows(from_date, to_date):
+                    writer.writerow(row)
+
+
+def _describe_error(exc: Exception) -> str:
+    """HTTPException이면 detail을, 아니면 예외 메시지를 기록합니다."""
+    detail: Any = getattr(exc, "detail", None)
+    if detail is not None:
+        return json.dumps(detail, ensure_ascii=False) if not isinstance(detail, str) else detail
+    return str(exc) or exc.__class__.__name__
+
+
+_settings = get_settings()
+report_worker = ReportWorkerPool(
+    concurrency=_settings.report_worker_concurrency,
+    storage_dir=_settings.report_storage_dir,
+)
@@ -4,21 +4,30 @@
 합계 시산표(A 방식): 차변 합계 + 대변 합계 + 잔액
 """
 from datetime import date
-from decimal import Decimal
 
 from sqlalchemy.orm import Session
 
-from app.repositories.trial_balance_repo import TrialBalanceRepository
+from app.core.database import read_snapshot
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.repositories.trial_balance_repo import create_trial_balance_repository
 from app.schemas.trial_balance_schema import (
     BalanceAmount,
     CurrentPeriod,
     RecentEntry,
     TrialBalancePeriod,
+    TrialBalanceRecentResponse,
     TrialBalanceResponse,
     TrialBalanceRow,
     TrialBalanceTotal,
 )
-from app.core.exceptions import validate_date_range
+from app.core.exceptions import not_found, unprocessable_entity, validate_date_range
+from app.repositories.account_catalog import account_catalog
+from app.schemas.common import ErrorCode, ErrorMessage
+from app.services.trial_balance_types import TrialBalanceFilter
+from app.core.single_flight import SingleFlight
+
+# 동일 기간의 시산표 동시 요청은 하나의 집계를 공유
+_trial_balance_flight = SingleFlight()
 
 
 class TrialBalanceService:
@@ -34,44 +43,121 @@ class TrialBalanceService:
             db: 데이터베이스 세션
         """
         self.db = db
-        self.repo = TrialBalanceRepository(db)
+        self.repo = create_trial_balance_repository(db)
 
     def get_trial_balance(
         self,
         from_date: date,
-        to_date: date
+        to_date: date,
+        include_recent: bool = False,
+        filters: TrialBalanceFilter | None = None,
     ) -> TrialBalanceResponse:
         """
         시산표 조회
 
         지정된 기간의 활성 계정에 대해 차변/대변 합계 및 잔액을 계산합니다.
+        같은 기간·조건의 동시 요청은 진행 중인 계산 하나의 결과를 공유합니다(single-flight).
+        필터를 지정하면 합계(total)도 응답에 포함된 행 기준으로 계산됩니다.
 
         Args:
             from_date: 시작일
             to_date: 종료일
+            include_recent: 계정별 최근 거래(recent_entries) 포함 여부
+            filters: 계정 타입/코드 범위/계정 ID/0 잔액 숨김 필터
 
         Returns:
             시산표 응답 (A 방식: 합계 시산표)
 
         Raises:
-            HTTPException(422): 날짜 범위가 유효하지 않은 경우
+            HTTPException(422): 날짜 또는 계정 코드 범위가 유효하지 않은 경우
         """
         # 날짜 범위 검증
         validate_date_range(from_date, to_date)
+        if filters and filters.code_from and filters.code_to and filters.code_from > filters.code_to:
+            raise unprocessable_entity(
+                ErrorCode.INVALID_CODE_RANGE,
+                ErrorMessage.INVALID_CODE_RANGE,
+                {"code_from": filters.code_from, "code_to": filters.code_to},
+            )
+
+        # 같은 기간·조건을 계산 중인 요청이 있으면 그 결과를 함께 사용
+        # (원장 버전을 키에 넣어 방금 커밋한 쓰기 이전에 시작된 계산에는 합류하지 않음)
+        ledger_version = LedgerStateRepository(self.db).latest()
+        return _trial_balance_flight.do(
+            (from_date, to_date, include_recent, filters, ledger_version),
+            lambda: self._build_trial_balance(from_date, to_date, include_recent, filters),
+        )
+
+    def get_recent_entries(
+        self,
+        account_id: int,
+        limit: int = 5,
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> TrialBalanceRecentResponse:
+        """
+        계정 하나의 최근 거래 조회 (시산표 상세 펼침용)
+
+        Args:
+            account_id: 계정 ID
+            limit: 최대 거래 수
+            from_date: 시작일 (선택)
+            to_date: 종료일 (선택)
 
-        # Repository에서 계정별 데이터 조회
-        account_entries = self.repo.calculate_trial_balance(from_date, to_date)
-        account_ids = [entry.account_id for entry in account_entries]
-        opening_totals = self.repo.calculate_totals_before_period(account_ids, from_date)
+        Returns:
+            최근 거래 응답 (최신순)
+
+        Raises:
+            HTTPException(404): 계정이 없는 경우
+            HTTPException(422): 날짜 범위가 유효하지 않은 경우
+        """
+        if from_date and to_date:
+            validate_date_range(from_date, to_date)
+        if not account_catalog.get(self.db, account_id):
+            raise not_found(
+                ErrorCode.ACCOUNT_NOT_FOUND,
+                ErrorMessage.ACCOUNT_NOT_FOUND,
+                {"account_id": account_id},
+            )
+
+        records = self.repo.get_recent_entries(account_id, limit, from_date, to_date)
+        return TrialBalanceRecentResponse(
+            account_id=account_id,
+            entries=[
+                RecentEntry(
+                    date=entry.date,
+                    description=entry.description,
+                    debit=entry.debit,
+                    credit=entry.credit,
+                )
+                for entry in records
+            ],
+        )
+
+    def _build_trial_balance(
+        self,
+        from_date: date,
+        to_date: date,
+        include_recent: bool = False,
+        filters: TrialBalanceFilter | None = None,
+    ) -> TrialBalanceResponse:
+        """시산표 집계 (get_trial_balance의 실제 계산)"""
+        # 기간 합계·기초 합계·최근 거래를 같은 읽기 스냅샷에서 조회 (사이에 커밋된 분개가 섞이지 않음)
+        with read_snapshot(self.db):
+            ledger_version = LedgerStateRepository(self.db).current()
+            self.repo.ledger_version = ledger_version
+            account_entries = self.repo.calculate_trial_balance(from_date, to_date, include_recent, filters)
+            account_ids = [entry.account_id for entry in account_entries]
+            opening_totals = self.repo.calculate_totals_before_period(account_ids, from_date)
 
         rows: list[TrialBalanceRow] = []
-        total_balance_debit = Decimal("0")
-        total_balance_credit = Decimal("0")
+        total_balance_debit = 0
+        total_balance_credit = 0
 
         for data in account_entries:
             total_debit = data.total_debit
             total_credit = data.total_credit
-            opening_debit, opening_credit = opening_totals.get(data.account_id, (Decimal("0"), Decimal("0")))
+            opening_debit, opening_credit = opening_totals.get(data.account_id, (0, 0))
             opening_balance_value = opening_debit - opening_credit
             current_balance_value = total_debit - total_credit
             ending_balance_value = opening_balance_value + current_balance_value
@@ -83,6 +169,10 @@ class TrialBalanceService:
                 ending_balance_value, data.type
             )
 
+            # 기말 잔액이 0인 행 숨김
+            if filters and filters.hide_zero and ending_amount == 0:
+                continue
+
             if ending_direction == "DEBIT":
                 total_balance_debit += ending_amount
             else:
@@ -137,14 +227,15 @@ class TrialBalanceService:
         return TrialBalanceResponse(
             period=period,
             rows=rows,
-            total=total
+            total=total,
+            ledger_version=ledger_version,
         )
 
     def _convert_balance(
         self,
-        balance: Decimal,
+        balance: int,
         account_type
-    ) -> tuple[Decimal, str]:
+    ) -> tuple[int, str]:
         """
         잔액을 (금액, 방향) 형태로 변환
 
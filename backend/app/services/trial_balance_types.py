@@ -2,17 +2,43 @@
 Trial Balance 관련 데이터 타입
 """
 from dataclasses import dataclass
-from decimal import Decimal
 
 from app.models.account import AccountType
 
 
+@dataclass(frozen=True)
+class TrialBalanceFilter:
+    """
+    시산표 행 필터
+
+    type/code_from/code_to/account_ids는 집계 전에 계정 목록을 줄이고,
+    hide_zero는 기말 잔액이 0인 행을 응답에서 제외합니다.
+    """
+    type: AccountType | None = None
+    code_from: str | None = None
+    code_to: str | None = None
+    account_ids: tuple[int, ...] | None = None
+    hide_zero: bool = False
+
+    def matches(self, account) -> bool:
+        """계정이 type/코드 범위/ID 조건을 만족하는지 여부"""
+        if self.type is not None and account.type != self.type:
+            return False
+        if self.code_from is not None and account.code < self.code_from:
+            return False
+        if self.code_to is not None and account.code > self.code_to:
+            return False
+        if self.account_ids is not None and account.id not in self.account_ids:
+            return False
+        return True
+
+
 @dataclass
 class RecentEntryRecord:
     date: str
     description: str
-    debit: Decimal
-    credit: Decimal
+    debit: int
+    credit: int
 
 
 @dataclass
@@ -21,8 +47,8 @@ class TrialBalanceEntry:
     account_code: str
     account_name: str
     type: AccountType
-    total_debit: Decimal
-    total_credit: Decimal
-    balance: Decimal
+    total_debit: int
+    total_credit: int
+    balance: int
     transaction_count: int
     recent_entries: list[RecentEntryRecord]
@@ -16,21 +16,38 @@ from app.models.account import Account
 from app.seed_accounts import DEFAULT_ACCOUNTS
 
 
+def _remove_test_db() -> None:
+    # WAL 모드의 -wal / -shm 파일도 함께 삭제
+    for path in (TEST_DB_PATH, TEST_DB_PATH.with_name(TEST_DB_PATH.name + "-wal"),
+                 TEST_DB_PATH.with_name(TEST_DB_PATH.name + "-shm")):
+        path.unlink(missing_ok=True)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def prepare_database():
-    if TEST_DB_PATH.exists():
-        TEST_DB_PATH.unlink()
+    _remove_test_db()
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
-    if TEST_DB_PATH.exists():
-        TEST_DB_PATH.unlink()
+    engine.dispose()
+    _remove_test_db()
 
 
 @pytest.fixture(autouse=True)
 def clean_database():
+    from app.repositories.account_catalog import account_catalog
+    from app.repositories.balance_index import balance_index
+    from app.repositories.ledger_columns import ledger_columns
+
+    # 이전 테스트가 시작한 인덱스 재구성이 테이블을 다시 만드는 동안 실행되지 않도록 대기
+    balance_index.wait()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    account_catalog.invalidate()
+    ledger_columns.invalidate()
+    balance_index.invalidate()
+    yield
+    balance_index.wait()
 
 
 @pytest.fixture
@@ -71,3 +88,30 @@ def client(db_session):
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def statement_counter():
+    """블록 안에서 실행된 SQL 문장 목록을 수집하는 컨텍스트 매니저를 반환"""
+    from contextlib import contextmanager
+
+    from sqlalchemy import event
+
+    from app.repositories.balance_index import balance_index
+
+    @contextmanager
+    def _count():
+        statements: list[str] = []
+        # 이전 조회가 시작한 잔액 인덱스 백그라운드 재구성의 SQL이 섞이지 않도록 대기
+        balance_index.wait()
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _count
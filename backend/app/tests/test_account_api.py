@@ -0,0 +1,144 @@
+from decimal import Decimal
+
+
+def test_account_write_endpoints_statement_budget(client, sample_accounts, statement_counter):
+    """계정 쓰기 엔드포인트는 flush 후 refresh 없이 응답을 구성한다"""
+    with statement_counter() as create_statements:
+        response = client.post(
+            "/api/v1/accounts",
+            json={"code": "520", "name": "접대비", "type": "EXPENSE"},
+        )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["balance_summary"]["account_id"] == data["id"]
+    assert Decimal(data["balance_summary"]["balance"]) == Decimal("0")
+    # 변경 로그 순번 UPSERT, 변경 로그 INSERT 각 1건 포함
+    assert len(create_statements) <= 6
+
+    account_id = data["id"]
+    with statement_counter() as update_statements:
+        response = client.put(f"/api/v1/accounts/{account_id}", json={"name": "접대비(변경)"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "접대비(변경)"
+    assert len(update_statements) <= 6
+
+    with statement_counter() as status_statements:
+        response = client.put(f"/api/v1/accounts/{account_id}/status", json={"activate": False})
+    assert response.status_code == 200
+    assert response.json()["data"]["is_active"] is False
+    assert len(status_statements) <= 6
+
+
+def test_account_catalog_is_invalidated_by_account_writes(client, sample_accounts, statement_counter):
+    """계정 카탈로그 캐시는 검증에서 재사용되고 계정 변경 커밋 시 무효화된다"""
+    from app.repositories.account_catalog import account_catalog
+
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+    payload = {
+        "date": "2025-01-05",
+        "description": "급여 지급",
+        "lines": [
+            {"account_id": salary.id, "debit": 800000, "credit": 0},
+            {"account_id": cash.id, "debit": 0, "credit": 800000},
+        ],
+    }
+
+    assert client.post("/api/v1/journal-entries", json=payload).status_code == 201
+    with statement_counter() as statements:
+        assert client.post("/api/v1/journal-entries", json=payload).status_code == 201
+    assert not any(sql.startswith("SELECT accounts") for sql in statements)
+
+    version = account_catalog.version
+    new_account = client.post(
+        "/api/v1/accounts",
+        json={"code": "520", "name": "접대비", "type": "EXPENSE"},
+    ).json()
+    assert account_catalog.version == version + 1
+
+    client.put(f"/api/v1/accounts/{new_account['id']}/status", json={"activate": False})
+    payload["lines"][0]["account_id"] = new_account["id"]
+    response = client.post("/api/v1/journal-entries", json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "INACTIVE_ACCOUNT"
+
+
+def test_account_usage_summary_blocks_deactivation(client, sample_accounts, statement_counter):
+    """사용 현황 요약으로 사용 여부를 판단하고 COUNT 쿼리를 실행하지 않는다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    for day in ("2025-02-10", "2025-01-03"):
+        response = client.post(
+            "/api/v1/journal-entries",
+            json={
+                "date": day,
+                "description": "매출",
+                "lines": [
+                    {"account_id": cash.id, "debit": 1000, "credit": 0},
+                    {"account_id": revenue.id, "debit": 0, "credit": 1000},
+                ],
+            },
+        )
+        assert response.status_code == 201
+
+    usage = client.get(f"/api/v1/accounts/{cash.id}").json()["usage"]
+    assert usage["line_count"] == 2
+    assert usage["first_posted_on"] == "2025-01-03"
+    assert usage["last_posted_on"] == "2025-02-10"
+
+    with statement_counter() as statements:
+        response = client.put(f"/api/v1/accounts/{cash.id}/status", json={"activate": False})
+    assert response.status_code == 409
+    assert response.json()["detail"]["details"]["usage_count"] == 2
+    assert not any("count(" in sql.lower() for sql in statements)
+
+    # 거래일만 바꿔도 최초/최종 거래일이 갱신된다
+    entry_id = client.get("/api/v1/journal-entries").json()[0]["id"]
+    entry = client.get(f"/api/v1/journal-entries/{entry_id}").json()
+    response = client.put(
+        f"/api/v1/journal-entries/{entry_id}",
+        json={
+            "date": "2025-03-01",
+            "description": entry["description"],
+            "lines": [
+                {"account_id": line["account_id"], "debit": line["debit"], "credit": line["credit"]}
+                for line in entry["lines"]
+            ],
+        },
+    )
+    assert response.status_code == 200
+    usage = client.get(f"/api/v1/accounts/{cash.id}").json()["usage"]
+    assert usage["last_posted_on"] == "2025-03-01"
+
+
+def test_account_catalog_detects_changes_from_other_processes(client, sample_accounts):
+    """AccountService를 거치지 않은 계정 변경(다른 프로세스, seed/CLI)도 DB 지문으로 감지한다"""
+    from app.core.database import SessionLocal
+    from app.models.account import Account, AccountType
+
+    cash = sample_accounts["101"]
+    payload = {
+        "date": "2025-01-05",
+        "description": "접대",
+        "lines": [
+            {"account_id": cash.id, "debit": 0, "credit": 1000},
+        ],
+    }
+    # 카탈로그를 채움
+    assert client.get("/api/v1/trial-balance", params={"from": "2025-01-01", "to": "2025-01-31"}).status_code == 200
+
+    other = SessionLocal()
+    try:
+        account = Account(code="521", name="접대비(외부)", type=AccountType.EXPENSE.value, is_active=True)
+        other.add(account)
+        other.commit()
+        payload["lines"].insert(0, {"account_id": account.id, "debit": 1000, "credit": 0})
+        assert client.post("/api/v1/journal-entries", json=payload).status_code == 201
+
+        account.is_active = False
+        other.commit()
+        response = client.post("/api/v1/journal-entries", json=payload)
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INACTIVE_ACCOUNT"
+    finally:
+        other.close()
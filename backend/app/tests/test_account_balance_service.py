@@ -0,0 +1,83 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.account_balance import AccountBalance
+from app.models.account_usage import AccountUsage
+from app.schemas.journal_schema import JournalEntryCreate, JournalLineCreate
+from app.services.journal_service import JournalService
+
+
+def _payload(debit_account_id: int, credit_account_id: int, amount: int) -> JournalEntryCreate:
+    return JournalEntryCreate(
+        date=date(2025, 1, 5),
+        description="급여 지급",
+        lines=[
+            JournalLineCreate(account_id=debit_account_id, debit=Decimal(amount), credit=Decimal("0")),
+            JournalLineCreate(account_id=credit_account_id, debit=Decimal("0"), credit=Decimal(amount)),
+        ],
+    )
+
+
+def test_batch_coalesces_recalculation_across_postings(db_session, sample_accounts, statement_counter):
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    with statement_counter() as statements:
+        with service.balance_service.batch():
+            for amount in (100000, 200000, 300000):
+                service.create_entry(_payload(salary.id, cash.id, amount))
+            assert db_session.query(AccountBalance).count() == 0
+    db_session.commit()
+
+    balance_upserts = [sql for sql in statements if sql.startswith("INSERT INTO account_balances")]
+    assert len(balance_upserts) == 1
+    assert db_session.get(AccountBalance, salary.id).total_debit == Decimal("600000")
+    assert db_session.get(AccountBalance, cash.id).total_credit == Decimal("600000")
+
+
+def test_full_recalculation_upserts_every_account_in_one_statement_per_summary(db_session, sample_accounts, statement_counter):
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    service.create_entry(_payload(salary.id, cash.id, 800000))
+    deleted = service.create_entry(_payload(salary.id, cash.id, 100000))
+    service.delete_entry(deleted.id)
+
+    db_session.query(AccountBalance).filter(AccountBalance.account_id == salary.id).update(
+        {AccountBalance.total_debit: 0, AccountBalance.balance: 0}
+    )
+    db_session.commit()
+
+    with statement_counter() as statements:
+        service.balance_service.recalculate_balances(None)
+    db_session.commit()
+
+    # account_balances, account_usage 각각 한 문장
+    assert len(statements) == 2
+    balances = {row.account_id: row for row in db_session.query(AccountBalance).all()}
+    assert set(balances) == {account.id for account in sample_accounts.values()}
+    assert balances[salary.id].total_debit == Decimal("800000")
+    assert balances[cash.id].balance == Decimal("-800000")
+    assert balances[sample_accounts["102"].id].balance == Decimal("0")
+
+
+def test_batch_recalculates_committed_postings_when_block_fails(db_session, sample_accounts):
+    """블록이 실패해도 이미 커밋된 분개의 계정 잔액/사용 현황은 재계산해 커밋한다"""
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    with pytest.raises(RuntimeError):
+        with service.balance_service.batch():
+            service.create_entry(_payload(salary.id, cash.id, 100000))
+            raise RuntimeError("중간 실패")
+
+    db_session.expire_all()
+    assert db_session.get(AccountBalance, salary.id).total_debit == Decimal("100000")
+    assert db_session.get(AccountBalance, cash.id).total_credit == Decimal("100000")
+    assert db_session.get(AccountUsage, salary.id).line_count == 1
+    assert db_session.get(AccountUsage, cash.id).line_count == 1
@@ -0,0 +1,129 @@
+from datetime import date
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.repositories.balance_index import balance_index
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.repositories.trial_balance_repo import TrialBalanceRepository
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def _scan(db_session, account_ids, from_date, to_date):
+    repo = TrialBalanceRepository(db_session)
+    return (
+        repo._scan_totals_before_period(account_ids, from_date),
+        repo._scan_period_totals(account_ids, from_date, to_date),
+    )
+
+
+def _indexed(db_session, account_ids, from_date, to_date):
+    return (
+        balance_index.totals_before(db_session, account_ids, from_date),
+        balance_index.range_totals(db_session, account_ids, from_date, to_date),
+    )
+
+
+def test_balance_index_tracks_postings_and_matches_scan(client, db_session, sample_accounts):
+    """잔액 인덱스는 생성/수정/삭제/소급 거래 후에도 SQL 집계와 같은 결과를 낸다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    salary = sample_accounts["501"]
+    account_ids = [cash.id, revenue.id, salary.id]
+    period = (date(2025, 3, 1), date(2025, 3, 31))
+
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-10", 10000))
+    balance_index.rebuild(db_session)
+
+    salary_entry = client.post(
+        "/api/v1/journal-entries", json=_entry(salary.id, cash.id, "2025-03-15", 3000)
+    ).json()
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-03-31", 700))
+    # 트리 구간 밖의 소급 거래와 먼 미래 거래
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2023-06-01", 50))
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2027-01-01", 9))
+    assert _indexed(db_session, account_ids, *period) == _scan(db_session, account_ids, *period)
+
+    client.put(
+        f"/api/v1/journal-entries/{salary_entry['id']}",
+        json=_entry(salary.id, cash.id, "2025-02-20", 4500),
+    )
+    assert balance_index.totals_before(db_session, [cash.id], date(2025, 3, 1)) == {
+        cash.id: (10050, 4500)
+    }
+
+    client.delete(f"/api/v1/journal-entries/{salary_entry['id']}")
+    assert _indexed(db_session, account_ids, *period) == _scan(db_session, account_ids, *period)
+    assert salary.id not in balance_index.totals_before(db_session, [salary.id], date(2026, 1, 1))
+
+
+def test_general_ledger_opening_balance_skips_scan(client, sample_accounts, statement_counter):
+    """원장 기초 잔액은 인덱스에서 계산하고 기간 이전 라인을 집계하지 않는다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    for day, amount in (("2025-01-05", 1000), ("2025-02-05", 200), ("2025-03-05", 30)):
+        client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, day, amount))
+
+    params = {"account_id": cash.id, "from": "2025-03-01", "to": "2025-03-31"}
+    # 첫 조회는 SQL로 답하고 인덱스는 백그라운드에서 구성
+    client.get("/api/v1/general-ledger", params=params)
+    balance_index.wait()
+    with statement_counter() as statements:
+        response = client.get("/api/v1/general-ledger", params=params)
+    assert response.status_code == 200
+    assert response.json()["opening_balance"]["amount"] == "1200"
+    assert not any("journal_entries.date < " in sql for sql in statements)
+
+
+def test_balance_index_can_be_disabled(client, db_session, sample_accounts, monkeypatch):
+    """BALANCE_INDEX=0이면 인덱스를 갱신하지 않고 SQL 집계 경로를 사용한다"""
+    balance_index.rebuild(db_session)
+    monkeypatch.setattr(get_settings(), "balance_index_enabled", False)
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-05", 1000))
+
+    totals = TrialBalanceRepository(db_session).calculate_totals_before_period([cash.id], date(2025, 2, 1))
+    assert totals == {cash.id: (1000, 0)}
+    assert balance_index.totals_before(db_session, [cash.id], date(2025, 2, 1)) == {}
+
+
+def test_behind_index_answers_from_sql_and_rebuilds_in_background(
+    client, db_session, sample_accounts, monkeypatch
+):
+    """인덱스가 뒤처지면 요청 안에서 다시 만들지 않고 SQL로 답한 뒤 백그라운드에서 따라잡는다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-05", 1000))
+    balance_index.rebuild(db_session)
+    db_session.rollback()
+    stale = balance_index.version
+
+    # 다른 프로세스의 쓰기: 이 프로세스의 인덱스에는 증감분이 전달되지 않음
+    with SessionLocal() as peer:
+        LedgerStateRepository(peer).bump()
+        peer.commit()
+
+    scheduled = []
+    monkeypatch.setattr(balance_index, "_schedule_rebuild", lambda: scheduled.append(True))
+    response = client.get("/api/v1/trial-balance", params={"from": "2025-02-01", "to": "2025-02-28"})
+    assert response.status_code == 200
+    assert scheduled
+    assert balance_index.version == stale
+
+    monkeypatch.undo()
+    assert balance_index.totals_before(db_session, [cash.id], date(2025, 2, 1), stale + 1) is None
+    balance_index.wait()
+    assert balance_index.version == stale + 1
+    assert balance_index.totals_before(db_session, [cash.id], date(2025, 2, 1), stale + 1) == {
+        cash.id: (1000, 0)
+    }
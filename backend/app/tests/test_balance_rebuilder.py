@@ -0,0 +1,101 @@
+from datetime import date
+
+from sqlalchemy import delete, select, update
+
+from app.models.account_balance import AccountBalance
+from app.models.account_usage import AccountUsage
+from app.models.journal_line import JournalLine
+from app.services.balance_rebuilder import BalanceRebuilder
+from app.services.balance_verifier import BalanceVerifier
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def test_rebuild_with_worker_processes(client, db_session, sample_accounts):
+    """워커 프로세스들의 구간별 부분 합계를 병합해 요약 테이블을 처음부터 다시 만든다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+    for day in range(1, 8):
+        client.post("/api/v1/journal-entries", json=_entry(cash, revenue, f"2025-03-0{day}", day * 100))
+    deleted = client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-02-01", 300)).json()
+    client.delete(f"/api/v1/journal-entries/{deleted['id']}")
+
+    db_session.execute(delete(AccountBalance))
+    db_session.execute(update(AccountUsage).values(line_count=0, first_posted_on=None))
+    db_session.commit()
+
+    report = BalanceRebuilder(db_session, workers=2, partitions=3).run()
+    assert (report.partitions, report.workers, report.lines) == (3, 2, 14)
+    assert report.accounts == len(sample_accounts)
+    assert report.reconciled_accounts == 0
+
+    balances = dict(db_session.execute(select(AccountBalance.account_id, AccountBalance.balance)).all())
+    assert balances[cash] == 2800
+    assert balances[revenue] == -2800
+    assert balances[salary] == 0
+    usage = db_session.execute(
+        select(AccountUsage.line_count, AccountUsage.first_posted_on, AccountUsage.last_posted_on)
+        .where(AccountUsage.account_id == cash)
+    ).one()
+    assert tuple(usage) == (7, date(2025, 3, 1), date(2025, 3, 7))
+    assert BalanceVerifier(db_session).run().drifts == []
+
+
+def test_rebuild_recalculates_accounts_changed_during_scan(client, db_session, sample_accounts):
+    """집계 이후 커밋된 분개 변경은 변경 로그로 찾아 쓰기 트랜잭션 안에서 다시 계산한다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-10", 1000))
+
+    class _ConcurrentWrite(BalanceRebuilder):
+        def _scan(self, bounds):
+            merged = super()._scan(bounds)
+            client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-01-20", 400))
+            return merged
+
+    report = _ConcurrentWrite(db_session, workers=1).run()
+    assert report.lines == 2
+    assert report.reconciled_accounts == 2
+
+    balances = dict(db_session.execute(select(AccountBalance.account_id, AccountBalance.balance)).all())
+    assert (balances[cash], balances[salary]) == (600, 400)
+    assert BalanceVerifier(db_session).run().drifts == []
+
+
+def test_rebuild_resequences_running_balances(client, db_session, sample_accounts):
+    """재구성은 같은 쓰기 트랜잭션에서 틀어진 라인별 러닝 잔액도 원장 순서대로 다시 채운다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-04-10", 1000))
+    client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-04-20", 300))
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-04-01", 200))
+    deleted = client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-04-05", 50)).json()
+    client.delete(f"/api/v1/journal-entries/{deleted['id']}")
+
+    expected = dict(db_session.execute(select(JournalLine.id, JournalLine.running_balance)).all())
+    db_session.execute(update(JournalLine).values(running_balance=0))
+    db_session.commit()
+
+    BalanceRebuilder(db_session, workers=1).run()
+
+    db_session.expire_all()
+    stored = dict(db_session.execute(select(JournalLine.id, JournalLine.running_balance)).all())
+    assert stored == expected
+    cash_balances = db_session.execute(
+        select(JournalLine.running_balance)
+        .where(JournalLine.account_id == cash, JournalLine.running_balance.is_not(None))
+        .order_by(JournalLine.entry_date, JournalLine.entry_id, JournalLine.id)
+    ).scalars().all()
+    assert cash_balances == [200, 1200, 900]
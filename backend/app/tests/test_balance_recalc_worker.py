@@ -0,0 +1,81 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.account_balance import AccountBalance
+from app.models.balance_recalc_outbox import BalanceRecalcOutbox
+from app.schemas.journal_schema import JournalEntryCreate, JournalLineCreate
+from app.services.balance_recalc_worker import BalanceRecalcWorker
+from app.services.journal_service import JournalService
+
+
+@pytest.fixture
+def background_mode(monkeypatch):
+    monkeypatch.setattr(get_settings(), "balance_recalc_mode", "background")
+
+
+def _payload(debit_account_id: int, credit_account_id: int, amount: int) -> JournalEntryCreate:
+    return JournalEntryCreate(
+        date=date(2025, 1, 5),
+        description="급여 지급",
+        lines=[
+            JournalLineCreate(account_id=debit_account_id, debit=Decimal(amount), credit=Decimal("0")),
+            JournalLineCreate(account_id=credit_account_id, debit=Decimal("0"), credit=Decimal(amount)),
+        ],
+    )
+
+
+def test_background_mode_coalesces_outbox_and_worker_applies(db_session, sample_accounts, background_mode):
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    service.create_entry(_payload(salary.id, cash.id, 800000))
+    service.create_entry(_payload(salary.id, cash.id, 200000))
+
+    outbox_ids = {row.account_id for row in db_session.query(BalanceRecalcOutbox).all()}
+    assert outbox_ids == {salary.id, cash.id}
+    assert db_session.query(AccountBalance).count() == 0
+
+    worker = BalanceRecalcWorker(session_factory=SessionLocal)
+    assert worker.drain() == 2
+
+    db_session.expire_all()
+    assert db_session.query(BalanceRecalcOutbox).count() == 0
+    balances = {row.account_id: row for row in db_session.query(AccountBalance).all()}
+    assert balances[salary.id].total_debit == Decimal("1000000")
+    assert balances[cash.id].balance == Decimal("-1000000")
+
+
+def test_read_your_writes_recalculates_synchronously(db_session, sample_accounts, background_mode):
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    service.create_entry(_payload(salary.id, cash.id, 800000), read_your_writes=True)
+
+    assert db_session.query(BalanceRecalcOutbox).count() == 0
+    balance = db_session.get(AccountBalance, salary.id)
+    assert balance.total_debit == Decimal("800000")
+
+
+def test_pending_recalculation_blocks_deactivation(client, db_session, sample_accounts, background_mode):
+    """워커가 아직 처리하지 않아 사용 현황 요약이 0이어도 라인이 있는 계정은 비활성화할 수 없다"""
+    salary = sample_accounts["501"]
+    cash = sample_accounts["101"]
+    JournalService(db_session).create_entry(_payload(salary.id, cash.id, 800000))
+    assert db_session.query(BalanceRecalcOutbox).filter_by(account_id=salary.id).count() == 1
+
+    response = client.put(f"/api/v1/accounts/{salary.id}/status", json={"activate": False})
+    assert response.status_code == 409
+    assert response.json()["detail"]["details"] == {"account_id": salary.id, "usage_pending": True}
+
+    # 아웃박스에 남아 있어도 라인이 없는 계정(분개 삭제 후)은 비활성화 가능
+    entry_id = client.get("/api/v1/journal-entries").json()[0]["id"]
+    assert client.delete(f"/api/v1/journal-entries/{entry_id}").status_code == 200
+    response = client.put(f"/api/v1/accounts/{salary.id}/status", json={"activate": False})
+    assert response.status_code == 200
+    assert response.json()["data"]["is_active"] is False
@@ -0,0 +1,77 @@
+from sqlalchemy import update
+
+from app.models.account_balance import AccountBalance
+from app.models.account_usage import AccountUsage
+from app.services.balance_verifier import BalanceVerifier
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def _post_entries(client, sample_accounts) -> dict[str, int]:
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+    for day in range(1, 6):
+        client.post("/api/v1/journal-entries", json=_entry(cash, revenue, f"2025-01-0{day}", day * 100))
+    deleted = client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-01-07", 300)).json()
+    client.delete(f"/api/v1/journal-entries/{deleted['id']}")
+    client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-01-08", 250))
+    return {"cash": cash, "revenue": revenue, "salary": salary}
+
+
+def test_verifier_reports_and_repairs_drift(client, db_session, sample_accounts):
+    """구간 집계로 요약 테이블의 차이를 찾고 repair로 바로잡는다"""
+    ids = _post_entries(client, sample_accounts)
+    assert BalanceVerifier(db_session, chunk_size=3).run().drifts == []
+
+    db_session.execute(
+        update(AccountBalance).where(AccountBalance.account_id == ids["revenue"]).values(total_credit=1)
+    )
+    db_session.execute(
+        update(AccountUsage).where(AccountUsage.account_id == ids["salary"]).values(line_count=9)
+    )
+    db_session.commit()
+
+    report = BalanceVerifier(db_session, chunk_size=3).run()
+    assert report.completed
+    assert report.progress.lines == 12  # 삭제된 분개의 라인 2개 제외
+    assert [(drift.account_id, drift.expected_credit, drift.stored_credit) for drift in report.drifts] == sorted(
+        [(ids["revenue"], 1500, 1), (ids["salary"], 0, 0)]
+    )
+
+    repaired = BalanceVerifier(db_session, chunk_size=3).run(repair=True)
+    assert repaired.repaired
+    assert BalanceVerifier(db_session, chunk_size=3).run().drifts == []
+
+
+def test_verifier_resumes_from_checkpoint(client, db_session, sample_accounts, tmp_path):
+    """중단 후 같은 체크포인트로 실행하면 이어서 검사하고 전체 검사와 같은 결과를 낸다"""
+    ids = _post_entries(client, sample_accounts)
+    db_session.execute(
+        update(AccountBalance).where(AccountBalance.account_id == ids["salary"]).values(balance=0)
+    )
+    db_session.commit()
+    checkpoint = tmp_path / "verify.json"
+
+    partial = BalanceVerifier(db_session, chunk_size=4, checkpoint_path=checkpoint).run(max_chunks=2)
+    assert not partial.completed
+    assert partial.progress.after_line_id == 8
+    assert checkpoint.exists()
+
+    # 검사 도중 추가된 분개는 차이로 보고하지 않음
+    client.post("/api/v1/journal-entries", json=_entry(ids["cash"], ids["revenue"], "2025-02-01", 70))
+
+    resumed = BalanceVerifier(db_session, chunk_size=4, checkpoint_path=checkpoint).run()
+    assert resumed.completed
+    assert resumed.progress.chunks == 4
+    assert [drift.account_id for drift in resumed.drifts] == [ids["salary"]]
+    assert not checkpoint.exists()
@@ -0,0 +1,75 @@
+import asyncio
+
+from app.api.event_router import stream_events
+from app.core.database import engine
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def test_changes_api_pages_through_journal_and_account_changes(client, sample_accounts):
+    """분개/계정 변경은 커밋 순서대로 순번이 매겨지고 since로 이어 받을 수 있다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+
+    created = client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-10", 1000)).json()
+    # 검증 실패로 롤백된 요청은 기록되지 않음
+    assert client.post("/api/v1/journal-entries", json=_entry(cash, 99999, "2025-01-11", 10)).status_code == 400
+    client.put(f"/api/v1/accounts/{revenue}", json={"name": "매출(변경)"})
+    client.delete(f"/api/v1/journal-entries/{created['id']}")
+
+    first = client.get("/api/v1/changes", params={"since": 0, "limit": 2}).json()
+    assert first["has_more"] is True
+    second = client.get("/api/v1/changes", params={"since": first["next_since"], "limit": 2}).json()
+    assert second["has_more"] is False
+
+    changes = first["changes"] + second["changes"]
+    assert [change["event_type"] for change in changes] == [
+        "journal_entry.created",
+        "account.updated",
+        "journal_entry.deleted",
+    ]
+    assert [change["seq"] for change in changes] == [1, 2, 3]
+    assert changes[0]["entity_id"] == created["id"]
+    assert changes[0]["payload"]["account_ids"] == sorted([cash, revenue])
+    # 계정 변경은 원장 버전을 올리지 않음
+    assert [change["ledger_version"] for change in changes] == [1, None, 2]
+
+    empty = client.get("/api/v1/changes", params={"since": second["next_since"]}).json()
+    assert empty == {"changes": [], "next_since": 3, "has_more": False}
+
+
+def test_event_stream_replays_changes_after_last_event_id(client, sample_accounts):
+    """재연결한 SSE 클라이언트는 Last-Event-ID 이후의 변경을 로그에서 먼저 받고, 스트림은 DB 연결을 쥐지 않는다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    for day in ("2025-01-10", "2025-01-11", "2025-01-12"):
+        client.post("/api/v1/journal-entries", json=_entry(cash, revenue, day, 100))
+
+    class _ConnectedRequest:
+        async def is_disconnected(self) -> bool:
+            return False
+
+    async def scenario():
+        response = await stream_events(_ConnectedRequest(), last_event_id=1)
+        stream = response.body_iterator
+        chunks = [await stream.__anext__() for _ in range(3)]
+        assert engine.pool.checkedout() == baseline
+        await stream.aclose()
+        return chunks
+
+    # 로그 재전송용 세션은 스트리밍 전에 닫혀 연결이 풀로 돌아가 있어야 함
+    baseline = engine.pool.checkedout()
+    retry, second, third = asyncio.run(scenario())
+    assert retry.startswith("retry:")
+    assert second.startswith("id: 2\nevent: journal_entry.created\n")
+    assert '"dates":["2025-01-11"]' in second
+    assert third.startswith("id: 3\n")
@@ -112,3 +112,72 @@ def test_journal_entries_pagination_offset(client, sample_accounts):
     data = response.json()
     assert len(data) == 1
     assert data[0]["date"].startswith("2025-01-14")
+
+
+def test_journal_write_endpoints_do_not_reload_written_rows(client, sample_accounts, statement_counter):
+    """쓰기 엔드포인트는 방금 기록한 분개를 다시 SELECT 하지 않고 메모리 상태로 응답한다"""
+    debit_account = sample_accounts["501"]
+    credit_account = sample_accounts["101"]
+    payload = _entry_payload(debit_account.id, credit_account.id)
+
+    with statement_counter() as create_statements:
+        response = client.post("/api/v1/journal-entries", json=payload)
+    assert response.status_code == 201
+    entry_id = response.json()["id"]
+    # 러닝 잔액 반영 UPDATE, 원장 버전 증가 UPSERT, 변경 로그 INSERT, 계정 카탈로그 지문 조회 각 1건 포함
+    assert len(create_statements) <= 10
+    assert not any(sql.startswith("SELECT journal_entries") for sql in create_statements)
+
+    payload["description"] = "급여 지급(수정)"
+    with statement_counter() as update_statements:
+        response = client.put(f"/api/v1/journal-entries/{entry_id}", json=payload)
+    assert response.status_code == 200
+    assert response.json()["description"] == "급여 지급(수정)"
+    assert len(response.json()["lines"]) == 2
+    # 계정 카탈로그 지문 조회 1건 포함
+    assert len(update_statements) <= 7
+
+    with statement_counter() as delete_statements:
+        response = client.delete(f"/api/v1/journal-entries/{entry_id}")
+    assert response.status_code == 200
+    assert response.json()["data"]["is_deleted"] is True
+    assert len(delete_statements) <= 9
+
+
+def test_create_journal_entry_idempotency_key(client, sample_accounts, statement_counter):
+    """같은 Idempotency-Key로 재시도하면 분개를 다시 만들지 않고 최초 응답을 반환한다"""
+    payload = _entry_payload(sample_accounts["501"].id, sample_accounts["101"].id)
+    headers = {"Idempotency-Key": "pos-42-retry"}
+
+    first = client.post("/api/v1/journal-entries", json=payload, headers=headers)
+    assert first.status_code == 201
+
+    with statement_counter() as statements:
+        retry = client.post("/api/v1/journal-entries", json=payload, headers=headers)
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    # PK 단건 조회만 실행 (검증/INSERT/잔액 재계산 없음)
+    assert len(statements) == 1
+    assert statements[0].startswith("SELECT")
+
+    entries = client.get("/api/v1/journal-entries").json()
+    assert [entry["id"] for entry in entries] == [first.json()["id"]]
+
+    payload["description"] = "다른 요청"
+    response = client.post("/api/v1/journal-entries", json=payload, headers=headers)
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "IDEMPOTENCY_KEY_REUSED"
+
+
+def test_expired_idempotency_key_creates_new_entry(client, sample_accounts, monkeypatch):
+    """보관 기간이 지난 키는 새 요청으로 처리한다"""
+    from app.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "idempotency_key_ttl", 0)
+    payload = _entry_payload(sample_accounts["501"].id, sample_accounts["101"].id)
+    headers = {"Idempotency-Key": "expired-key"}
+
+    first = client.post("/api/v1/journal-entries", json=payload, headers=headers)
+    second = client.post("/api/v1/journal-entries", json=payload, headers=headers)
+    assert first.status_code == second.status_code == 201
+    assert first.json()["id"] != second.json()["id"]
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, update
+
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+from app.services.balance_verifier import BalanceVerifier
+from app.services.journal_archive_service import JournalArchiveService
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def _delete(client, db_session, entry_id: int, days_ago: int) -> None:
+    client.delete(f"/api/v1/journal-entries/{entry_id}")
+    db_session.execute(
+        update(JournalEntry)
+        .where(JournalEntry.id == entry_id)
+        .values(updated_at=datetime.utcnow() - timedelta(days=days_ago))
+    )
+    db_session.commit()
+
+
+def test_archive_moves_old_deleted_entries(client, db_session, sample_accounts):
+    """보관 기간이 지난 삭제 분개만 보관 테이블로 옮기고, 옮긴 분개는 ID로 조회된다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    ids = [
+        client.post("/api/v1/journal-entries", json=_entry(cash, revenue, f"2025-01-0{day}", day * 100)).json()["id"]
+        for day in range(1, 6)
+    ]
+    _delete(client, db_session, ids[0], days_ago=40)
+    _delete(client, db_session, ids[1], days_ago=35)
+    _delete(client, db_session, ids[2], days_ago=5)
+    trial_before = client.get("/api/v1/trial-balance", params={"from": "2025-01-01", "to": "2025-12-31"}).json()
+
+    report = JournalArchiveService(db_session).archive_deleted(retention_days=30, batch_size=1)
+    assert (report.entries, report.lines, report.batches) == (2, 4, 2)
+
+    hot_ids = set(db_session.scalars(select(JournalEntry.id)))
+    assert hot_ids == set(ids[2:])
+    assert db_session.scalar(select(func.count()).select_from(JournalLine)) == 6
+
+    archived = client.get(f"/api/v1/journal-entries/archived/{ids[0]}").json()
+    assert archived["is_deleted"] is True
+    assert archived["date"] == "2025-01-01"
+    assert [(line["account_id"], int(line["debit"]), int(line["credit"])) for line in archived["lines"]] == [
+        (cash, 100, 0),
+        (revenue, 0, 100),
+    ]
+    assert client.get(f"/api/v1/journal-entries/{ids[0]}").status_code == 404
+    assert client.get(f"/api/v1/journal-entries/archived/{ids[2]}").status_code == 404
+
+    # 삭제된 분개는 집계에 포함되지 않으므로 리포트, 원장 버전, 잔액 요약은 그대로
+    trial_after = client.get("/api/v1/trial-balance", params={"from": "2025-01-01", "to": "2025-12-31"}).json()
+    assert trial_after == trial_before
+    assert BalanceVerifier(db_session).run().drifts == []
+
+    # 다시 실행하면 옮길 대상 없음
+    assert JournalArchiveService(db_session).archive_deleted(retention_days=30).entries == 0
+
+
+def _line_ids(db_session, entry_id: int) -> list[int]:
+    return sorted(db_session.scalars(select(JournalLine.id).where(JournalLine.entry_id == entry_id)))
+
+
+def test_archive_never_collides_with_reused_ids(client, db_session, sample_accounts):
+    """운영 테이블의 ID는 재사용되지 않으므로 최대 ID 분개를 옮기고 라인을 줄여도 보관이 계속된다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    three_lines = {
+        "date": "2025-01-02",
+        "description": "거래",
+        "lines": [
+            {"account_id": cash, "debit": 100, "credit": 0},
+            {"account_id": cash, "debit": 50, "credit": 0},
+            {"account_id": revenue, "debit": 0, "credit": 150},
+        ],
+    }
+    live = client.post("/api/v1/journal-entries", json=three_lines).json()["id"]
+    archived = client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-01", 100)).json()["id"]
+    _delete(client, db_session, archived, days_ago=100)
+    archived_lines = _line_ids(db_session, archived)
+    # 최대 ID 분개도 옮김
+    assert JournalArchiveService(db_session).archive_deleted(retention_days=30).entries == 1
+
+    # 라인을 줄이면 남는 라인이 물리 삭제됨
+    before = _line_ids(db_session, live)
+    client.put(f"/api/v1/journal-entries/{live}", json=_entry(cash, revenue, "2025-01-02", 150))
+    db_session.expire_all()
+    (removed,) = set(before) - set(_line_ids(db_session, live))
+
+    created = client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-03", 300)).json()["id"]
+    assert created > archived
+    assert min(_line_ids(db_session, created)) > max(archived_lines + [removed])
+    _delete(client, db_session, created, days_ago=100)
+    assert JournalArchiveService(db_session).archive_deleted(retention_days=30).entries == 1
+    assert client.get(f"/api/v1/journal-entries/archived/{archived}").status_code == 200
+    assert client.get(f"/api/v1/journal-entries/archived/{created}").status_code == 200
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models.account_balance import AccountBalance
+from app.models.balance_recalc_outbox import BalanceRecalcOutbox
+from app.models.journal_entry import JournalEntry
+from app.schemas.journal_schema import JournalEntryCreate, JournalLineCreate
+from app.services.journal_group_commit import JournalGroupCommitter, PendingPosting, journal_committer
+
+
+def _payload(debit_account_id: int, credit_account_id: int, amount: int) -> JournalEntryCreate:
+    return JournalEntryCreate(
+        date=date(2025, 1, 5),
+        description="매출",
+        lines=[
+            JournalLineCreate(account_id=debit_account_id, debit=Decimal(amount), credit=Decimal("0")),
+            JournalLineCreate(account_id=credit_account_id, debit=Decimal("0"), credit=Decimal(amount)),
+        ],
+    )
+
+
+def test_group_commit_processes_batch_in_one_transaction(db_session, sample_accounts, statement_counter):
+    """한 묶음의 분개를 한 번의 커밋과 한 번의 잔액 재계산으로 처리하고, 실패한 요청만 제외한다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    postings = [PendingPosting(_payload(cash.id, revenue.id, amount)) for amount in (1000, 2000, 3000)]
+    invalid = PendingPosting(_payload(cash.id, 99999, 500))
+
+    committer = JournalGroupCommitter(session_factory=SessionLocal)
+    with statement_counter() as statements:
+        committer.process([postings[0], invalid, *postings[1:]])
+
+    assert [posting.future.result().lines[0].debit for posting in postings] == [1000, 2000, 3000]
+    with pytest.raises(HTTPException) as exc_info:
+        invalid.future.result()
+    assert exc_info.value.detail["code"] == "ACCOUNT_NOT_FOUND"
+
+    assert sum(sql.startswith("INSERT INTO account_balances") for sql in statements) == 1
+    assert db_session.query(JournalEntry).count() == 3
+    assert db_session.get(AccountBalance, cash.id).total_debit == 6000
+
+
+def test_group_commit_writer_resolves_concurrent_submissions(db_session, sample_accounts):
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+
+    committer = JournalGroupCommitter(session_factory=SessionLocal, max_wait=0.05)
+    committer.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = list(
+                pool.map(lambda amount: committer.submit(_payload(cash.id, revenue.id, amount)), range(1, 21))
+            )
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        committer.stop()
+
+    assert len({result.id for result in results}) == 20
+    db_session.expire_all()
+    assert db_session.get(AccountBalance, revenue.id).balance == -sum(range(1, 21))
+
+
+def test_group_mode_falls_back_and_times_out(client, db_session, sample_accounts, monkeypatch):
+    """작성기가 멈춰 있으면 직접 커밋하고, 결과가 늦으면 요청을 취소하고 503을 반환한다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    body = _payload(cash.id, revenue.id, 100).model_dump(mode="json")
+    monkeypatch.setattr(get_settings(), "journal_write_mode", "group")
+    monkeypatch.setattr(get_settings(), "group_commit_timeout", 0.05)
+
+    # 작성기 스레드가 없으면 요청 트랜잭션에서 바로 커밋
+    assert not journal_committer.is_running
+    assert client.post("/api/v1/journal-entries", json=body).status_code == 201
+
+    # 대기열을 꺼내지 않는 작성기: 시간 초과 후 취소된 요청은 나중에 처리되어도 저장되지 않음
+    stalled = JournalGroupCommitter(session_factory=SessionLocal)
+    monkeypatch.setattr(JournalGroupCommitter, "is_running", property(lambda self: True))
+    monkeypatch.setattr("app.api.journal_router.journal_committer", stalled)
+    response = client.post("/api/v1/journal-entries", json=body)
+    assert response.status_code == 503
+    assert response.json()["detail"]["code"] == "JOURNAL_WRITE_TIMEOUT"
+    assert response.json()["detail"]["details"]["cancelled"] is True
+
+    stalled.process([stalled._queue.get_nowait()])
+    db_session.expire_all()
+    assert db_session.query(JournalEntry).count() == 1
+
+
+def test_group_commit_honors_background_recalc_mode(db_session, sample_accounts, statement_counter, monkeypatch):
+    """background 모드에서는 아웃박스에 기록하고, read_your_writes 요청이 섞이면 묶음 전체를 즉시 재계산한다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    monkeypatch.setattr(get_settings(), "balance_recalc_mode", "background")
+    committer = JournalGroupCommitter(session_factory=SessionLocal)
+
+    postings = [PendingPosting(_payload(cash.id, revenue.id, amount)) for amount in (1000, 2000)]
+    with statement_counter() as statements:
+        committer.process(postings)
+    assert [posting.future.result().lines[0].debit for posting in postings] == [1000, 2000]
+    assert not any(sql.startswith("INSERT INTO account_balances") for sql in statements)
+    assert set(db_session.scalars(select(BalanceRecalcOutbox.account_id))) == {cash.id, revenue.id}
+    assert db_session.get(AccountBalance, cash.id) is None
+
+    mixed = [
+        PendingPosting(_payload(cash.id, revenue.id, 300)),
+        PendingPosting(_payload(cash.id, revenue.id, 400), read_your_writes=True),
+    ]
+    with statement_counter() as statements:
+        committer.process(mixed)
+    assert sum(sql.startswith("INSERT INTO account_balances") for sql in statements) == 1
+    db_session.expire_all()
+    assert db_session.get(AccountBalance, cash.id).total_debit == 3700
@@ -5,7 +5,7 @@ import pytest
 from fastapi import HTTPException
 
 from app.schemas.common import ErrorCode
-from app.schemas.journal_schema import JournalEntryCreate, JournalLineCreate
+from app.schemas.journal_schema import JournalEntryCreate, JournalEntryUpdate, JournalLineCreate
 from app.services.journal_service import JournalService
 
 
@@ -92,3 +92,102 @@ def test_create_journal_entry_inactive_account(db_session, sample_accounts):
         service.create_entry(payload)
 
     assert exc_info.value.detail["code"] == ErrorCode.INACTIVE_ACCOUNT
+
+
+def _update_payload(lines: list[tuple[int, Decimal, Decimal]], description: str = "급여 지급") -> JournalEntryUpdate:
+    return JournalEntryUpdate(
+        date=date(2025, 1, 5),
+        description=description,
+        lines=[
+            JournalLineCreate(account_id=account_id, debit=debit, credit=credit)
+            for account_id, debit, credit in lines
+        ],
+    )
+
+
+def test_update_entry_description_only_keeps_lines(db_session, sample_accounts, statement_counter):
+    debit_account = sample_accounts["501"]
+    credit_account = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    created = service.create_entry(
+        _build_payload(debit_account.id, credit_account.id, Decimal("800000"), Decimal("800000"))
+    )
+    original_line_ids = [line.id for line in created.lines]
+
+    payload = _update_payload(
+        [
+            (debit_account.id, Decimal("800000"), Decimal("0")),
+            (credit_account.id, Decimal("0"), Decimal("800000")),
+        ],
+        description="급여 지급(적요 수정)",
+    )
+    with statement_counter() as statements:
+        updated = service.update_entry(created.id, payload)
+
+    assert updated.description == "급여 지급(적요 수정)"
+    assert [line.id for line in updated.lines] == original_line_ids
+    assert not any("journal_lines" in sql and not sql.startswith("SELECT") for sql in statements)
+    assert not any("account_balances" in sql for sql in statements)
+
+
+def test_update_entry_diffs_lines(db_session, sample_accounts):
+    salary = sample_accounts["501"]
+    supplies = sample_accounts["502"]
+    cash = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    created = service.create_entry(
+        _build_payload(salary.id, cash.id, Decimal("800000"), Decimal("800000"))
+    )
+    kept_line_id = next(line.id for line in created.lines if line.account_id == cash.id)
+
+    repo_payload = _update_payload(
+        [
+            (supplies.id, Decimal("500000"), Decimal("0")),
+            (salary.id, Decimal("300000"), Decimal("0")),
+            (cash.id, Decimal("0"), Decimal("800000")),
+        ]
+    )
+    entry = service.get_entry(created.id)
+    updated, changed_ids = service.repo.update_entry(entry, repo_payload)
+    db_session.commit()
+
+    assert changed_ids == {salary.id, supplies.id}
+    assert kept_line_id in {line.id for line in updated.lines}
+
+    db_session.expire_all()
+    reloaded = service.get_entry(created.id)
+    amounts = sorted((line.account_id, line.debit, line.credit) for line in reloaded.lines)
+    assert amounts == sorted([
+        (supplies.id, Decimal("500000"), Decimal("0")),
+        (salary.id, Decimal("300000"), Decimal("0")),
+        (cash.id, Decimal("0"), Decimal("800000")),
+    ])
+
+    shrink_payload = _update_payload(
+        [
+            (salary.id, Decimal("800000"), Decimal("0")),
+            (cash.id, Decimal("0"), Decimal("800000")),
+        ]
+    )
+    updated = service.update_entry(created.id, shrink_payload)
+    assert len(updated.lines) == 2
+    assert sample_accounts["502"].balance_summary.total_debit == Decimal("0")
+
+
+def test_amounts_are_loaded_as_integers(db_session, sample_accounts):
+    debit_account = sample_accounts["501"]
+    credit_account = sample_accounts["101"]
+
+    service = JournalService(db_session)
+    created = service.create_entry(
+        _build_payload(debit_account.id, credit_account.id, Decimal("800000"), Decimal("800000"))
+    )
+
+    db_session.expire_all()
+    reloaded = service.get_entry(created.id)
+    debit_line = next(line for line in reloaded.lines if line.account_id == debit_account.id)
+    assert debit_line.debit == 800000
+    assert type(debit_line.debit) is int
+    assert type(debit_account.balance_summary.balance) is int
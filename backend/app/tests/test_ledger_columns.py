@@ -0,0 +1,143 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.repositories.balance_index import balance_index
+from app.repositories.ledger_columns import LedgerColumns, ledger_columns
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.services.trial_balance_service import TrialBalanceService
+
+
+@pytest.fixture
+def numpy_engine(monkeypatch):
+    monkeypatch.setattr(get_settings(), "trial_balance_engine", "numpy")
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int, description: str = "거래") -> dict:
+    return {
+        "date": date_str,
+        "description": description,
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def _sql_trial_balance(db_session, monkeypatch, from_date, to_date, include_recent=False):
+    monkeypatch.setattr(get_settings(), "trial_balance_engine", "sql")
+    try:
+        return TrialBalanceService(db_session).get_trial_balance(from_date, to_date, include_recent)
+    finally:
+        monkeypatch.setattr(get_settings(), "trial_balance_engine", "numpy")
+
+
+def test_numpy_engine_matches_sql_and_refreshes_incrementally(
+    client, db_session, sample_accounts, numpy_engine, monkeypatch, statement_counter
+):
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    salary = sample_accounts["501"]
+    period = (date(2025, 2, 1), date(2025, 2, 28))
+
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-10", 10000))
+    for day in range(1, 8):
+        client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, f"2025-02-0{day}", day * 100, f"매출 {day}"))
+    salary_entry = client.post(
+        "/api/v1/journal-entries", json=_entry(salary.id, cash.id, "2025-02-15", 3000)
+    ).json()
+
+    numpy_result = TrialBalanceService(db_session).get_trial_balance(*period)
+    assert numpy_result == _sql_trial_balance(db_session, monkeypatch, *period)
+
+    # 추가 변경이 없으면 원장 버전만 확인하고 라인은 메모리에서 계산
+    with statement_counter() as statements:
+        TrialBalanceService(db_session).get_trial_balance(date(2025, 2, 2), date(2025, 2, 20))
+    assert not any("journal_lines" in sql for sql in statements)
+
+    # 수정(거래일/금액)·삭제·신규 분개가 다음 조회에 반영된다
+    client.put(
+        f"/api/v1/journal-entries/{salary_entry['id']}",
+        json=_entry(salary.id, cash.id, "2025-01-20", 4500),
+    )
+    first_id = client.get("/api/v1/journal-entries", params={"from": "2025-02-01"}).json()[-1]["id"]
+    client.delete(f"/api/v1/journal-entries/{first_id}")
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-02-20", 999))
+
+    numpy_result = TrialBalanceService(db_session).get_trial_balance(*period, include_recent=True)
+    assert numpy_result == _sql_trial_balance(db_session, monkeypatch, *period, include_recent=True)
+    cash_row = next(row for row in numpy_result.rows if row.account_id == cash.id)
+    assert cash_row.opening_balance.amount == 10000 - 4500
+    assert [entry.debit for entry in cash_row.recent_entries][:2] == [999, 700]
+
+
+def test_numpy_engine_takes_precedence_over_balance_index(
+    client, db_session, sample_accounts, numpy_engine, monkeypatch
+):
+    """기본 설정(BALANCE_INDEX=1)에서도 numpy 엔진이 켜지면 기초/기간 합계를 열 엔진으로 계산한다"""
+    assert get_settings().balance_index_enabled
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-10", 10000))
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-02-10", 300))
+    balance_index.rebuild(db_session)
+    db_session.rollback()
+
+    calls = []
+    for name in ("totals_before", "period_totals"):
+        original = getattr(ledger_columns, name)
+        monkeypatch.setattr(
+            ledger_columns, name, lambda *args, _name=name, _original=original: calls.append(_name) or _original(*args)
+        )
+    monkeypatch.setattr(balance_index, "totals_before", lambda *args: pytest.fail("잔액 인덱스 사용"))
+    monkeypatch.setattr(balance_index, "range_totals", lambda *args: pytest.fail("잔액 인덱스 사용"))
+
+    result = TrialBalanceService(db_session).get_trial_balance(date(2025, 2, 1), date(2025, 2, 28))
+    assert {"totals_before", "period_totals"} <= set(calls)
+    cash_row = next(row for row in result.rows if row.account_id == cash.id)
+    assert cash_row.opening_balance.amount == 10000
+    assert cash_row.ending_balance.amount == 10300
+
+
+def test_refresh_builds_columns_outside_lock(client, db_session, sample_accounts, numpy_engine, monkeypatch):
+    """새 열을 읽는 동안 잠금을 잡지 않아 다른 조회는 기존 스냅샷을 읽고, 끝나면 교체된다"""
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    period = (date(2025, 1, 1), date(2025, 1, 31))
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-10", 1000))
+    loaded_version = LedgerStateRepository(db_session).current()
+    assert ledger_columns.period_totals(db_session, [cash.id], *period, loaded_version) == {cash.id: (1000, 0, 1)}
+    db_session.rollback()
+    client.post("/api/v1/journal-entries", json=_entry(cash.id, revenue.id, "2025-01-20", 500))
+    db_session.rollback()
+    version = LedgerStateRepository(db_session).current()
+    db_session.rollback()
+
+    started, release = threading.Event(), threading.Event()
+    original = LedgerColumns._load_changes
+
+    def slow_load(self, *args):
+        started.set()
+        assert release.wait(5)
+        return original(self, *args)
+
+    monkeypatch.setattr(LedgerColumns, "_load_changes", slow_load)
+    with SessionLocal() as session, ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(ledger_columns.period_totals, session, [cash.id], *period, version)
+        assert started.wait(5)
+        # 갱신 중에도 잠금이 풀려 있어 이전 버전 조회는 기존 스냅샷으로 바로 응답
+        assert not ledger_columns._lock.locked()
+        assert ledger_columns.period_totals(db_session, [cash.id], *period, loaded_version) == {
+            cash.id: (1000, 0, 1)
+        }
+        release.set()
+        assert future.result(timeout=5) == {cash.id: (1500, 0, 2)}
+
+    assert ledger_columns._snapshot.version == version
+    assert not ledger_columns._stale
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+from app.api.event_router import _event_stream
+from app.services.ledger_events import LedgerEvent, ledger_events
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def test_journal_and_account_changes_are_published_after_commit(client, sample_accounts):
+    """분개/계정 변경은 커밋 후 구독자에게 전달되고 실패한 요청은 이벤트를 남기지 않는다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+
+    async def scenario():
+        subscription = ledger_events.subscribe()
+        try:
+            created = await asyncio.to_thread(
+                lambda: client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-10", 1000)).json()
+            )
+            # 서비스 검증에서 실패해 롤백되는 요청 (없는 계정)
+            invalid = _entry(cash, 99999, "2025-01-11", 10)
+            assert (await asyncio.to_thread(client.post, "/api/v1/journal-entries", json=invalid)).status_code == 400
+            await asyncio.to_thread(
+                client.put, f"/api/v1/journal-entries/{created['id']}", json=_entry(salary, cash, "2025-02-01", 500)
+            )
+            await asyncio.to_thread(client.put, f"/api/v1/accounts/{salary}", json={"name": "급여(변경)"})
+
+            return created, [await asyncio.wait_for(subscription.get(), timeout=1) for _ in range(3)]
+        finally:
+            ledger_events.unsubscribe(subscription)
+
+    created, (first, second, third) = asyncio.run(scenario())
+    assert first.type == "journal_entry.created"
+    assert first.data["entry_id"] == created["id"]
+    assert first.data["account_ids"] == sorted([cash, revenue])
+    assert first.data["dates"] == ["2025-01-10"]
+    # 수정 이벤트는 수정 전후 계정과 거래일을 모두 포함
+    assert second.type == "journal_entry.updated"
+    assert second.data["account_ids"] == sorted([cash, revenue, salary])
+    assert second.data["dates"] == ["2025-01-10", "2025-02-01"]
+    assert second.data["ledger_version"] == first.data["ledger_version"] + 1
+    assert third.type == "account.updated"
+    assert third.data["account_id"] == salary
+    assert ledger_events.subscriber_count == 0
+
+
+def test_event_stream_encodes_sse_messages():
+    """스트림은 재연결 간격 다음에 id/event/data 형식의 메시지를 보내고 종료 시 구독을 해제한다"""
+
+    class _ConnectedRequest:
+        async def is_disconnected(self) -> bool:
+            return False
+
+    async def scenario():
+        subscription = ledger_events.subscribe()
+        stream = _event_stream(_ConnectedRequest(), subscription, heartbeat=0.01)
+        chunks = [await stream.__anext__(), await stream.__anext__()]
+        published = LedgerEvent(id=7, type="account.created", data={"account_id": 7, "code": "199", "is_active": True})
+        ledger_events.publish(published)
+        while True:
+            chunk = await stream.__anext__()
+            if not chunk.startswith(":"):
+                break
+        await stream.aclose()
+        return chunks, chunk, published
+
+    (retry, keep_alive), message, published = asyncio.run(scenario())
+    assert retry == "retry: 3000\n\n"
+    assert keep_alive == ": keep-alive\n\n"
+    lines = message.rstrip("\n").split("\n")
+    assert lines[:2] == [f"id: {published.id}", "event: account.created"]
+    assert json.loads(lines[2].removeprefix("data: ")) == {"account_id": 7, "code": "199", "is_active": True}
+    assert ledger_events.subscriber_count == 0
@@ -0,0 +1,129 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event, insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine
+from app.models.account import Account
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+from app.repositories.journal_archive_repo import JournalArchiveRepository
+from app.repositories.journal_repo import JournalRepository
+from app.repositories.trial_balance_repo import TrialBalanceRepository
+
+LIVE_INDEX = "ix_journal_entries_live_date_id"
+DELETED_INDEX = "ix_journal_entries_deleted_updated_at"
+
+
+def _query_plans(db_session, action) -> list[str]:
+    """action이 실행한 SELECT마다 EXPLAIN QUERY PLAN 결과를 한 문자열로 모아 반환"""
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    connection = db_session.connection()
+    return [
+        "\n".join(
+            row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        )
+        for statement, parameters in statements
+        if statement.lstrip().upper().startswith("SELECT")
+    ]
+
+
+def _fill_ledger(db_session, entries: int = 3000, accounts: int = 20) -> None:
+    """삭제 분개가 섞인 1년치 장부를 채우고 통계(ANALYZE)를 갱신"""
+    now = datetime.utcnow()
+    db_session.execute(
+        insert(Account),
+        [
+            {"id": index, "code": f"9{index:03d}", "name": f"계정 {index}", "type": "ASSET",
+             "is_active": True, "created_at": now, "updated_at": now}
+            for index in range(1, accounts + 1)
+        ],
+    )
+    db_session.execute(
+        insert(JournalEntry),
+        [
+            {"id": index, "date": date(2025, 1, 1) + timedelta(days=index % 365), "description": "",
+             "is_deleted": index % 10 == 0, "created_at": now, "updated_at": now}
+            for index in range(1, entries + 1)
+        ],
+    )
+    db_session.execute(
+        insert(JournalLine),
+        [
+            {"entry_id": index, "account_id": (index + side) % accounts + 1, "debit": 10 * (1 - side),
+             "credit": 10 * side, "created_at": now}
+            for index in range(1, entries + 1)
+            for side in (0, 1)
+        ],
+    )
+    db_session.commit()
+    db_session.connection().exec_driver_sql("ANALYZE")
+    db_session.commit()
+
+
+def test_entry_lists_use_live_partial_index(db_session):
+    """목록/요약 최신순 페이지는 삭제되지 않은 분개 부분 인덱스를 정렬 없이 읽는다"""
+    repo = JournalRepository(db_session)
+
+    (listing,) = _query_plans(db_session, lambda: repo.list_entries(limit=20))
+    assert LIVE_INDEX in listing
+    assert "ORDER BY" not in listing
+
+    (ranged,) = _query_plans(db_session, lambda: repo.list_entries(date(2025, 1, 1), date(2025, 3, 31)))
+    assert f"USING INDEX {LIVE_INDEX} (date>? AND date<?)" in ranged
+
+    (summary,) = _query_plans(db_session, lambda: repo.get_summary_list(date(2025, 1, 1), date(2025, 3, 31)))
+    assert f"USING INDEX {LIVE_INDEX} (date>? AND date<?)" in summary
+    # 모든 라인을 먼저 집계하지 않고 고른 분개의 라인만 entry_id로 찾음
+    assert "SCAN journal_lines" not in summary
+
+
+def test_period_aggregates_use_live_partial_index(db_session):
+    """짧은 기간의 기간/기초 합계는 거래일 범위를 부분 인덱스에서 찾아 라인을 조인한다"""
+    _fill_ledger(db_session)
+    repo = TrialBalanceRepository(db_session)
+    account_ids = list(range(1, 21))
+
+    plans = _query_plans(
+        db_session,
+        lambda: (
+            repo._scan_period_totals(account_ids, date(2025, 3, 1), date(2025, 3, 7)),
+            repo._scan_totals_before_period(account_ids, date(2025, 1, 10)),
+            repo._count_all_transactions(account_ids, date(2025, 3, 1), date(2025, 3, 7)),
+        ),
+    )
+    assert len(plans) == 3
+    for plan in plans:
+        assert f"USING INDEX {LIVE_INDEX}" in plan
+        assert "ix_journal_lines_entry_id (entry_id=?)" in plan
+
+
+def test_archive_candidates_use_deleted_partial_index(db_session):
+    """보관 대상 조회는 삭제된 분개 부분 인덱스의 삭제 시각 범위를 읽는다"""
+    _fill_ledger(db_session)
+    repo = JournalArchiveRepository(db_session)
+
+    (plan,) = _query_plans(db_session, lambda: repo.archivable_ids(datetime(2025, 1, 1), 100))
+    assert f"USING INDEX {DELETED_INDEX} (updated_at<?)" in plan
+
+
+def test_partial_indexes_compile_for_postgresql():
+    """PostgreSQL에서도 같은 조건의 부분 인덱스로 생성된다"""
+    indexes = {index.name: index for index in JournalEntry.__table__.indexes}
+    dialect = postgresql.dialect()
+
+    live = str(CreateIndex(indexes[LIVE_INDEX]).compile(dialect=dialect))
+    deleted = str(CreateIndex(indexes[DELETED_INDEX]).compile(dialect=dialect))
+    assert live.endswith("(date, id) WHERE is_deleted = false")
+    assert deleted.endswith("(updated_at) WHERE is_deleted = true")
@@ -0,0 +1,134 @@
+import csv
+import io
+import time
+
+import pytest
+
+
+@pytest.fixture
+def report_storage(tmp_path, monkeypatch):
+    from app.services.report_worker import report_worker
+
+    monkeypatch.setattr(report_worker, "storage_dir", tmp_path)
+    return tmp_path
+
+
+def _wait_for_job(client, job_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/v1/report-jobs/{job_id}").json()
+        if job["status"] in ("SUCCEEDED", "FAILED"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"report job {job_id} did not finish")
+
+
+def _post_entry(client, debit_id: int, credit_id: int, date_str: str, amount: int) -> None:
+    response = client.post(
+        "/api/v1/journal-entries",
+        json={
+            "date": date_str,
+            "description": "매출",
+            "lines": [
+                {"account_id": debit_id, "debit": amount, "credit": 0},
+                {"account_id": credit_id, "debit": 0, "credit": amount},
+            ],
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_trial_balance_report_job_roundtrip(client, sample_accounts, report_storage):
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    _post_entry(client, cash.id, revenue.id, "2025-03-01", 5000)
+
+    response = client.post(
+        "/api/v1/report-jobs",
+        json={"kind": "TRIAL_BALANCE", "from": "2025-01-01", "to": "2025-12-31"},
+    )
+    assert response.status_code == 202
+    assert response.json()["status"] == "PENDING"
+
+    job = _wait_for_job(client, response.json()["id"])
+    assert job["status"] == "SUCCEEDED"
+    assert job["download_url"] == f"/api/v1/report-jobs/{job['id']}/download"
+
+    download = client.get(job["download_url"])
+    assert download.status_code == 200
+    expected = client.get("/api/v1/trial-balance", params={"from": "2025-01-01", "to": "2025-12-31"})
+    assert download.json() == expected.json()
+    assert list(report_storage.iterdir()) == [report_storage / f"{job['id']}.json"]
+
+
+def test_journal_export_and_failed_job(client, sample_accounts, report_storage):
+    cash = sample_accounts["101"]
+    revenue = sample_accounts["401"]
+    _post_entry(client, cash.id, revenue.id, "2025-03-01", 5000)
+    _post_entry(client, cash.id, revenue.id, "2025-04-01", 7000)
+
+    job_id = client.post(
+        "/api/v1/report-jobs",
+        json={"kind": "JOURNAL_EXPORT", "from": "2025-03-15", "to": "2025-12-31"},
+    ).json()["id"]
+    assert _wait_for_job(client, job_id)["status"] == "SUCCEEDED"
+    download = client.get(f"/api/v1/report-jobs/{job_id}/download")
+    assert download.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(download.text)))
+    assert [(row["account_code"], row["debit"], row["credit"]) for row in rows] == [
+        ("101", "7000", "0"),
+        ("401", "0", "7000"),
+    ]
+
+    # 존재하지 않는 계정의 원장 → FAILED, 다운로드는 409
+    job_id = client.post(
+        "/api/v1/report-jobs",
+        json={"kind": "GENERAL_LEDGER", "from": "2025-01-01", "to": "2025-12-31", "account_id": 99999},
+    ).json()["id"]
+    job = _wait_for_job(client, job_id)
+    assert job["status"] == "FAILED"
+    assert job["error"]
+    response = client.get(f"/api/v1/report-jobs/{job_id}/download")
+    assert response.status_code == 409
+    assert response.json()["detail"]["code"] == "REPORT_NOT_READY"
+
+
+def test_report_job_validation(client, report_storage):
+    response = client.post(
+        "/api/v1/report-jobs",
+        json={"kind": "GENERAL_LEDGER", "from": "2025-01-01", "to": "2025-12-31"},
+    )
+    assert response.status_code == 422
+
+    response = client.get("/api/v1/report-jobs/unknown")
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "REPORT_JOB_NOT_FOUND"
+
+
+def test_rolled_back_submission_is_not_enqueued(db_session, monkeypatch):
+    """커밋에 실패해 롤백된 작업은 이후 같은 세션이 커밋해도 워커에 제출되지 않는다"""
+    from sqlalchemy.exc import OperationalError
+
+    from app.models.report_job import ReportJob
+    from app.schemas.report_job_schema import ReportJobCreate
+    from app.services.report_job_service import ReportJobService
+    from app.services.report_worker import report_worker
+
+    submitted = []
+    monkeypatch.setattr(report_worker, "submit", submitted.append)
+    payload = ReportJobCreate.model_validate({"kind": "TRIAL_BALANCE", "from": "2025-01-01", "to": "2025-01-31"})
+
+    def failing_commit():
+        raise OperationalError("COMMIT", {}, Exception("disk I/O error"))
+
+    monkeypatch.setattr(db_session, "commit", failing_commit)
+    with pytest.raises(Exception):
+        ReportJobService(db_session).submit(payload)
+    monkeypatch.delattr(db_session, "commit")
+
+    db_session.commit()
+    assert submitted == []
+    assert db_session.query(ReportJob).count() == 0
+
+    job = ReportJobService(db_session).submit(payload)
+    assert submitted == [job.id]
@@ -0,0 +1,124 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from app.core.database import SessionLocal, read_snapshot
+from app.repositories.balance_index import balance_index
+from app.repositories.ledger_state_repo import LedgerStateRepository
+from app.repositories.trial_balance_repo import TrialBalanceRepository
+
+
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int) -> dict:
+    return {
+        "date": date_str,
+        "description": "거래",
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def test_reports_expose_ledger_version(client, sample_accounts):
+    """분개 생성/수정/삭제마다 원장 버전이 오르고 리포트는 집계한 버전을 함께 응답한다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    params = {"from": "2025-01-01", "to": "2025-12-31"}
+
+    def versions() -> tuple[int, int]:
+        trial = client.get("/api/v1/trial-balance", params=params).json()
+        ledger = client.get("/api/v1/general-ledger", params={**params, "account_id": cash}).json()
+        return trial["ledger_version"], ledger["ledger_version"]
+
+    start, _ = versions()
+    created = client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-10", 1000)).json()
+    assert versions() == (start + 1, start + 1)
+    client.put(f"/api/v1/journal-entries/{created['id']}", json=_entry(cash, revenue, "2025-02-10", 700))
+    assert versions() == (start + 2, start + 2)
+    client.delete(f"/api/v1/journal-entries/{created['id']}")
+    assert versions() == (start + 3, start + 3)
+
+
+def test_balance_index_applies_commits_in_version_order(client, db_session, sample_accounts):
+    """버전이 건너뛴 커밋 증감분은 앞 버전이 반영될 때까지 보류된다"""
+    cash = sample_accounts["101"].id
+    client.post("/api/v1/journal-entries", json=_entry(cash, sample_accounts["401"].id, "2025-01-10", 1000))
+    balance_index.rebuild(db_session)
+    base = balance_index.version
+
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        balance_index.track_commit(first, [(cash, date(2025, 1, 20), 100, 0)], base + 1)
+        balance_index.track_commit(second, [(cash, date(2025, 1, 25), 20, 0)], base + 2)
+        # 나중 버전이 먼저 커밋되면 보류
+        balance_index._after_commit(second)
+        assert balance_index.version == base
+        balance_index._after_commit(first)
+    finally:
+        first.close()
+        second.close()
+
+    assert balance_index.version == base + 2
+    assert balance_index.totals_before(db_session, [cash], date(2025, 2, 1), base + 2) == {cash: (1120, 0)}
+
+
+def test_report_falls_back_to_sql_when_index_is_ahead(client, db_session, sample_accounts):
+    """인덱스가 리포트 스냅샷보다 최신이면 인덱스 대신 SQL로 집계한다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-10", 1000))
+    balance_index.rebuild(db_session)
+    version = LedgerStateRepository(db_session).current()
+    assert balance_index.version == version
+
+    # 인덱스가 모르는 이전 버전을 요청하면 None
+    assert balance_index.totals_before(db_session, [cash], date(2025, 2, 1), version - 1) is None
+
+    repo = TrialBalanceRepository(db_session)
+    repo.ledger_version = version - 1
+    assert repo.calculate_totals_before_period([cash], date(2025, 2, 1)) == {cash: (1000, 0)}
+    assert repo._calculate_all_period_totals([cash], date(2025, 1, 1), date(2025, 1, 31)) == {
+        cash: (1000, 0)
+    }
+
+
+def test_write_commits_while_snapshot_is_open(client, db_session, sample_accounts):
+    """리포트 읽기 스냅샷이 열려 있어도 다른 연결의 분개 쓰기가 잠금 대기 없이 커밋된다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    reader = SessionLocal()
+    try:
+        with read_snapshot(reader):
+            before = LedgerStateRepository(reader).current()
+            reader.execute(select(1)).all()
+
+            # client는 db_session(다른 연결)으로 커밋
+            response = client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-10", 1000))
+            assert response.status_code == 201
+
+            # 스냅샷은 커밋 전 시점을 계속 봄
+            assert LedgerStateRepository(reader).current() == before
+    finally:
+        reader.close()
+
+    assert LedgerStateRepository(db_session).current() == before + 1
+
+
+def test_reports_open_snapshot_before_first_query(client, sample_accounts, statement_counter, db_session, monkeypatch):
+    """리포트는 첫 쿼리 전에 스냅샷을 열고, 이미 시작된 트랜잭션에는 격리 수준 없이 진입하지 않는다"""
+    cash = sample_accounts["101"].id
+    params = {"from": "2025-01-01", "to": "2025-12-31"}
+    for path, extra in (("/api/v1/general-ledger", {"account_id": cash}), ("/api/v1/trial-balance", {})):
+        with statement_counter() as statements:
+            assert client.get(path, params={**params, **extra}).status_code == 200
+        # 스냅샷 전에는 요청 병합 키용 원장 버전 조회만 (그 트랜잭션은 바로 끝냄)
+        begin = statements.index("BEGIN DEFERRED")
+        assert all(sql.startswith("SELECT ledger_state.version") for sql in statements[:begin])
+
+    # PostgreSQL에서 READ COMMITTED로 이미 시작된 트랜잭션은 REPEATABLE READ로 바꿀 수 없음
+    db_session.execute(select(1))
+    monkeypatch.setattr(db_session.get_bind().dialect, "name", "postgresql")
+    with pytest.raises(RuntimeError):
+        with read_snapshot(db_session):
+            pass
@@ -0,0 +1,199 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.account_balance import AccountBalance
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+from app.repositories import running_balance_repo
+from app.repositories.running_balance_repo import RunningBalanceRepository, account_lock_query
+
+
+def _entry(date_str: str, lines: list[tuple[int, int, int]], description: str = "거래") -> dict:
+    return {
+        "date": date_str,
+        "description": description,
+        "lines": [
+            {"account_id": account_id, "debit": debit, "credit": credit}
+            for account_id, debit, credit in lines
+        ],
+    }
+
+
+def _stored(db_session) -> dict[int, int | None]:
+    db_session.expire_all()
+    return dict(db_session.execute(select(JournalLine.id, JournalLine.running_balance)).all())
+
+
+def _expected(db_session) -> dict[int, int | None]:
+    """삭제되지 않은 라인을 원장 순서로 다시 누적한 기대값"""
+    rows = db_session.execute(
+        select(
+            JournalLine.id,
+            JournalLine.account_id,
+            JournalLine.debit,
+            JournalLine.credit,
+            JournalEntry.is_deleted,
+        )
+        .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+        .order_by(JournalEntry.date, JournalEntry.id, JournalLine.id)
+    ).all()
+    balances: dict[int, int] = {}
+    expected: dict[int, int | None] = {}
+    for line_id, account_id, debit, credit, is_deleted in rows:
+        if is_deleted:
+            expected[line_id] = None
+            continue
+        balances[account_id] = balances.get(account_id, 0) + debit - credit
+        expected[line_id] = balances[account_id]
+    return expected
+
+
+def test_running_balance_resequences_back_dated_changes(client, db_session, sample_accounts):
+    """소급 입력·수정·삭제 후에도 저장된 러닝 잔액이 원장 순서 누적값과 같다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+
+    client.post("/api/v1/journal-entries", json=_entry("2025-03-10", [(cash, 1000, 0), (revenue, 0, 1000)]))
+    client.post("/api/v1/journal-entries", json=_entry("2025-03-20", [(cash, 500, 0), (revenue, 0, 500)]))
+    # 소급 입력: 이후 라인이 모두 밀려야 함
+    back_dated = client.post(
+        "/api/v1/journal-entries", json=_entry("2025-03-01", [(salary, 300, 0), (cash, 0, 300)])
+    ).json()
+    # 한 분개에 같은 계정 라인이 두 개
+    split = client.post(
+        "/api/v1/journal-entries",
+        json=_entry("2025-03-15", [(cash, 200, 0), (cash, 100, 0), (revenue, 0, 300)]),
+    ).json()
+    assert _stored(db_session) == _expected(db_session)
+
+    # 거래일을 뒤로 옮기고 금액 변경
+    client.put(
+        f"/api/v1/journal-entries/{back_dated['id']}",
+        json=_entry("2025-03-25", [(salary, 700, 0), (cash, 0, 700)]),
+    )
+    assert _stored(db_session) == _expected(db_session)
+
+    client.delete(f"/api/v1/journal-entries/{split['id']}")
+    assert _stored(db_session) == _expected(db_session)
+
+    # 전체 재계산 결과도 같다
+    RunningBalanceRepository(db_session).resequence()
+    assert _stored(db_session) == _expected(db_session)
+
+
+def test_general_ledger_uses_stored_running_balance(client, sample_accounts, statement_counter):
+    """원장은 저장된 러닝 잔액으로 응답하고 기초 잔액을 위해 라인을 합산하지 않는다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    for day, amount in (("2025-01-05", 1000), ("2025-02-05", 200), ("2025-02-10", 30)):
+        client.post("/api/v1/journal-entries", json=_entry(day, [(cash, amount, 0), (revenue, 0, amount)]))
+    client.post("/api/v1/journal-entries", json=_entry("2025-02-07", [(revenue, 50, 0), (cash, 0, 50)]))
+
+    with statement_counter() as statements:
+        response = client.get(
+            "/api/v1/general-ledger",
+            params={"account_id": cash, "from": "2025-02-01", "to": "2025-02-28"},
+        )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["opening_balance"]["amount"] == "1000"
+    assert [entry["balance"] for entry in data["entries"]] == ["1200", "1150", "1180"]
+    assert data["closing_balance"]["amount"] == "1180"
+    assert not any("sum(" in sql.lower() for sql in statements)
+
+
+def test_general_ledger_keyset_pages(client, sample_accounts, statement_counter):
+    """limit/cursor로 원장을 나눠 받고 각 페이지는 직전 누적 잔액을 함께 받는다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    client.post("/api/v1/journal-entries", json=_entry("2024-12-31", [(cash, 10, 0), (revenue, 0, 10)]))
+    for day in range(1, 8):
+        client.post(
+            "/api/v1/journal-entries",
+            json=_entry(f"2025-01-0{8 - day}", [(cash, day * 100, 0), (revenue, 0, day * 100)]),
+        )
+    params = {"account_id": cash, "from": "2025-01-01", "to": "2025-01-31"}
+    full = client.get("/api/v1/general-ledger", params=params).json()
+    assert full["next_cursor"] is None
+    assert full["page_opening_balance"] is None
+
+    pages = []
+    cursor = None
+    while True:
+        page_params = {**params, "limit": 3}
+        if cursor:
+            page_params["cursor"] = cursor
+        with statement_counter() as statements:
+            page = client.get("/api/v1/general-ledger", params=page_params).json()
+        # 스냅샷 시작, 원장 버전 조회(요청 병합 키, 스냅샷), 계정 카탈로그 지문 조회 포함
+        assert len(statements) <= 8
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [len(page["entries"]) for page in pages] == [3, 3, 1]
+    assert [entry for page in pages for entry in page["entries"]] == full["entries"]
+    # 페이지 기초 잔액 = 이전 페이지 마지막 행 잔액
+    assert pages[0]["page_opening_balance"]["amount"] == "10"
+    for previous, page in zip(pages, pages[1:]):
+        assert page["page_opening_balance"]["amount"] == previous["entries"][-1]["balance"]
+    for page in pages:
+        assert page["closing_balance"] == full["closing_balance"]
+        assert page["current"] == full["current"]
+
+    response = client.get("/api/v1/general-ledger", params={**params, "limit": 3, "cursor": "not-a-cursor"})
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "INVALID_CURSOR"
+
+
+def test_general_ledger_search_balances_accumulate_matching_lines(client, sample_accounts):
+    """검색 시 행 잔액은 기초 잔액 + 검색 결과 누적이며 페이지를 나눠도 기말 잔액과 맞는다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    client.post("/api/v1/journal-entries", json=_entry("2024-12-31", [(cash, 10, 0), (revenue, 0, 10)]))
+    for day, amount, description in (
+        ("2025-01-02", 100, "임대료"),
+        ("2025-01-03", 200, "매출"),
+        ("2025-01-04", 300, "임대료"),
+        ("2025-01-05", 400, "매출"),
+        ("2025-01-06", 500, "임대료"),
+    ):
+        client.post(
+            "/api/v1/journal-entries",
+            json=_entry(day, [(cash, amount, 0), (revenue, 0, amount)], description),
+        )
+    params = {"account_id": cash, "from": "2025-01-01", "to": "2025-01-31", "search": "임대료"}
+
+    full = client.get("/api/v1/general-ledger", params=params).json()
+    assert [entry["balance"] for entry in full["entries"]] == ["110", "410", "910"]
+    assert full["closing_balance"]["amount"] == full["entries"][-1]["balance"]
+
+    first = client.get("/api/v1/general-ledger", params={**params, "limit": 2}).json()
+    second = client.get(
+        "/api/v1/general-ledger", params={**params, "limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    assert second["page_opening_balance"]["amount"] == first["entries"][-1]["balance"] == "410"
+    assert first["entries"] + second["entries"] == full["entries"]
+
+
+def test_running_balance_locks_account_rows_in_id_order(client, db_session, sample_accounts, monkeypatch):
+    """행 잠금 DB에서는 러닝 잔액 반영 전에 계정 요약 행을 만들고 계정 ID 순서로 잠근다"""
+    sql = str(account_lock_query([3, 1]).compile(dialect=postgresql.dialect()))
+    assert sql.rstrip().endswith("ORDER BY account_balances.account_id FOR UPDATE")
+
+    # SQLite에서도 잠금 경로(요약 행 확보 + 잠금 조회)를 그대로 실행
+    monkeypatch.setattr(running_balance_repo, "uses_row_locks", lambda db: True)
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    created = client.post("/api/v1/journal-entries", json=_entry("2025-01-05", [(cash, 100, 0), (revenue, 0, 100)]))
+    client.post("/api/v1/journal-entries", json=_entry("2025-01-03", [(cash, 20, 0), (revenue, 0, 20)]))
+    client.put(
+        f"/api/v1/journal-entries/{created.json()['id']}",
+        json=_entry("2025-01-01", [(cash, 5, 0), (revenue, 0, 5)]),
+    )
+
+    assert _stored(db_session) == _expected(db_session)
+    locked = set(db_session.scalars(select(AccountBalance.account_id)))
+    assert {cash, revenue} <= locked
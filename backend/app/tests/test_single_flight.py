@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+def test_single_flight_shares_in_flight_result():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(flight.do, "key", compute)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "key", compute) for _ in range(4)]
+        time.sleep(0.2)  # 후속 호출이 진행 중인 계산에 합류할 시간
+        release.set()
+        results = [leader.result(), *(f.result() for f in followers)]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+    # 완료 후에는 캐시하지 않고 다시 계산
+    release.set()
+    flight.do("key", compute)
+    assert len(calls) == 2
+
+
+def test_single_flight_propagates_errors_and_clears_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    assert flight.in_flight() == 0
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_trial_balance_requests_are_coalesced(db_session, sample_accounts, monkeypatch):
+    """같은 기간의 동시 시산표 요청은 집계를 한 번만 실행한다"""
+    from app.core.database import SessionLocal
+    from app.services.trial_balance_service import TrialBalanceService
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    original = TrialBalanceService._build_trial_balance
+
+    def slow_build(self, from_date, to_date, *args):
+        calls.append((from_date, to_date))
+        started.set()
+        release.wait(5)
+        return original(self, from_date, to_date, *args)
+
+    monkeypatch.setattr(TrialBalanceService, "_build_trial_balance", slow_build)
+
+    def request():
+        with SessionLocal() as session:
+            return TrialBalanceService(session).get_trial_balance(date(2025, 1, 1), date(2025, 1, 31))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(request)
+        started.wait(5)
+        others = [pool.submit(request) for _ in range(3)]
+        time.sleep(0.2)
+        release.set()
+        results = [first.result(), *(f.result() for f in others)]
+
+    assert len(results) == 4
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_trial_balance_request_after_commit_does_not_join_older_flight(client, sample_accounts, monkeypatch):
+    """방금 분개를 커밋한 요청은 커밋 전에 시작된 시산표 계산에 합류하지 않는다"""
+    from app.core.database import SessionLocal
+    from app.services.trial_balance_service import TrialBalanceService
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    original = TrialBalanceService._build_trial_balance
+
+    def slow_build(self, from_date, to_date, *args):
+        calls.append(from_date)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+        return original(self, from_date, to_date, *args)
+
+    monkeypatch.setattr(TrialBalanceService, "_build_trial_balance", slow_build)
+
+    def request():
+        with SessionLocal() as session:
+            return TrialBalanceService(session).get_trial_balance(date(2025, 1, 1), date(2025, 1, 31))
+
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        stale = pool.submit(request)
+        started.wait(5)
+        client.post(
+            "/api/v1/journal-entries",
+            json={
+                "date": "2025-01-10",
+                "description": "매출",
+                "lines": [
+                    {"account_id": cash, "debit": 1000, "credit": 0},
+                    {"account_id": revenue, "debit": 0, "credit": 1000},
+                ],
+            },
+        )
+        fresh = request()
+        release.set()
+        stale.result()
+
+    assert len(calls) == 2
+    cash_row = next(row for row in fresh.rows if row.account_id == cash)
+    assert cash_row.total_debit == 1000
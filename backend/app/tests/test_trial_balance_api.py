@@ -0,0 +1,92 @@
+def _entry(debit_id: int, credit_id: int, date_str: str, amount: int, description: str = "거래") -> dict:
+    return {
+        "date": date_str,
+        "description": description,
+        "lines": [
+            {"account_id": debit_id, "debit": amount, "credit": 0},
+            {"account_id": credit_id, "debit": 0, "credit": amount},
+        ],
+    }
+
+
+def test_trial_balance_recent_entries_are_opt_in(client, sample_accounts, statement_counter):
+    """시산표는 기본적으로 최근 거래를 조회하지 않고 include_recent=true일 때만 채운다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    for day in range(1, 8):
+        client.post("/api/v1/journal-entries", json=_entry(cash, revenue, f"2025-01-0{day}", day * 100))
+
+    params = {"from": "2025-01-01", "to": "2025-01-31"}
+    with statement_counter() as statements:
+        response = client.get("/api/v1/trial-balance", params=params)
+    assert response.status_code == 200
+    cash_row = next(row for row in response.json()["rows"] if row["account_id"] == cash)
+    assert cash_row["recent_entries"] == []
+    assert cash_row["transaction_count"] == 7
+    assert not any("description" in sql for sql in statements)
+
+    response = client.get("/api/v1/trial-balance", params={**params, "include_recent": "true"})
+    cash_row = next(row for row in response.json()["rows"] if row["account_id"] == cash)
+    assert [entry["debit"] for entry in cash_row["recent_entries"]] == ["700", "600", "500", "400", "300"]
+
+
+def test_trial_balance_recent_endpoint(client, sample_accounts):
+    """계정별 최근 거래 엔드포인트는 삭제 분개를 빼고 최신순 limit건을 돌려준다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-05", 100, "첫 거래"))
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-02-05", 200, "둘째 거래"))
+    latest = client.post(
+        "/api/v1/journal-entries", json=_entry(cash, revenue, "2025-03-05", 300, "삭제될 거래")
+    ).json()
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-20", 50, "소급 거래"))
+    client.delete(f"/api/v1/journal-entries/{latest['id']}")
+
+    response = client.get(f"/api/v1/trial-balance/{cash}/recent", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["account_id"] == cash
+    assert [entry["description"] for entry in data["entries"]] == ["둘째 거래", "소급 거래"]
+
+    response = client.get(
+        f"/api/v1/trial-balance/{cash}/recent", params={"from": "2025-01-01", "to": "2025-01-31"}
+    )
+    assert [entry["date"] for entry in response.json()["entries"]] == ["2025-01-20", "2025-01-05"]
+
+    assert client.get("/api/v1/trial-balance/999999/recent").status_code == 404
+
+
+def test_trial_balance_filters_narrow_rows_and_aggregate(client, sample_accounts, statement_counter):
+    """type/코드 범위/계정 ID 필터는 집계 대상 계정을 줄이고 hide_zero는 0 잔액 행을 뺀다"""
+    cash = sample_accounts["101"].id
+    revenue = sample_accounts["401"].id
+    salary = sample_accounts["501"].id
+    client.post("/api/v1/journal-entries", json=_entry(cash, revenue, "2025-01-05", 1000))
+    client.post("/api/v1/journal-entries", json=_entry(salary, cash, "2025-01-10", 300))
+    params = {"from": "2025-01-01", "to": "2025-01-31"}
+
+    rows = client.get("/api/v1/trial-balance", params={**params, "type": "EXPENSE"}).json()["rows"]
+    assert {row["type"] for row in rows} == {"EXPENSE"}
+    assert salary in [row["account_id"] for row in rows]
+
+    rows = client.get("/api/v1/trial-balance", params={**params, "code_from": "400", "code_to": "499"}).json()["rows"]
+    assert [row["account_code"] for row in rows] == [
+        code for code in sorted(sample_accounts) if "400" <= code <= "499"
+    ]
+
+    with statement_counter() as statements:
+        response = client.get(
+            "/api/v1/trial-balance", params={**params, "account_ids": [cash, salary], "hide_zero": "true"}
+        )
+    data = response.json()
+    assert [row["account_id"] for row in data["rows"]] == [cash, salary]
+    assert data["total"]["debit"] == "1000"
+    # 집계 쿼리의 IN 목록도 지정한 계정만 포함
+    assert any("journal_lines.account_id IN (?, ?)" in sql for sql in statements)
+
+    rows = client.get("/api/v1/trial-balance", params={**params, "hide_zero": "true"}).json()["rows"]
+    assert {row["account_id"] for row in rows} == {cash, revenue, salary}
+
+    response = client.get("/api/v1/trial-balance", params={**params, "code_from": "500", "code_to": "100"})
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "INVALID_CODE_RANGE"
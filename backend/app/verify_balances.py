@@ -0,0 +1,81 @@
+"""
+계정 잔액 무결성 검사 CLI
+
+실행:
+    python -m app.verify_balances                      # 검사 (중단 시 같은 명령으로 이어서)
+    python -m app.verify_balances --repair             # 차이가 확인된 계정 재계산
+    python -m app.verify_balances --max-chunks 100     # 100구간만 처리하고 멈춤 (다음 실행에서 이어서)
+    python -m app.verify_balances --restart            # 체크포인트를 버리고 처음부터
+
+차이가 남아 있으면(복구하지 않은 경우) 종료 코드 1을 반환합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.core.database import SessionLocal
+from app.services.balance_verifier import BalanceVerifier, VerifyProgress
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="account_balances / account_usage 무결성 검사")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="한 번에 집계할 라인 수")
+    parser.add_argument(
+        "--checkpoint", type=Path, default=Path(".balance_verify.json"), help="진행 상태 파일"
+    )
+    parser.add_argument("--max-chunks", type=int, default=None, help="이번 실행에서 처리할 최대 구간 수")
+    parser.add_argument("--repair", action="store_true", help="차이가 확인된 계정 재계산")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 검사")
+    args = parser.parse_args(argv)
+
+    if args.restart:
+        args.checkpoint.unlink(missing_ok=True)
+    elif args.checkpoint.exists():
+        print(f"체크포인트에서 이어서 검사합니다: {args.checkpoint}")
+
+    def report_progress(progress: VerifyProgress) -> None:
+        if progress.chunks % 10 == 0 or progress.done:
+            print(
+                f"  line_id {progress.after_line_id}/{progress.high_water} "
+                f"chunks={progress.chunks} lines={progress.lines}"
+            )
+
+    with SessionLocal() as session:
+        verifier = BalanceVerifier(session, chunk_size=args.chunk_size, checkpoint_path=args.checkpoint)
+        report = verifier.run(repair=args.repair, max_chunks=args.max_chunks, on_chunk=report_progress)
+
+    progress = report.progress
+    print(
+        f"lines={progress.lines} chunks={progress.chunks} elapsed={progress.elapsed:.2f}s "
+        f"({report.lines_per_second:,.0f} lines/s)"
+    )
+    if not report.completed:
+        print(f"중단됨: line_id {progress.after_line_id}/{progress.high_water} - 다시 실행하면 이어서 검사합니다.")
+        return 0
+
+    if not report.drifts:
+        print("모든 계정의 잔액 요약이 분개 라인과 일치합니다.")
+        return 0
+
+    print(f"차이가 있는 계정 {len(report.drifts)}개:")
+    for drift in report.drifts:
+        print(
+            f"  account_id={drift.account_id} "
+            f"expected(debit={drift.expected_debit}, credit={drift.expected_credit}, lines={drift.expected_line_count}) "
+            f"stored(debit={drift.stored_debit}, credit={drift.stored_credit}, "
+            f"balance={drift.stored_balance}, lines={drift.stored_line_count})"
+        )
+    if report.repaired:
+        print("재계산으로 복구했습니다.")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+벤치마크용 합성 장부 데이터 생성기
+
+임시 SQLite 파일에 계정/분개/분개 라인을 Core bulk insert로 채웁니다.
+"""
+from __future__ import annotations
+
+import random
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app import models  # noqa: F401  # 모델 메타데이터 로드용
+from app.core.database import Base
+from app.models.account import Account, AccountType
+from app.models.journal_entry import JournalEntry
+from app.models.journal_line import JournalLine
+from app.repositories.running_balance_repo import RunningBalanceRepository
+
+ACCOUNT_TYPES = list(AccountType)
+
+
+def build_ledger(
+    accounts: int = 3000,
+    entries: int = 50000,
+    start: date = date(2025, 1, 1),
+    days: int = 365,
+    deleted_ratio: float = 0.02,
+    seed: int = 42,
+) -> tuple[Engine, Path]:
+    """
+    합성 장부 DB 생성
+
+    분개마다 차변/대변 2라인을 생성하며, 일부 분개는 soft-delete 상태로 만듭니다.
+
+    Returns:
+        (엔진, DB 파일 경로) - 호출자가 사용 후 파일을 삭제합니다.
+    """
+    rng = random.Random(seed)
+    db_path = Path(tempfile.mkdtemp()) / "bench_ledger.db"
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    Base.metadata.create_all(engine)
+
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Account),
+            [
+                {
+                    "id": index + 1,
+                    "code": f"{index + 1:05d}",
+                    "name": f"계정 {index + 1}",
+                    "type": ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)].value,
+                    "is_active": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for index in range(accounts)
+            ],
+        )
+
+        entry_rows = []
+        line_rows = []
+        for entry_id in range(1, entries + 1):
+            entry_date = start + timedelta(days=rng.randrange(days))
+            entry_rows.append(
+                {
+                    "id": entry_id,
+                    "date": entry_date,
+                    "description": f"합성 분개 {entry_id}",
+                    "is_deleted": rng.random() < deleted_ratio,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            amount = rng.randrange(1, 1000) * 1000
+            debit_account, credit_account = rng.sample(range(1, accounts + 1), 2)
+            line_rows.append(
+                {
+                    "entry_id": entry_id, "account_id": debit_account, "debit": amount, "credit": 0,
+                    "entry_date": entry_date, "created_at": now,
+                }
+            )
+            line_rows.append(
+                {
+                    "entry_id": entry_id, "account_id": credit_account, "debit": 0, "credit": amount,
+                    "entry_date": entry_date, "created_at": now,
+                }
+            )
+
+        conn.execute(insert(JournalEntry), entry_rows)
+        conn.execute(insert(JournalLine), line_rows)
+
+    with Session(engine) as session, session.begin():
+        RunningBalanceRepository(session).resequence()
+
+    return engine, db_path
+
+
+def cleanup(engine: Engine, db_path: Path) -> None:
+    engine.dispose()
+    db_path.unlink(missing_ok=True)
+    db_path.parent.rmdir()
@@ -0,0 +1,76 @@
+"""
+시점 잔액 인덱스 벤치마크 (기초 잔액 SQL 집계 vs Fenwick tree)
+
+실행:
+    python -m benchmarks.bench_balance_index --accounts 300 --entries 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.repositories.account_catalog import account_catalog
+from app.repositories.balance_index import balance_index
+from app.repositories.trial_balance_repo import TrialBalanceRepository
+from benchmarks._ledger_data import build_ledger, cleanup
+from benchmarks.bench_reports import _measure
+
+AS_OF_DATES = (date(2025, 3, 1), date(2025, 10, 1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=300)
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine, db_path = build_ledger(accounts=args.accounts, entries=args.entries)
+    try:
+        with Session(engine) as session:
+            print(f"accounts={args.accounts} entries={args.entries}")
+            account_catalog.invalidate()
+            account_ids = [account.id for account in account_catalog.active_accounts(session)]
+            repo = TrialBalanceRepository(session)
+
+            balance_index.invalidate()
+            started = time.perf_counter()
+            balance_index.rebuild(session)
+            print(f"index build: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+            for as_of in AS_OF_DATES:
+                _measure(
+                    f"scan  opening totals (all accounts, {as_of})",
+                    args.repeat,
+                    lambda: repo._scan_totals_before_period(account_ids, as_of),
+                )
+                _measure(
+                    f"index opening totals (all accounts, {as_of})",
+                    args.repeat,
+                    lambda: balance_index.totals_before(session, account_ids, as_of),
+                )
+                _measure(
+                    f"scan  opening totals (1 account, {as_of})",
+                    args.repeat,
+                    lambda: repo._scan_totals_before_period(account_ids[:1], as_of),
+                )
+                _measure(
+                    f"index opening totals (1 account, {as_of})",
+                    args.repeat,
+                    lambda: balance_index.totals_before(session, account_ids[:1], as_of),
+                )
+                assert balance_index.totals_before(session, account_ids, as_of) == {
+                    acc_id: totals
+                    for acc_id, totals in repo._scan_totals_before_period(account_ids, as_of).items()
+                    if any(totals)
+                }, "index results differ"
+    finally:
+        balance_index.invalidate()
+        cleanup(engine, db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+계정 잔액 병렬 전체 재구성 벤치마크
+
+단일 문장 재계산(AccountBalanceService)과 워커 프로세스 병렬 재구성(BalanceRebuilder)을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_balance_rebuild --accounts 3000 --entries 200000 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+from app.services.account_balance_service import AccountBalanceService
+from app.services.balance_rebuilder import BalanceRebuilder
+from benchmarks._ledger_data import build_ledger, cleanup
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=3000)
+    parser.add_argument("--entries", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    engine, db_path = build_ledger(accounts=args.accounts, entries=args.entries)
+    try:
+        with Session(engine) as session:
+            started = time.perf_counter()
+            AccountBalanceService(session).recalculate_balances(None)
+            session.commit()
+            single = time.perf_counter() - started
+
+        with Session(engine) as session:
+            report = BalanceRebuilder(session, workers=args.workers).run()
+
+        print(f"accounts={args.accounts} entries={args.entries} lines={report.lines}")
+        print(f"single statement : {single * 1000:.1f}ms ({report.lines / single:,.0f} lines/s)")
+        print(
+            f"parallel rebuild : {report.elapsed * 1000:.1f}ms ({report.lines_per_second:,.0f} lines/s, "
+            f"workers={report.workers} partitions={report.partitions} "
+            f"scan={report.scan_seconds * 1000:.1f}ms write={report.write_seconds * 1000:.1f}ms)"
+        )
+    finally:
+        cleanup(engine, db_path)
+
+
+if __name__ == "__main__":
+    main()
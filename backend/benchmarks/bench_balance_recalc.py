@@ -0,0 +1,50 @@
+"""
+계정 잔액 전체 재계산 벤치마크
+
+실행:
+    python -m benchmarks.bench_balance_recalc --accounts 3000 --entries 50000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+from app.models.account_balance import AccountBalance
+from app.services.account_balance_service import AccountBalanceService
+from benchmarks._ledger_data import build_ledger, cleanup
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=3000)
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine, db_path = build_ledger(accounts=args.accounts, entries=args.entries)
+    try:
+        timings = []
+        for _ in range(args.repeat):
+            with Session(engine) as session:
+                started = time.perf_counter()
+                AccountBalanceService(session).recalculate_balances(None)
+                session.commit()
+                timings.append(time.perf_counter() - started)
+
+        with Session(engine) as session:
+            rows = session.query(AccountBalance).count()
+
+        timings.sort()
+        print(f"accounts={args.accounts} entries={args.entries} balance_rows={rows}")
+        print(
+            f"full recalculation: best={timings[0] * 1000:.1f}ms "
+            f"median={timings[len(timings) // 2] * 1000:.1f}ms"
+        )
+    finally:
+        cleanup(engine, db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+동시 분개 생성 처리량 벤치마크 (요청별 커밋 vs 그룹 커밋)
+
+실행:
+    python -m benchmarks.bench_group_commit --accounts 500 --postings 2000 --threads 16
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.account import Account
+from app.schemas.journal_schema import JournalEntryCreate, JournalLineCreate
+from app.services.journal_group_commit import JournalGroupCommitter
+from app.services.journal_service import JournalService
+from benchmarks._ledger_data import build_ledger, cleanup
+
+
+def _payloads(account_ids: list[int], count: int, seed: int = 7) -> list[JournalEntryCreate]:
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(count):
+        debit_id, credit_id = rng.sample(account_ids, 2)
+        amount = Decimal(rng.randint(1, 1_000_000))
+        payloads.append(
+            JournalEntryCreate(
+                date=date(2025, 12, 31),
+                description="bench",
+                lines=[
+                    JournalLineCreate(account_id=debit_id, debit=amount, credit=Decimal("0")),
+                    JournalLineCreate(account_id=credit_id, debit=Decimal("0"), credit=amount),
+                ],
+            )
+        )
+    return payloads
+
+
+def _run_direct(factory: sessionmaker, payloads: list[JournalEntryCreate], threads: int) -> float:
+    def post(payload: JournalEntryCreate) -> None:
+        while True:
+            with factory() as session:
+                try:
+                    JournalService(session).create_entry(payload)
+                    return
+                except Exception as exc:  # noqa: BLE001 - database is locked 재시도
+                    if "locked" not in str(exc):
+                        raise
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(post, payloads))
+    return time.perf_counter() - started
+
+
+def _run_group(factory: sessionmaker, payloads: list[JournalEntryCreate], threads: int) -> float:
+    committer = JournalGroupCommitter(session_factory=factory)
+    committer.start()
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda payload: committer.submit(payload).result(), payloads))
+        return time.perf_counter() - started
+    finally:
+        committer.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=500)
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--postings", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    engine, db_path = build_ledger(accounts=args.accounts, entries=args.entries)
+    try:
+        factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        with Session(engine) as session:
+            account_ids = [row.id for row in session.query(Account.id).all()]
+        payloads = _payloads(account_ids, args.postings)
+
+        direct = _run_direct(factory, payloads, args.threads)
+        group = _run_group(factory, payloads, args.threads)
+
+        print(f"postings={args.postings} threads={args.threads}")
+        print(f"direct: {direct * 1000:.0f}ms ({args.postings / direct:.0f} postings/s)")
+        print(f"group : {group * 1000:.0f}ms ({args.postings / group:.0f} postings/s)")
+    finally:
+        cleanup(engine, db_path)
+
+
+if __name__ == "__main__":
+    main()
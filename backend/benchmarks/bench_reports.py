@@ -0,0 +1,85 @@
+"""
+시산표 / 일반원장 조회 지연 시간 벤치마크
+
+실행:
+    python -m benchmarks.bench_reports --accounts 300 --entries 100000
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from datetime import date
+from typing import Callable
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.journal_line import JournalLine
+from app.services.general_ledger_service import GeneralLedgerService
+from app.services.trial_balance_service import TrialBalanceService
+from benchmarks._ledger_data import build_ledger, cleanup
+
+
+def _measure(label: str, repeat: int, run: Callable[[], object]) -> None:
+    run()  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"{label:<28} best={min(timings):8.1f}ms median={statistics.median(timings):8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=300)
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine, db_path = build_ledger(accounts=args.accounts, entries=args.entries)
+    try:
+        with Session(engine) as session:
+            busiest_account_id = (
+                session.query(JournalLine.account_id)
+                .group_by(JournalLine.account_id)
+                .order_by(func.count(JournalLine.id).desc())
+                .limit(1)
+                .scalar()
+            )
+            print(f"accounts={args.accounts} entries={args.entries} ledger_account={busiest_account_id}")
+
+            trial_balance = TrialBalanceService(session)
+            general_ledger = GeneralLedgerService(session)
+
+            _measure(
+                "trial balance (Q3)",
+                args.repeat,
+                lambda: trial_balance.get_trial_balance(date(2025, 7, 1), date(2025, 9, 30)),
+            )
+            _measure(
+                "trial balance (full year)",
+                args.repeat,
+                lambda: trial_balance.get_trial_balance(date(2025, 1, 1), date(2025, 12, 31)),
+            )
+            _measure(
+                "general ledger (full year)",
+                args.repeat,
+                lambda: general_ledger.get_general_ledger(
+                    busiest_account_id, date(2025, 1, 1), date(2025, 12, 31)
+                ),
+            )
+            _measure(
+                "general ledger (December)",
+                args.repeat,
+                lambda: general_ledger.get_general_ledger(
+                    busiest_account_id, date(2025, 12, 1), date(2025, 12, 31)
+                ),
+            )
+    finally:
+        cleanup(engine, db_path)
+
+
+if __name__ == "__main__":
+    main()
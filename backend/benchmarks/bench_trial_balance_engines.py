@@ -0,0 +1,91 @@
+"""
+시산표 집계 엔진 비교 벤치마크 (SQL vs NumPy 인메모리 열 엔진)
+
+실행:
+    python -m benchmarks.bench_trial_balance_engines --accounts 300 --entries 100000
+
+numpy가 설치되어 있어야 합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.repositories.account_catalog import account_catalog
+from app.repositories.ledger_columns import ledger_columns, numpy_available
+from app.schemas.journal_schema import JournalEntryCreate, JournalLineCreate
+from app.services.journal_service import JournalService
+from app.services.trial_balance_service import TrialBalanceService
+from benchmarks._ledger_data import build_ledger, cleanup
+from benchmarks.bench_reports import _measure
+
+PERIODS = {
+    "Q3": (date(2025, 7, 1), date(2025, 9, 30)),
+    "full year": (date(2025, 1, 1), date(2025, 12, 31)),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=300)
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not numpy_available():
+        raise SystemExit("numpy가 설치되어 있지 않습니다.")
+
+    settings = get_settings()
+    # 기초/기간 합계도 각 엔진으로 계산하도록 잔액 인덱스는 끔
+    settings.balance_index_enabled = False
+    engine, db_path = build_ledger(accounts=args.accounts, entries=args.entries)
+    try:
+        with Session(engine) as session:
+            print(f"accounts={args.accounts} entries={args.entries}")
+            account_catalog.invalidate()
+
+            settings.trial_balance_engine = "sql"
+            sql_results = {}
+            for label, period in PERIODS.items():
+                service = TrialBalanceService(session)
+                _measure(f"sql   trial balance ({label})", args.repeat, lambda: service.get_trial_balance(*period))
+                sql_results[label] = service.get_trial_balance(*period)
+
+            settings.trial_balance_engine = "numpy"
+            ledger_columns.invalidate()
+            started = time.perf_counter()
+            ledger_columns.refresh(session)
+            print(f"numpy initial load: {(time.perf_counter() - started) * 1000:.1f}ms")
+            for label, period in PERIODS.items():
+                service = TrialBalanceService(session)
+                _measure(f"numpy trial balance ({label})", args.repeat, lambda: service.get_trial_balance(*period))
+                assert service.get_trial_balance(*period) == sql_results[label], "engine results differ"
+
+            # 분개 1건 추가 후 증분 갱신 비용
+            account_ids = [account.id for account in account_catalog.active_accounts(session)[:2]]
+            JournalService(session).create_entry(
+                JournalEntryCreate(
+                    date=date(2025, 12, 31),
+                    description="bench",
+                    lines=[
+                        JournalLineCreate(account_id=account_ids[0], debit=1, credit=0),
+                        JournalLineCreate(account_id=account_ids[1], debit=0, credit=1),
+                    ],
+                )
+            )
+            started = time.perf_counter()
+            ledger_columns.refresh(session)
+            print(f"numpy incremental refresh (1 entry): {(time.perf_counter() - started) * 1000:.1f}ms")
+    finally:
+        settings.trial_balance_engine = "sql"
+        settings.balance_index_enabled = True
+        ledger_columns.invalidate()
+        cleanup(engine, db_path)
+
+
+if __name__ == "__main__":
+    main()
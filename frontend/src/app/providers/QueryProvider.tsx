@@ -2,6 +2,7 @@ import { MutationCache, QueryCache, QueryClient, QueryClientProvider } from "@ta
 import { ReactQueryDevtools } from "@tanstack/react-query-devtools";
 import type { PropsWithChildren } from "react";
 
+import { useLedgerEvents } from "../../features/ledgerEvents/hooks/useLedgerEvents";
 import { toastService } from "../../shared/components/toast/toastService";
 import { describeApiError } from "../../shared/utils/formatApiError";
 
@@ -30,8 +31,15 @@ const queryClient = new QueryClient({
   },
 });
 
+// 서버 변경 이벤트로 캐시를 무효화 (QueryClientProvider 안에서 구독)
+const LedgerEventsSubscriber = () => {
+  useLedgerEvents();
+  return null;
+};
+
 export const QueryProvider = ({ children }: PropsWithChildren) => (
   <QueryClientProvider client={queryClient}>
+    <LedgerEventsSubscriber />
     {children}
     <ReactQueryDevtools initialIsOpen={false} />
   </QueryClientProvider>
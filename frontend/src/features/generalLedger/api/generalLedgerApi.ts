@@ -6,6 +6,8 @@ export type GeneralLedgerParams = {
   from: string;
   to: string;
   search?: string;
+  limit?: number;
+  cursor?: string;
 };
 
 export const getGeneralLedger = async (params: GeneralLedgerParams): Promise<GeneralLedgerResponse> => {
@@ -18,7 +20,12 @@ export const getGeneralLedger = async (params: GeneralLedgerParams): Promise<Gen
   if (params.search) {
     searchParams.append("search", params.search);
   }
+  if (params.limit) {
+    searchParams.append("limit", params.limit.toString());
+  }
+  if (params.cursor) {
+    searchParams.append("cursor", params.cursor);
+  }
 
   return apiClient.get<GeneralLedgerResponse>(`/v1/general-ledger?${searchParams.toString()}`);
 };
-
@@ -1,13 +1,25 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery, type InfiniteData } from "@tanstack/react-query";
 
 import { getGeneralLedger, type GeneralLedgerParams } from "../api/generalLedgerApi";
 import type { GeneralLedgerResponse } from "../../../types/api";
 
-export const useGeneralLedger = (params: GeneralLedgerParams) => {
+// 원장 한 페이지 행 수 (서버가 페이지마다 직전 누적 잔액과 다음 커서를 내려줌)
+export const GENERAL_LEDGER_PAGE_SIZE = 100;
+
+export const useGeneralLedger = (params: Omit<GeneralLedgerParams, "limit" | "cursor">) => {
   const enabled = Boolean(params.account_id && params.from && params.to);
-  return useQuery<GeneralLedgerResponse, Error>({
+  return useInfiniteQuery<
+    GeneralLedgerResponse,
+    Error,
+    InfiniteData<GeneralLedgerResponse, string | undefined>,
+    (string | number | undefined)[],
+    string | undefined
+  >({
     queryKey: ["general-ledger", params.account_id, params.from, params.to, params.search],
     enabled,
-    queryFn: () => getGeneralLedger(params),
+    initialPageParam: undefined,
+    queryFn: ({ pageParam }) =>
+      getGeneralLedger({ ...params, limit: GENERAL_LEDGER_PAGE_SIZE, cursor: pageParam }),
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
   });
 };
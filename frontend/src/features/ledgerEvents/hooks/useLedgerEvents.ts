@@ -0,0 +1,33 @@
+import { useQueryClient } from "@tanstack/react-query";
+import { useEffect } from "react";
+
+import { subscribeLedgerEvents } from "../../../shared/api";
+
+// 원장 변경 이벤트를 받아 영향받는 조회만 무효화 (주기적 재조회 대신)
+export const useLedgerEvents = () => {
+  const queryClient = useQueryClient();
+
+  useEffect(
+    () =>
+      subscribeLedgerEvents({
+        onJournalEntryChanged: ({ account_ids }) => {
+          queryClient.invalidateQueries({ queryKey: ["journal-entries"] });
+          queryClient.invalidateQueries({ queryKey: ["dashboard-data"] });
+          queryClient.invalidateQueries({ queryKey: ["trial-balance"] });
+          // 원장은 변경된 계정만 (queryKey: ["general-ledger", account_id, ...])
+          queryClient.invalidateQueries({
+            queryKey: ["general-ledger"],
+            predicate: (query) => account_ids.includes(query.queryKey[1] as number),
+          });
+        },
+        onAccountChanged: () => {
+          queryClient.invalidateQueries({ queryKey: ["accounts"] });
+          queryClient.invalidateQueries({ queryKey: ["trial-balance"] });
+        },
+        onResync: () => {
+          queryClient.invalidateQueries();
+        },
+      }),
+    [queryClient],
+  );
+};
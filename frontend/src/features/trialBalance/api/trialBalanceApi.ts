@@ -1,11 +1,12 @@
-import { getTrialBalance } from "../../../shared/api/trial-balance";
-import type { TrialBalanceLine } from "../types/domain";
+import {
+  getTrialBalance,
+  getTrialBalanceRecent,
+  type GetTrialBalanceParams,
+} from "../../../shared/api/trial-balance";
+import type { RecentEntry, TrialBalanceLine } from "../types/domain";
 import type { TrialBalanceResponseDto } from "../types/dto";
 
-export type TrialBalanceParams = {
-  from: string;
-  to: string;
-};
+export type TrialBalanceParams = GetTrialBalanceParams;
 
 const toNumber = (value: string | number) => Number(value);
 
@@ -16,6 +17,15 @@ const toBalanceAmount = (
   direction: balance.direction,
 });
 
+const mapRecentEntry = (
+  entry: TrialBalanceResponseDto["rows"][number]["recent_entries"][number]
+): RecentEntry => ({
+  date: entry.date,
+  description: entry.description,
+  debit: toNumber(entry.debit),
+  credit: toNumber(entry.credit),
+});
+
 const mapLine = (row: TrialBalanceResponseDto["rows"][number]): TrialBalanceLine => ({
   accountId: row.account_id,
   accountCode: row.account_code,
@@ -30,12 +40,7 @@ const mapLine = (row: TrialBalanceResponseDto["rows"][number]): TrialBalanceLine
   },
   endingBalance: toBalanceAmount(row.ending_balance),
   transactionCount: row.transaction_count,
-  recentEntries: row.recent_entries.map((entry) => ({
-    date: entry.date,
-    description: entry.description,
-    debit: toNumber(entry.debit),
-    credit: toNumber(entry.credit),
-  })),
+  recentEntries: row.recent_entries.map(mapRecentEntry),
 });
 
 export const trialBalanceApi = {
@@ -59,4 +64,9 @@ export const trialBalanceApi = {
       },
     };
   },
+
+  async fetchRecent(accountId: number, params: TrialBalanceParams): Promise<RecentEntry[]> {
+    const response = await getTrialBalanceRecent(accountId, { from: params.from, to: params.to });
+    return response.entries.map(mapRecentEntry);
+  },
 };
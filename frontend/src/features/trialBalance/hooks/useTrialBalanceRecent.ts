@@ -0,0 +1,19 @@
+import { useQuery } from "@tanstack/react-query";
+
+import { trialBalanceApi, type TrialBalanceParams } from "../api/trialBalanceApi";
+import type { RecentEntry } from "../types/domain";
+
+// 시산표 행을 펼쳤을 때만 해당 계정의 최근 거래를 조회
+export const useTrialBalanceRecent = (accountId: number, params?: TrialBalanceParams) => {
+  const enabled = Boolean(accountId && params?.from && params?.to);
+  const query = useQuery({
+    queryKey: ["trial-balance", "recent", accountId, params?.from, params?.to],
+    enabled,
+    queryFn: () => trialBalanceApi.fetchRecent(accountId, params!),
+  });
+
+  return {
+    data: query.data ?? ([] as RecentEntry[]),
+    loading: query.isLoading,
+  };
+};
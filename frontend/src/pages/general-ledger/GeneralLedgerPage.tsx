@@ -6,7 +6,6 @@ import DatePicker from "../../shared/components/DatePicker";
 import { Card, SectionHeader } from "../../shared/components/ui";
 import { formatCurrency } from "../../shared/utils";
 import { getCurrentMonthPeriod } from "../../shared/utils/formatDate";
-import type { GeneralLedgerEntry } from "../../types/api";
 
 const GeneralLedgerPage = () => {
   const { data: accounts = [] } = useAccounts();
@@ -58,42 +57,44 @@ const GeneralLedgerPage = () => {
     searchTerm,
   ]);
 
-  const { data, isLoading, error } = useGeneralLedger({
+  const {
+    data,
+    isLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useGeneralLedger({
     account_id: appliedFilters.accountId,
     from: appliedFilters.from,
     to: appliedFilters.to,
     search: appliedFilters.searchTerm ? appliedFilters.searchTerm : undefined,
   });
 
-  const entries = data?.entries ?? [];
-  const openingBalance = data?.opening_balance ?? null;
-  const closingBalance = data?.closing_balance ?? null;
-  const selectedAccountLabel = data?.account_name ?? "-";
+  // 기초/기말 잔액과 합계는 페이지와 무관한 기간 전체 값, 행 잔액은 서버 러닝 잔액
+  const firstPage = data?.pages[0];
+  const entries = data?.pages.flatMap((page) => page.entries) ?? [];
+  const openingBalance = firstPage?.opening_balance ?? null;
+  const closingBalance = firstPage?.closing_balance ?? null;
+  const selectedAccountLabel = firstPage?.account_name ?? "-";
 
-  const totalDebit = entries.reduce(
-    (sum, entry) => sum + Number(entry.debit),
-    0
-  );
-  const totalCredit = entries.reduce(
-    (sum, entry) => sum + Number(entry.credit),
-    0
-  );
-  const initialBalance = Number(openingBalance?.amount ?? 0);
-  const entriesWithBalance = entries.reduce<
-    (GeneralLedgerEntry & { runningBalance: number })[]
-  >((acc, entry) => {
-    const previousBalance =
-      acc.length > 0 ? acc[acc.length - 1].runningBalance : initialBalance;
-    const debitAmount = Number(entry.debit);
-    const creditAmount = Number(entry.credit);
-    const runningBalance = previousBalance + debitAmount - creditAmount;
-    acc.push({ ...entry, runningBalance });
-    return acc;
-  }, []);
-  const lastRunningBalance =
-    entriesWithBalance.length > 0
-      ? entriesWithBalance[entriesWithBalance.length - 1].runningBalance
-      : initialBalance;
+  const totalDebit = Number(firstPage?.current.debit ?? 0);
+  const totalCredit = Number(firstPage?.current.credit ?? 0);
+  const closingAmount = Number(closingBalance?.amount ?? 0);
+
+  // 목록 끝이 보이면 다음 페이지 조회
+  const loadMoreRef = useRef<HTMLDivElement | null>(null);
+  useEffect(() => {
+    const target = loadMoreRef.current;
+    if (!target || !hasNextPage) return;
+    const observer = new IntersectionObserver((observed) => {
+      if (observed[0]?.isIntersecting && !isFetchingNextPage) {
+        void fetchNextPage();
+      }
+    });
+    observer.observe(target);
+    return () => observer.disconnect();
+  }, [fetchNextPage, hasNextPage, isFetchingNextPage]);
 
   const formatEntryDate = (value: string) => {
     if (!value) return "-";
@@ -263,9 +264,9 @@ const GeneralLedgerPage = () => {
                   </td>
                 </tr>
               ) : (
-                entriesWithBalance.map((entry) => (
+                entries.map((entry, index) => (
                   <tr
-                    key={`${entry.entry_id}-${entry.date}`}
+                    key={`${entry.entry_id}-${index}`}
                     className="border-t border-slate-100"
                   >
                     <td className="px-4 py-3 text-slate-700">
@@ -288,7 +289,7 @@ const GeneralLedgerPage = () => {
                       })}
                     </td>
                     <td className="px-4 py-3 text-slate-900 font-semibold">
-                      {formatCurrency(entry.runningBalance, "KRW", {
+                      {formatCurrency(Number(entry.balance), "KRW", {
                         zeroDisplay: "-",
                       })}
                     </td>
@@ -296,7 +297,7 @@ const GeneralLedgerPage = () => {
                 ))
               )}
             </tbody>
-            {entriesWithBalance.length > 0 && (
+            {entries.length > 0 && (
               <tfoot>
                 <tr className="border-t border-slate-100 text-xs uppercase tracking-widest text-slate-400">
                   <td
@@ -312,7 +313,7 @@ const GeneralLedgerPage = () => {
                     {formatCurrency(totalCredit, "KRW", { zeroDisplay: "-" })}
                   </td>
                   <td className="px-4 py-3 text-slate-900 font-semibold">
-                    {formatCurrency(lastRunningBalance, "KRW", {
+                    {formatCurrency(closingAmount, "KRW", {
                       zeroDisplay: "-",
                     })}
                   </td>
@@ -321,6 +322,18 @@ const GeneralLedgerPage = () => {
             )}
           </table>
         </div>
+        {hasNextPage && (
+          <div ref={loadMoreRef} className="mt-4 flex justify-center">
+            <button
+              type="button"
+              className="rounded-full border border-slate-200 px-6 py-2 text-sm font-semibold text-slate-600 transition hover:bg-slate-50 disabled:opacity-50"
+              onClick={() => void fetchNextPage()}
+              disabled={isFetchingNextPage}
+            >
+              {isFetchingNextPage ? "불러오는 중..." : "더 보기"}
+            </button>
+          </div>
+        )}
         {error && (
           <p className="mt-4 text-sm text-rose-600">
             원장 데이터를 불러오지 못했습니다. 잠시 후 다시 시도해주세요.
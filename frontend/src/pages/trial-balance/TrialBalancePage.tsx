@@ -223,7 +223,9 @@ const TrialBalancePage = () => {
                   prev === line.accountId ? null : line.accountId
                 )
               }
-              renderDetail={(line) => <TrialBalanceDetailRow line={line} />}
+              renderDetail={(line) => (
+                <TrialBalanceDetailRow line={line} period={params} />
+              )}
             />
           )}
         </div>
@@ -1,8 +1,11 @@
+import type { TrialBalanceParams } from "../../../features/trialBalance/api/trialBalanceApi";
+import { useTrialBalanceRecent } from "../../../features/trialBalance/hooks/useTrialBalanceRecent";
 import type { TrialBalanceLine } from "../../../features/trialBalance/types/domain";
 import { formatCurrency } from "../../../shared/utils";
 
 type Props = {
   line: TrialBalanceLine;
+  period?: TrialBalanceParams;
 };
 
 const directionLabel = (direction: TrialBalanceLine["endingBalance"]["direction"]) =>
@@ -24,7 +27,8 @@ const NORMAL_DIRECTION: Record<string, "DEBIT" | "CREDIT"> = {
   REVENUE: "CREDIT",
 };
 
-const TrialBalanceDetailRow = ({ line }: Props) => {
+const TrialBalanceDetailRow = ({ line, period }: Props) => {
+  const { data: recentEntries } = useTrialBalanceRecent(line.accountId, period);
   const isImbalanced = line.totalDebit !== line.totalCredit;
   const normalDirection = NORMAL_DIRECTION[line.type];
   const isAbnormalBalance = normalDirection && line.endingBalance.direction !== normalDirection;
@@ -100,11 +104,11 @@ const TrialBalanceDetailRow = ({ line }: Props) => {
           </div>
 
           {/* 최근 거래 내역 */}
-          {line.recentEntries.length > 0 && (
+          {recentEntries.length > 0 && (
             <div>
               <h4 className="text-sm font-semibold text-slate-700 mb-3">최근 거래 내역</h4>
               <div className="space-y-2">
-                {line.recentEntries.map((entry, index) => (
+                {recentEntries.map((entry, index) => (
                   <div
                     key={index}
                     className="rounded-lg bg-white border border-slate-200 p-3 shadow-sm hover:shadow-md transition-shadow"
@@ -25,12 +25,18 @@ export const useTrialBalanceFilters = (options?: Options) => {
 
   const onSelectionReset = options?.onSelectionReset;
 
+  // 계정 타입과 0 잔액 숨김은 서버에서 걸러 집계 대상과 응답을 줄임
   const params = useMemo(() => {
     if (!filters.from || !filters.to) {
       return undefined;
     }
-    return { from: filters.from, to: filters.to };
-  }, [filters]);
+    return {
+      from: filters.from,
+      to: filters.to,
+      type: accountTypeFilter !== "ALL" ? accountTypeFilter : undefined,
+      hide_zero: !showZeroBalance,
+    };
+  }, [filters, accountTypeFilter, showZeroBalance]);
 
   const applyFilters = useCallback(() => {
     setFilters(formFilters);
@@ -36,7 +36,7 @@ const API_BASE_URL = (import.meta.env.VITE_API_URL as string | undefined) ?? "ht
 /**
  * API 경로를 완전한 URL로 변환
  */
-const buildUrl = (path: string): string => {
+export const buildUrl = (path: string): string => {
   if (path.startsWith("http://") || path.startsWith("https://")) {
     return path;
   }
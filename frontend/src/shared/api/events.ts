@@ -0,0 +1,39 @@
+/**
+ * 원장 변경 이벤트 API
+ *
+ * /v1/events SSE 스트림을 구독합니다. 연결이 끊기면 브라우저가 Last-Event-ID와 함께 재연결하고,
+ * 서버는 그 사이의 변경을 변경 로그에서 다시 보내 줍니다.
+ */
+
+import { buildUrl } from "./client";
+import type { AccountChangedEvent, JournalEntryChangedEvent } from "../../types/api";
+
+export interface LedgerEventHandlers {
+  onJournalEntryChanged?: (event: JournalEntryChangedEvent) => void;
+  onAccountChanged?: (event: AccountChangedEvent) => void;
+  // 이벤트가 유실됨 - 전체를 다시 조회해야 함
+  onResync?: () => void;
+}
+
+const JOURNAL_EVENTS = ["journal_entry.created", "journal_entry.updated", "journal_entry.deleted"];
+const ACCOUNT_EVENTS = ["account.created", "account.updated"];
+
+/**
+ * 원장 변경 이벤트 구독
+ *
+ * @returns 구독 해제 함수
+ */
+export const subscribeLedgerEvents = (handlers: LedgerEventHandlers): (() => void) => {
+  const source = new EventSource(buildUrl("/v1/events"));
+
+  const listen = <T>(types: string[], handler?: (event: T) => void) => {
+    types.forEach((type) =>
+      source.addEventListener(type, (message) => handler?.(JSON.parse((message as MessageEvent).data) as T)),
+    );
+  };
+  listen(JOURNAL_EVENTS, handlers.onJournalEntryChanged);
+  listen(ACCOUNT_EVENTS, handlers.onAccountChanged);
+  source.addEventListener("resync", () => handlers.onResync?.());
+
+  return () => source.close();
+};
@@ -5,7 +5,7 @@
  */
 
 // API Client
-export { apiClient, ApiError } from "./client";
+export { apiClient, ApiError, buildUrl } from "./client";
 
 // 계정과목 API
 export {
@@ -28,5 +28,8 @@ export {
 export type { ListJournalEntriesParams } from "./journals";
 
 // 시산표 API
-export { getTrialBalance } from "./trial-balance";
-export type { GetTrialBalanceParams } from "./trial-balance";
+export { getTrialBalance, getTrialBalanceRecent } from "./trial-balance";
+export type { GetTrialBalanceParams, GetTrialBalanceRecentParams } from "./trial-balance";
+
+// 원장 변경 이벤트 (SSE)
+export { subscribeLedgerEvents } from "./events";
@@ -5,11 +5,16 @@
  */
 
 import { apiClient } from "./client";
-import type { TrialBalanceResponse } from "../../types/api";
+import type { TrialBalanceRecentResponse, TrialBalanceResponse } from "../../types/api";
 
 export interface GetTrialBalanceParams {
   from: string; // YYYY-MM-DD (필수)
   to: string; // YYYY-MM-DD (필수)
+  type?: string; // 계정 타입 (ASSET, LIABILITY, EQUITY, REVENUE, EXPENSE)
+  code_from?: string; // 시작 계정 코드 (포함)
+  code_to?: string; // 종료 계정 코드 (포함)
+  account_ids?: number[]; // 계정 ID 목록
+  hide_zero?: boolean; // 기말 잔액 0인 행 제외
 }
 
 /**
@@ -23,6 +28,38 @@ export const getTrialBalance = async (params: GetTrialBalanceParams): Promise<Tr
     from: params.from,
     to: params.to,
   });
+  if (params.type) searchParams.append("type", params.type);
+  if (params.code_from) searchParams.append("code_from", params.code_from);
+  if (params.code_to) searchParams.append("code_to", params.code_to);
+  params.account_ids?.forEach((id) => searchParams.append("account_ids", id.toString()));
+  if (params.hide_zero) searchParams.append("hide_zero", "true");
 
   return apiClient.get<TrialBalanceResponse>(`/v1/trial-balance?${searchParams.toString()}`);
 };
+
+export interface GetTrialBalanceRecentParams {
+  from?: string; // YYYY-MM-DD
+  to?: string; // YYYY-MM-DD
+  limit?: number; // 기본 5
+}
+
+/**
+ * 계정별 최근 거래 조회 (시산표 행 펼침 시 지연 조회)
+ *
+ * @param accountId - 계정 ID
+ * @param params - 조회 기간과 최대 건수
+ * @returns 최근 거래 (최신순)
+ */
+export const getTrialBalanceRecent = async (
+  accountId: number,
+  params: GetTrialBalanceRecentParams = {}
+): Promise<TrialBalanceRecentResponse> => {
+  const searchParams = new URLSearchParams();
+  if (params.from) searchParams.append("from", params.from);
+  if (params.to) searchParams.append("to", params.to);
+  if (params.limit) searchParams.append("limit", params.limit.toString());
+
+  return apiClient.get<TrialBalanceRecentResponse>(
+    `/v1/trial-balance/${accountId}/recent?${searchParams.toString()}`
+  );
+};
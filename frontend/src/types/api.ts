@@ -18,6 +18,12 @@ export interface AccountBalanceSummary {
   updated_at: string;
 }
 
+export interface AccountUsageSummary {
+  line_count: number;
+  first_posted_on: string | null;
+  last_posted_on: string | null;
+}
+
 export interface Account {
   id: number;
   code: string;
@@ -25,6 +31,7 @@ export interface Account {
   type: AccountType;
   description?: string | null;
   balance_summary?: AccountBalanceSummary | null;
+  usage?: AccountUsageSummary | null;
   is_active: boolean;
   parent_id: number | null;
   created_at: string;
@@ -155,6 +162,12 @@ export interface TrialBalanceResponse {
   period: TrialBalancePeriod;
   rows: TrialBalanceRow[];
   total: TrialBalanceTotal;
+  ledger_version: number; // 집계에 사용한 원장 버전
+}
+
+export interface TrialBalanceRecentResponse {
+  account_id: number;
+  entries: RecentEntry[];
 }
 
 export interface GeneralLedgerEntry {
@@ -175,6 +188,26 @@ export interface GeneralLedgerResponse {
   current: CurrentPeriod;
   closing_balance: BalanceAmount;
   entries: GeneralLedgerEntry[];
+  page_opening_balance: BalanceAmount | null; // limit 지정 시 페이지 첫 행 직전 잔액
+  next_cursor: string | null; // 다음 페이지 커서 (마지막 페이지면 null)
+  ledger_version: number; // 조회에 사용한 원장 버전
+}
+
+// ============================================
+// 원장 변경 이벤트 (SSE) 타입
+// ============================================
+
+export interface JournalEntryChangedEvent {
+  entry_id: number;
+  account_ids: number[];
+  dates: string[]; // YYYY-MM-DD (수정 전후 거래일 포함)
+  ledger_version: number;
+}
+
+export interface AccountChangedEvent {
+  account_id: number;
+  code: string;
+  is_active: boolean;
 }
 
 // ============================================
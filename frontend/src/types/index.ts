@@ -24,6 +24,7 @@ export type {
   TrialBalancePeriod,
   TrialBalanceTotal,
   TrialBalanceResponse,
+  TrialBalanceRecentResponse,
 
   // 에러
   ErrorDetail,